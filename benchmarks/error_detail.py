@@ -0,0 +1,47 @@
+"""Benchmark the memory used to serve a large error log with ErrorDetail against reading it into memory.
+
+Run with ``python benchmarks/error_detail.py``.
+"""
+import os
+import tempfile
+import time
+import tracemalloc
+
+from vo_models.uws.error import ErrorDetail
+
+
+def _measured(label: str, func) -> None:
+    tracemalloc.start()
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    print(f"{label:>14}: {elapsed:.2f} s, peak {peak / 1e6:.1f} MB")
+
+
+def main(size_mb: int = 200) -> None:
+    """Print the time and peak memory to write out an error log of ``size_mb`` megabytes."""
+    line = b"2024-01-01T00:00:00Z ERROR worker: query failed at row 123456789 of table ivoa.obscore\n"
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "error.log")
+        with open(path, "wb") as file:
+            for _ in range(size_mb * 1_000_000 // len(line)):
+                file.write(line)
+
+        def read_whole():
+            with open(path, "rb") as file, open(os.devnull, "wb") as out:
+                out.write(file.read())
+
+        def stream():
+            with open(os.devnull, "wb") as out:
+                for chunk in ErrorDetail.from_file(path).chunks():
+                    out.write(chunk)
+
+        print(f"{size_mb} MB error log")
+        _measured("read whole", read_whole)
+        _measured("ErrorDetail", stream)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""Benchmark the execution watchdog against one asyncio timer per executing job.
+
+Run with ``python benchmarks/execution_watchdog.py``.
+"""
+import asyncio
+import time
+import tracemalloc
+from datetime import datetime, timedelta, timezone
+
+from vo_models.uws import JobSummary
+from vo_models.uws.types import ExecutionPhase
+from vo_models.uws.watchdog import ExecutionWatchdog
+
+START = datetime(2020, 1, 1, tzinfo=timezone.utc)
+
+
+class _Clock:
+    def __init__(self):
+        self.now = START
+
+    def __call__(self):
+        return self.now
+
+
+def _jobs(count: int) -> list[JobSummary]:
+    return [
+        JobSummary(
+            job_id=f"job{i}",
+            phase=ExecutionPhase.EXECUTING,
+            start_time=START,
+            execution_duration=60 + i % 3600,
+        )
+        for i in range(count)
+    ]
+
+
+def _measured(label: str, func, traced: bool) -> None:
+    # Tracing allocations slows the code down, so time and memory are measured in separate runs
+    if traced:
+        tracemalloc.start()
+        func()
+        print(f"{label:>28}: {tracemalloc.get_traced_memory()[0] / 1e6:.1f} MB")
+        tracemalloc.stop()
+    else:
+        start = time.perf_counter()
+        func()
+        print(f"{label:>28}: {time.perf_counter() - start:.3f} s")
+
+
+async def _timers(jobs: list[JobSummary], traced: bool) -> None:
+    loop = asyncio.get_running_loop()
+    handles = {}
+
+    def schedule():
+        for job in jobs:
+            handles[job.job_id] = loop.call_later(job.execution_duration, job.model_copy)
+
+    def reschedule():
+        for job in jobs:
+            handles.pop(job.job_id).cancel()
+            handles[job.job_id] = loop.call_later(job.execution_duration + 60, job.model_copy)
+
+    _measured("per-job timers: schedule", schedule, traced)
+    _measured("per-job timers: reschedule", reschedule, traced)
+    for handle in handles.values():
+        handle.cancel()
+
+
+async def _watchdog(jobs: list[JobSummary], traced: bool) -> None:
+    clock = _Clock()
+    aborted = []
+    watchdog = ExecutionWatchdog(aborted.append, clock=clock)
+
+    def schedule():
+        for job in jobs:
+            watchdog.watch(job)
+
+    def reschedule():
+        for job in jobs:
+            job.execution_duration += 60
+            watchdog.watch(job)
+
+    _measured("watchdog: schedule", schedule, traced)
+    _measured("watchdog: reschedule", reschedule, traced)
+    if not traced:
+        clock.now = START + timedelta(days=1)
+        start = time.perf_counter()
+        await watchdog.check()
+        print(f"{'watchdog: abort all':>28}: {time.perf_counter() - start:.3f} s")
+
+
+def main(count: int = 50_000) -> None:
+    """Print the time and memory to schedule and reschedule the deadlines of executing jobs."""
+    print(f"{count} executing jobs")
+    for traced in (False, True):
+        asyncio.run(_timers(_jobs(count), traced))
+        asyncio.run(_watchdog(_jobs(count), traced))
+
+
+if __name__ == "__main__":
+    main()
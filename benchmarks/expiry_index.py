@@ -0,0 +1,47 @@
+"""Benchmark finding due jobs with ExpiryIndex against scanning every job.
+
+Run with ``python benchmarks/expiry_index.py``.
+"""
+import random
+import time
+from datetime import datetime, timedelta, timezone
+
+from vo_models.uws import JobSummary
+from vo_models.uws.expiry import ExpiryIndex
+
+
+def main(jobs: int = 100_000, sweeps: int = 1000) -> None:
+    """Print the time for a sweep every minute over a week, with and without the index."""
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    rng = random.Random(1)
+    models = [
+        JobSummary(job_id=f"job{i}", phase="COMPLETED", destruction=start + timedelta(days=7 * rng.random()))
+        for i in range(jobs)
+    ]
+    times = [start + timedelta(days=7) * i / sweeps for i in range(1, sweeps + 1)]
+
+    begin = time.perf_counter()
+    remaining = list(models)
+    scanned = 0
+    for now in times:
+        due = [job for job in remaining if job.destruction <= now]
+        scanned += len(due)
+        remaining = [job for job in remaining if job.destruction > now]
+    scan = time.perf_counter() - begin
+
+    begin = time.perf_counter()
+    index = ExpiryIndex()
+    for job in models:
+        index.add(job)
+    built = time.perf_counter() - begin
+    popped = 0
+    for now in times:
+        popped += sum(1 for _ in index.pop_due(now))
+    indexed = time.perf_counter() - begin
+
+    assert scanned == popped == jobs
+    print(f"{jobs} jobs, {sweeps} sweeps: scan {scan:.2f} s, index {indexed:.2f} s (of which building {built:.2f} s)")
+
+
+if __name__ == "__main__":
+    main()
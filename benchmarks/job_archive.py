@@ -0,0 +1,78 @@
+"""Benchmark archiving jobs as compact rows against storing their XML documents.
+
+Run with ``python benchmarks/job_archive.py``.
+"""
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from pydantic_xml import element
+
+from vo_models.uws import JobSummary, Parameter, Parameters, ResultReference, Results, TypedParameter
+from vo_models.uws.archive import decode_jobs, encode_jobs
+from vo_models.uws.parsing import from_xml
+from vo_models.uws.serialization import to_xml
+
+
+class TAPParameters(Parameters):
+    """TAP parameters."""
+
+    lang: Optional[Parameter] = element(tag="parameter", default=None)
+    query: Optional[Parameter] = element(tag="parameter", default=None)
+    maxrec: Optional[TypedParameter[int]] = element(tag="parameter", default=None)
+    responseformat: Optional[Parameter] = element(tag="parameter", default=None)
+
+
+def _jobs(count: int) -> list[JobSummary]:
+    start = datetime(2020, 1, 1, tzinfo=timezone.utc)
+    return [
+        JobSummary[TAPParameters](
+            job_id=f"job{i}",
+            run_id=f"run{i % 100}",
+            owner_id="someone",
+            phase="ARCHIVED",
+            creation_time=start + timedelta(seconds=i),
+            start_time=start + timedelta(seconds=i + 1),
+            end_time=start + timedelta(seconds=i + 30),
+            execution_duration=3600,
+            destruction=start + timedelta(days=3650),
+            parameters=TAPParameters(
+                lang=Parameter(id="lang", value="ADQL"),
+                query=Parameter(id="query", value=f"SELECT TOP 10 * FROM ivoa.obscore WHERE obs_id = 'obs{i}'"),
+                maxrec=Parameter(id="maxrec", value=10),
+                responseformat=Parameter(id="responseformat", value="votable"),
+            ),
+            results=Results(
+                results=[ResultReference(id="result", href=f"https://example.com/tap/async/job{i}/results/result")]
+            ),
+        )
+        for i in range(count)
+    ]
+
+
+def _size(row: tuple) -> int:
+    return sum(len(column) if isinstance(column, (str, bytes)) else 8 for column in row if column is not None)
+
+
+def _timed(label: str, func) -> list:
+    start = time.perf_counter()
+    result = list(func())
+    print(f"{label:>22}: {time.perf_counter() - start:.2f} s")
+    return result
+
+
+def main(count: int = 50_000) -> None:
+    """Print the size of archived jobs and the time to encode and decode them, as rows and as XML."""
+    jobs = _jobs(count)
+    job_cls = JobSummary[TAPParameters]
+
+    rows = _timed("encode rows", lambda: encode_jobs(jobs))
+    _timed("decode rows", lambda: decode_jobs(rows, job_cls))
+    documents = _timed("compiled to_xml", lambda: map(to_xml, jobs))
+    _timed("trusted from_xml", lambda: (from_xml(job_cls, document, trusted=True) for document in documents))
+
+    print(f"{count} jobs: rows {sum(map(_size, rows)) / 1e6:.1f} MB, XML {sum(map(len, documents)) / 1e6:.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
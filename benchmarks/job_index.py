@@ -0,0 +1,44 @@
+"""Benchmark filtered job lists from a JobIndex against scanning Jobs.jobref.
+
+Run with ``python benchmarks/job_index.py``.
+"""
+import timeit
+from datetime import datetime, timedelta
+
+from vo_models.uws import Jobs
+from vo_models.uws.jobindex import JobIndex
+from vo_models.uws.serialization import to_xml
+from vo_models.uws.types import ExecutionPhase
+
+
+def main(jobs: int = 100_000, owners: int = 997, number: int = 20) -> None:
+    """Print the time to build a user's job list, filtered by phase, with and without the index."""
+    start = datetime(2024, 1, 1)
+    phases = list(ExecutionPhase)
+    all_jobs = Jobs.from_rows(
+        {
+            "job_id": f"job{i}",
+            "phase": phases[i % len(phases)],
+            "owner_id": f"user{i % owners}",
+            "creation_time": start + timedelta(seconds=i),
+        }
+        for i in range(jobs)
+    )
+    index = JobIndex.from_jobs(all_jobs)
+    owner, wanted = "user7", {ExecutionPhase.EXECUTING, ExecutionPhase.QUEUED}
+
+    def scan():
+        jobref = [job for job in all_jobs.jobref if job.owner_id == owner and job.phase in wanted]
+        return Jobs(jobref=sorted(jobref, key=lambda job: job.creation_time))
+
+    def indexed():
+        return index.jobs(owners=[owner], phases=wanted)
+
+    assert to_xml(scan()) == to_xml(indexed())
+    print(f"{jobs} jobs, {len(indexed().jobref)} listed")
+    for label, func in (("scan", scan), ("index", indexed), ("id lookup", lambda: index["job50000"])):
+        print(f"{label:>10}: {timeit.timeit(func, number=number) / number * 1e6:.1f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""Benchmark the UWS 1.1 AFTER and LAST job list filters on a JobIndex against sorting the job list per request.
+
+Run with ``python benchmarks/job_list_filters.py``.
+"""
+import timeit
+from datetime import datetime, timedelta, timezone
+
+from vo_models.uws import Jobs
+from vo_models.uws.jobindex import JobIndex
+from vo_models.uws.serialization import iter_jobs_xml, to_xml
+
+
+def main(jobs: int = 100_000, number: int = 20) -> None:
+    """Print the time to select and write the LAST=20 jobs and the jobs AFTER a recent time."""
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    # Shuffled creation times, as jobs are listed in the order they are loaded rather than created
+    all_jobs = Jobs.from_rows(
+        {"job_id": f"job{i}", "phase": "COMPLETED", "creation_time": start + timedelta(seconds=i * 7919 % jobs)}
+        for i in range(jobs)
+    )
+    index = JobIndex.from_jobs(all_jobs)
+    after = start + timedelta(seconds=jobs - 100)
+
+    def sorted_jobs():
+        return sorted(all_jobs.jobref, key=lambda job: job.creation_time)
+
+    cases = {
+        "LAST=20": (
+            lambda: to_xml(Jobs(jobref=sorted_jobs()[:-21:-1])),
+            lambda: b"".join(index.iter_xml(last=20)),
+        ),
+        "AFTER": (
+            lambda: to_xml(Jobs(jobref=[job for job in sorted_jobs() if job.creation_time > after])),
+            lambda: b"".join(iter_jobs_xml(index.after(after))),
+        ),
+    }
+    print(f"{jobs} jobs")
+    for label, (per_request, indexed) in cases.items():
+        assert per_request() == indexed()
+        sort_time = timeit.timeit(per_request, number=number) / number
+        index_time = timeit.timeit(indexed, number=number) / number
+        print(f"{label:>8}  sort: {sort_time * 1e3:.2f} ms  index: {index_time * 1e3:.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
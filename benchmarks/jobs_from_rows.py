@@ -0,0 +1,50 @@
+"""Benchmark building a job list with Jobs.from_rows against constructing each ShortJobDescription.
+
+Run with ``python benchmarks/jobs_from_rows.py``.
+"""
+import timeit
+from datetime import datetime, timedelta
+
+from vo_models.uws import Jobs, ShortJobDescription
+from vo_models.uws.serialization import to_xml
+
+
+def main(jobs: int = 5000, number: int = 5) -> None:
+    """Print the time to build, and to build and serialize, a job list from rows."""
+    start = datetime(2024, 1, 1)
+    rows = [
+        {
+            "job_id": f"job{i}",
+            "phase": "COMPLETED",
+            "run_id": None,
+            "owner_id": "someone",
+            "creation_time": start + timedelta(seconds=i),
+        }
+        for i in range(jobs)
+    ]
+    template = "https://example.com/tap/async/{job_id}"
+
+    def per_row():
+        return Jobs(jobref=[ShortJobDescription(**row, href=template.format(**row)) for row in rows])
+
+    def from_rows():
+        return Jobs.from_rows(rows, href_template=template)
+
+    assert per_row() == from_rows()
+    validated = timeit.timeit(per_row, number=number) / number
+    bulk = timeit.timeit(from_rows, number=number) / number
+    print(
+        f"{jobs} jobs  per row: {validated * 1e3:.1f} ms  from_rows: {bulk * 1e3:.1f} ms  "
+        f"speedup: {validated / bulk:.1f}x"
+    )
+
+    validated = timeit.timeit(lambda: per_row().to_xml(), number=number) / number
+    bulk = timeit.timeit(lambda: to_xml(from_rows()), number=number) / number
+    print(
+        f"{jobs} jobs to XML  per row + to_xml: {validated * 1e3:.1f} ms  from_rows + compiled: {bulk * 1e3:.1f} ms  "
+        f"speedup: {validated / bulk:.1f}x"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""Benchmark JSON encoding/decoding against XML for UWS and VOSI models.
+
+Run with ``python benchmarks/json_vs_xml.py``.
+"""
+import timeit
+from datetime import datetime, timezone
+
+from vo_models.utils.json_codec import from_json, to_json
+from vo_models.uws import Jobs, JobSummary, Parameters, ResultReference, Results, ShortJobDescription
+from vo_models.uws.types import ExecutionPhase
+from vo_models.vodataservice import Table, TableParam, TableSchema
+from vo_models.vosi.availability.models import Availability
+from vo_models.vosi.tables import VOSITableSet
+
+NOW = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+MODELS = {
+    "JobSummary": JobSummary[Parameters](
+        job_id="job1",
+        phase=ExecutionPhase.COMPLETED,
+        creation_time=NOW,
+        results=Results(results=[ResultReference(id=f"result{i}", href=f"http://example.com/{i}") for i in range(10)]),
+    ),
+    "Jobs (500 jobs)": Jobs(
+        jobref=[
+            ShortJobDescription(job_id=f"job{i}", phase=ExecutionPhase.EXECUTING, creation_time=NOW)
+            for i in range(500)
+        ]
+    ),
+    "Availability": Availability(available=True, up_since=NOW, note=["Operating normally."]),
+    "VOSITableSet (2k columns)": VOSITableSet(
+        tableset_schema=[
+            TableSchema(
+                schema_name="schema",
+                table=[
+                    Table(
+                        table_name=f"schema.table{t}",
+                        column=[TableParam(column_name=f"col{c}", datatype="double") for c in range(100)],
+                    )
+                    for t in range(20)
+                ],
+            )
+        ]
+    ),
+}
+
+
+def main(number: int = 20) -> None:
+    """Print the time per call for XML and JSON encoding and decoding."""
+    for name, model in MODELS.items():
+        model_cls = type(model)
+        xml = model.to_xml()
+        json = to_json(model)
+        timings = {
+            "to_xml": timeit.timeit(model.to_xml, number=number),
+            "to_json": timeit.timeit(lambda model=model: to_json(model), number=number),
+            "from_xml": timeit.timeit(lambda cls=model_cls, xml=xml: cls.from_xml(xml), number=number),
+            "from_json": timeit.timeit(lambda cls=model_cls, json=json: from_json(cls, json), number=number),
+        }
+        print(
+            f"{name:26} "
+            + "  ".join(f"{key}: {value / number * 1e3:8.3f} ms" for key, value in timings.items())
+            + f"  encode speedup: {timings['to_xml'] / timings['to_json']:5.1f}x"
+            + f"  decode speedup: {timings['from_xml'] / timings['from_json']:5.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
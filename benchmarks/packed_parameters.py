@@ -0,0 +1,71 @@
+"""Benchmark PackedMultiValuedParameter against MultiValuedParameter for a parameter with many values.
+
+Run with ``python benchmarks/packed_parameters.py``.
+"""
+import timeit
+import tracemalloc
+from typing import Optional
+
+from pydantic_xml import element
+
+from vo_models.uws import JobSummary, MultiValuedParameter, PackedMultiValuedParameter, Parameter, Parameters
+from vo_models.uws.serialization import to_xml
+
+
+class SIAParameters(Parameters):
+    """SIA parameters with a plain multi-valued POS."""
+
+    pos: Optional[MultiValuedParameter] = element(tag="parameter", default=None)
+
+
+class PackedSIAParameters(Parameters):
+    """SIA parameters with a packed multi-valued POS."""
+
+    pos: Optional[PackedMultiValuedParameter] = element(tag="parameter", default=None)
+
+
+def _allocated(build) -> int:
+    tracemalloc.start()
+    parameters = build()  # pylint: disable=unused-variable
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return size
+
+
+def main(values: int = 5000, number: int = 5) -> None:
+    """Print the time and memory to build, parse and serialize a parameter with many values."""
+    positions = [f"CIRCLE {i % 360} {i % 90} 0.1" for i in range(values)]
+
+    def plain():
+        return SIAParameters(pos=[Parameter(id="pos", value=pos) for pos in positions])
+
+    def packed():
+        return PackedSIAParameters(pos=PackedMultiValuedParameter("pos", positions))
+
+    xml = plain().to_xml()
+    assert packed().to_xml() == xml
+    print(
+        f"{values} values memory  plain: {_allocated(plain) / 1024:.0f} KiB  "
+        f"packed: {_allocated(packed) / 1024:.0f} KiB  "
+        f"parsed plain: {_allocated(lambda: SIAParameters.from_xml(xml)) / 1024:.0f} KiB  "
+        f"parsed packed: {_allocated(lambda: PackedSIAParameters.from_xml(xml)) / 1024:.0f} KiB"
+    )
+    for name, plain_run, packed_run in (
+        ("build", plain, packed),
+        ("parse", lambda: SIAParameters.from_xml(xml), lambda: PackedSIAParameters.from_xml(xml)),
+        (
+            "job to compiled XML",
+            lambda: to_xml(JobSummary[SIAParameters](job_id="job1", phase="PENDING", parameters=plain())),
+            lambda: to_xml(JobSummary[PackedSIAParameters](job_id="job1", phase="PENDING", parameters=packed())),
+        ),
+    ):
+        plain_time = timeit.timeit(plain_run, number=number) / number
+        packed_time = timeit.timeit(packed_run, number=number) / number
+        print(
+            f"{values} values {name}  plain: {plain_time * 1e3:.2f} ms  packed: {packed_time * 1e3:.2f} ms  "
+            f"speedup: {plain_time / packed_time:.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
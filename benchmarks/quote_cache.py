@@ -0,0 +1,56 @@
+"""Benchmark polling job quotes through a quote cache against estimating them on every request.
+
+Run with ``python benchmarks/quote_cache.py``.
+"""
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from pydantic_xml import element
+
+from vo_models.uws import JobSummary, Parameter, Parameters
+from vo_models.uws.quote import QuoteCache
+
+
+class TAPParameters(Parameters):
+    """TAP parameters."""
+
+    lang: Optional[Parameter] = element(tag="parameter", default=None)
+    query: Optional[Parameter] = element(tag="parameter", default=None)
+
+
+def _explain(job: JobSummary) -> datetime:
+    # Stands in for running an EXPLAIN of the query, which typically takes milliseconds
+    time.sleep(0.002)
+    return datetime(2020, 1, 1, tzinfo=timezone.utc) + timedelta(seconds=len(job.parameters.query.value))
+
+
+def _timed(label: str, func, polls: int) -> None:
+    start = time.perf_counter()
+    func()
+    print(f"{label:>18}: {(time.perf_counter() - start) / polls * 1e6:.1f} us per poll")
+
+
+def main(jobs: int = 100, polls_per_job: int = 20) -> None:
+    """Print the time per quote poll with and without the cache."""
+    job_list = [
+        JobSummary[TAPParameters](
+            job_id=f"job{i}",
+            phase="PENDING",
+            parameters=TAPParameters(
+                lang=Parameter(id="lang", value="ADQL"),
+                query=Parameter(id="query", value=f"SELECT * FROM ivoa.obscore WHERE obs_id = 'obs{i}'"),
+            ),
+        )
+        for i in range(jobs)
+    ]
+    polls = jobs * polls_per_job
+    cache = QuoteCache(_explain)
+
+    _timed("estimate per poll", lambda: [_explain(job) for _ in range(polls_per_job) for job in job_list], polls)
+    _timed("quote cache", lambda: [cache.quote(job) for _ in range(polls_per_job) for job in job_list], polls)
+    _timed("cached quote", lambda: [cache.quote(job) for _ in range(polls_per_job) for job in job_list], polls)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""Benchmark loading a tableset from a binary snapshot against parsing its XML.
+
+Run with ``python benchmarks/snapshot.py``.
+"""
+import timeit
+
+from vo_models.utils.snapshot import dumps_snapshot, loads_snapshot
+from vo_models.vodataservice import Table, TableParam, TableSchema
+from vo_models.vosi.tables import VOSITableSet
+
+
+def main(tables: int = 100, columns: int = 100, number: int = 3) -> None:
+    """Print the time to load a tableset from XML and from a snapshot."""
+    tableset = VOSITableSet(
+        tableset_schema=[
+            TableSchema(
+                schema_name="schema",
+                table=[
+                    Table(
+                        table_name=f"schema.table{t}",
+                        description=f"Table number {t}",
+                        column=[
+                            TableParam(column_name=f"col{c}", datatype="double", unit="deg", ucd="pos.eq.ra")
+                            for c in range(columns)
+                        ],
+                    )
+                    for t in range(tables)
+                ],
+            )
+        ]
+    )
+    xml = tableset.to_xml()
+    snapshot = dumps_snapshot(tableset)
+
+    from_xml = timeit.timeit(lambda: VOSITableSet.from_xml(xml), number=number) / number
+    from_snapshot = timeit.timeit(lambda: loads_snapshot(VOSITableSet, snapshot), number=number) / number
+    print(f"{tables * columns} columns: XML {len(xml) / 1e6:.1f} MB, snapshot {len(snapshot) / 1e6:.1f} MB")
+    print(
+        f"from_xml: {from_xml * 1e3:.1f} ms  snapshot: {from_snapshot * 1e3:.1f} ms  "
+        f"speedup: {from_xml / from_snapshot:.1f}x"
+    )
+
+
+if __name__ == "__main__":
+    main()
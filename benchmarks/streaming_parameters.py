@@ -0,0 +1,62 @@
+"""Benchmark the peak memory of parsing a job with a large inline query, with and without spooling.
+
+Each parse reads the document from a file in a fresh process, and the increase in the process's peak resident set
+size is reported, so that memory allocated by lxml is included. Run with ``python benchmarks/streaming_parameters.py``
+(Unix only).
+"""
+import os
+import resource
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+
+from pydantic_xml import element
+
+from vo_models.uws import Parameter, Parameters
+from vo_models.uws.streaming import parse_parameters
+
+
+class TAPParameters(Parameters):
+    """TAP parameters with a large ADQL query."""
+
+    query: Optional[Parameter] = element(tag="parameter", default=None)
+    lang: Optional[Parameter] = element(tag="parameter", default=None)
+
+
+def _document(ids: int) -> bytes:
+    query = "SELECT * FROM ivoa.obscore WHERE obs_id IN (" + ",".join(f"'obs{i}'" for i in range(ids)) + ")"
+    return TAPParameters(query=Parameter(id="query", value=query), lang=Parameter(id="lang", value="ADQL")).to_xml()
+
+
+def _measure(name: str, path: str) -> tuple[float, int]:
+    before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = time.perf_counter()
+    with open(path, "rb") as f:
+        if name == "from_xml":
+            parameters = TAPParameters.from_xml(f.read())
+        else:
+            parameters = parse_parameters(TAPParameters, f)
+    elapsed = time.perf_counter() - start
+    del parameters
+    return elapsed, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - before
+
+
+def main(ids: int = 500_000) -> None:
+    """Print the time and peak memory increase to parse a query with a large ``IN`` list.
+
+    ``from_xml`` can not parse text nodes larger than 10 MB, which limits the size of the document.
+    """
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "parameters.xml")
+        with open(path, "wb") as f:
+            f.write(_document(ids))
+        size = os.path.getsize(path)
+        for name in ("from_xml", "parse_parameters"):
+            with ProcessPoolExecutor(max_workers=1) as executor:
+                elapsed, peak = executor.submit(_measure, name, path).result()
+            print(f"{size / 1e6:.1f} MB document  {name}: {elapsed * 1e3:.0f} ms  peak increase {peak / 1024:.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""Benchmark opening a memory-mapped tableset snapshot against parsing the tableset's XML.
+
+Run with ``python benchmarks/tableset_snapshot.py``.
+"""
+import os
+import tempfile
+import timeit
+import tracemalloc
+
+from vo_models.vodataservice import Table, TableParam, TableSchema
+from vo_models.vodataservice.snapshot import TableSetSnapshot, write_tableset_snapshot
+from vo_models.vosi.tables import VOSITableSet
+
+
+def _allocated(func) -> int:
+    tracemalloc.start()
+    result = func()  # pylint: disable=unused-variable
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return size
+
+
+def main(tables: int = 100, columns: int = 100, number: int = 3) -> None:
+    """Print the time and Python heap needed to load a tableset from XML and to open its snapshot."""
+    tableset = VOSITableSet(
+        tableset_schema=[
+            TableSchema(
+                schema_name="schema",
+                table=[
+                    Table(
+                        table_name=f"schema.table{t}",
+                        description=f"Table number {t}",
+                        column=[
+                            TableParam(column_name=f"col{c}", datatype="double", unit="deg", ucd="pos.eq.ra")
+                            for c in range(columns)
+                        ],
+                    )
+                    for t in range(tables)
+                ],
+            )
+        ]
+    )
+    xml = tableset.to_xml()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "tables.snapshot")
+        write_tableset_snapshot(tableset, path)
+
+        def open_and_read_table():
+            snapshot = TableSetSnapshot(path, VOSITableSet)
+            snapshot.table(f"schema.table{tables // 2}").to_model()
+            return snapshot
+
+        from_xml = timeit.timeit(lambda: VOSITableSet.from_xml(xml), number=number) / number
+        from_snapshot = timeit.timeit(lambda: open_and_read_table().close(), number=number) / number
+        xml_heap = _allocated(lambda: VOSITableSet.from_xml(xml))
+        snapshot_heap = _allocated(open_and_read_table)
+
+        print(f"{tables * columns} columns: XML {len(xml) / 1e6:.1f} MB, snapshot {os.path.getsize(path) / 1e6:.1f} MB")
+        print(
+            f"from_xml: {from_xml * 1e3:.1f} ms, {xml_heap / 1e6:.1f} MB heap  "
+            f"open snapshot and decode one table: {from_snapshot * 1e3:.1f} ms, {snapshot_heap / 1e3:.0f} kB heap"
+        )
+
+
+if __name__ == "__main__":
+    main()
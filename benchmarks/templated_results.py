@@ -0,0 +1,56 @@
+"""Benchmark templated results against building a ResultReference for each result.
+
+Run with ``python benchmarks/templated_results.py``.
+"""
+import timeit
+import tracemalloc
+
+from vo_models.uws import ResultReference, Results, TemplatedResults
+from vo_models.uws.serialization import to_xml
+
+TEMPLATE = "{base}/jobs/{job_id}/results/{id}"
+FIELDS = {"base": "https://example.com/tap/async", "job_id": "job1"}
+
+
+def _allocated(build) -> int:
+    tracemalloc.start()
+    results = build()  # pylint: disable=unused-variable
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return size
+
+
+def main(results: int = 5000, number: int = 5) -> None:
+    """Print the time and memory to build, and to build and serialize, a large result list."""
+    entries = [(f"result{i}.fits", 2880 * i, "application/fits") for i in range(results)]
+
+    def per_result():
+        return Results(
+            results=[
+                ResultReference(id=result_id, href=TEMPLATE.format(id=result_id, **FIELDS), size=size, mime_type=mime)
+                for result_id, size, mime in entries
+            ]
+        )
+
+    def templated():
+        return TemplatedResults.from_entries(TEMPLATE, entries, **FIELDS)
+
+    assert per_result().to_xml() == to_xml(templated())
+    models = timeit.timeit(per_result, number=number) / number
+    compact = timeit.timeit(templated, number=number) / number
+    print(f"{results} results  models: {models * 1e3:.1f} ms  templated: {compact * 1e3:.2f} ms")
+    print(
+        f"{results} results memory  models: {_allocated(per_result) / 1024:.0f} KiB  "
+        f"templated: {_allocated(templated) / 1024:.0f} KiB"
+    )
+
+    models = timeit.timeit(lambda: to_xml(per_result()), number=number) / number
+    compact = timeit.timeit(lambda: to_xml(templated()), number=number) / number
+    print(
+        f"{results} results to XML  models + compiled: {models * 1e3:.1f} ms  templated + compiled: "
+        f"{compact * 1e3:.1f} ms  speedup: {models / compact:.1f}x"
+    )
+
+
+if __name__ == "__main__":
+    main()
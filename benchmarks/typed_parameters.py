@@ -0,0 +1,92 @@
+"""Benchmark TypedParameter against plain parameters that clients convert themselves, for TAP job parameters.
+
+Run with ``python benchmarks/typed_parameters.py``.
+"""
+import timeit
+from typing import Optional
+
+from pydantic_xml import element
+
+from vo_models.uws import JobSummary, Parameter, Parameters, TypedParameter
+from vo_models.uws.parsing import from_xml
+
+
+class TAPParameters(Parameters):
+    """TAP parameters, with values converted by the client."""
+
+    request: Optional[Parameter] = element(tag="parameter", default=None)
+    lang: Optional[Parameter] = element(tag="parameter", default=None)
+    query: Optional[Parameter] = element(tag="parameter", default=None)
+    format: Optional[Parameter] = element(tag="parameter", default=None)
+    maxrec: Optional[Parameter] = element(tag="parameter", default=None)
+    runid: Optional[Parameter] = element(tag="parameter", default=None)
+    upload: Optional[Parameter] = element(tag="parameter", default=None)
+    dest: Optional[Parameter] = element(tag="parameter", default=None)
+    timeout: Optional[Parameter] = element(tag="parameter", default=None)
+    verbose: Optional[Parameter] = element(tag="parameter", default=None)
+
+
+class TypedTAPParameters(Parameters):
+    """TAP parameters with declared value types."""
+
+    request: Optional[TypedParameter[str]] = element(tag="parameter", default=None)
+    lang: Optional[TypedParameter[str]] = element(tag="parameter", default=None)
+    query: Optional[TypedParameter[str]] = element(tag="parameter", default=None)
+    format: Optional[TypedParameter[str]] = element(tag="parameter", default=None)
+    maxrec: Optional[TypedParameter[int]] = element(tag="parameter", default=None)
+    runid: Optional[TypedParameter[str]] = element(tag="parameter", default=None)
+    upload: Optional[TypedParameter[str]] = element(tag="parameter", default=None)
+    dest: Optional[TypedParameter[str]] = element(tag="parameter", default=None)
+    timeout: Optional[TypedParameter[float]] = element(tag="parameter", default=None)
+    verbose: Optional[TypedParameter[bool]] = element(tag="parameter", default=None)
+
+
+VALUES = {
+    "request": "doQuery",
+    "lang": "ADQL",
+    "query": "SELECT TOP 100 ra, dec FROM ivoa.obscore WHERE CONTAINS(POINT(ra, dec), CIRCLE(10, 20, 0.5)) = 1",
+    "format": "votable",
+    "maxrec": "100000",
+    "runid": "survey-2024",
+    "upload": "mytable,param:table1",
+    "dest": "vos://example.org~vospace/results",
+    "timeout": "600.5",
+    "verbose": "true",
+}
+
+
+def _use(parameters: Parameters) -> tuple:
+    """Read the parameters a TAP runner needs, converting the values that the model has not."""
+    maxrec, timeout, verbose = parameters.maxrec.value, parameters.timeout.value, parameters.verbose.value
+    if isinstance(maxrec, str):
+        maxrec, timeout, verbose = int(maxrec), float(timeout), verbose == "true"
+    return parameters.query.value, maxrec, timeout, verbose
+
+
+def main(number: int = 20000) -> None:
+    """Print the time to build and parse TAP parameters and read their values."""
+    xml = JobSummary[TAPParameters](
+        job_id="job1",
+        phase="PENDING",
+        parameters=TAPParameters(**{id: Parameter(id=id, value=value) for id, value in VALUES.items()}),
+    ).to_xml()
+
+    for name, parameters_cls in (("plain", TAPParameters), ("typed", TypedTAPParameters)):
+        job_cls = JobSummary[parameters_cls]
+
+        def build(parameters_cls=parameters_cls):
+            return _use(parameters_cls(**{id: {"id": id, "value": value} for id, value in VALUES.items()}))
+
+        def parse(job_cls=job_cls):
+            return _use(job_cls.from_xml(xml).parameters)
+
+        def parse_trusted(job_cls=job_cls):
+            return _use(from_xml(job_cls, xml, trusted=True).parameters)
+
+        for label, func in (("build", build), ("from_xml", parse), ("trusted from_xml", parse_trusted)):
+            elapsed = timeit.timeit(func, number=number) / number
+            print(f"{name:>5} {label:>16}: {elapsed * 1e6:.1f} us")
+
+
+if __name__ == "__main__":
+    main()
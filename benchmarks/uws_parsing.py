@@ -0,0 +1,74 @@
+"""Benchmark trusted parsing of UWS documents against validating parsing.
+
+Run with ``python benchmarks/uws_parsing.py``.
+"""
+import timeit
+from datetime import datetime, timezone
+from typing import Optional
+
+from pydantic_xml import element
+
+from vo_models.uws import Jobs, JobSummary, Parameter, Parameters, ResultReference, Results, ShortJobDescription
+from vo_models.uws.parsing import from_xml
+from vo_models.uws.types import ExecutionPhase
+
+
+class TAPParameters(Parameters):
+    """A TAP-like set of job parameters."""
+
+    lang: Optional[Parameter] = element(tag="parameter", default=None)
+    query: Optional[Parameter] = element(tag="parameter", default=None)
+    maxrec: Optional[Parameter] = element(tag="parameter", default=None)
+    responseformat: Optional[Parameter] = element(tag="parameter", default=None)
+
+
+NOW = datetime.now(timezone.utc)
+
+MODELS = {
+    "JobSummary": JobSummary[TAPParameters](
+        job_id="job1",
+        run_id="run1",
+        owner_id="owner1",
+        phase=ExecutionPhase.COMPLETED,
+        creation_time=NOW,
+        start_time=NOW,
+        end_time=NOW,
+        destruction=NOW,
+        parameters=TAPParameters(
+            lang=Parameter(id="lang", value="ADQL"),
+            query=Parameter(id="query", value="SELECT TOP 10 * FROM ivoa.obscore WHERE s_ra > 10"),
+            maxrec=Parameter(id="maxrec", value=10),
+            responseformat=Parameter(id="responseformat", value="votable"),
+        ),
+        results=Results(results=[ResultReference(id="result", href="http://example.com/job1/result", size=1234)]),
+    ),
+    "Jobs (100)": Jobs(
+        jobref=[
+            ShortJobDescription(
+                job_id=f"job{i}", href=f"http://example.com/job{i}", phase=ExecutionPhase.EXECUTING, creation_time=NOW
+            )
+            for i in range(100)
+        ]
+    ),
+    "Results (20)": Results(
+        results=[ResultReference(id=f"result{i}", href=f"http://example.com/job1/result{i}") for i in range(20)]
+    ),
+}
+
+
+def main(number: int = 500) -> None:
+    """Print the time per call for both parsing paths."""
+    for name, model in MODELS.items():
+        model_cls = type(model)
+        xml = model.to_xml()
+        assert from_xml(model_cls, xml, trusted=True) == model_cls.from_xml(xml)
+        validating = timeit.timeit(lambda: model_cls.from_xml(xml), number=number) / number
+        trusted = timeit.timeit(lambda: from_xml(model_cls, xml, trusted=True), number=number) / number
+        print(
+            f"{name:14} from_xml: {validating * 1e6:8.1f} us  trusted: {trusted * 1e6:8.1f} us  "
+            f"speedup: {validating / trusted:.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""Benchmark the compiled UWS serializers against pydantic-xml's to_xml().
+
+Run with ``python benchmarks/uws_serialization.py``.
+"""
+import timeit
+from datetime import datetime, timezone
+from typing import Optional
+
+from pydantic_xml import element
+
+from vo_models.uws import ErrorSummary, JobSummary, Parameter, Parameters, ResultReference, Results, ShortJobDescription
+from vo_models.uws.serialization import to_xml
+from vo_models.uws.types import ExecutionPhase
+
+
+class TAPParameters(Parameters):
+    """A TAP-like set of job parameters."""
+
+    lang: Optional[Parameter] = element(tag="parameter", default=None)
+    query: Optional[Parameter] = element(tag="parameter", default=None)
+    maxrec: Optional[Parameter] = element(tag="parameter", default=None)
+    responseformat: Optional[Parameter] = element(tag="parameter", default=None)
+
+
+NOW = datetime.now(timezone.utc)
+
+MODELS = {
+    "JobSummary": JobSummary[TAPParameters](
+        job_id="job1",
+        run_id="run1",
+        owner_id="owner1",
+        phase=ExecutionPhase.COMPLETED,
+        creation_time=NOW,
+        start_time=NOW,
+        end_time=NOW,
+        destruction=NOW,
+        parameters=TAPParameters(
+            lang=Parameter(id="lang", value="ADQL"),
+            query=Parameter(id="query", value="SELECT TOP 10 * FROM ivoa.obscore WHERE s_ra > 10"),
+            maxrec=Parameter(id="maxrec", value=10),
+            responseformat=Parameter(id="responseformat", value="votable"),
+        ),
+        results=Results(results=[ResultReference(id="result", href="http://example.com/job1/result", size=1234)]),
+    ),
+    "ShortJobDescription": ShortJobDescription(
+        job_id="job1", href="http://example.com/job1", phase=ExecutionPhase.EXECUTING, creation_time=NOW
+    ),
+    "ErrorSummary": ErrorSummary(message="Invalid query.", has_detail=True),
+    "ResultReference": ResultReference(id="result", href="http://example.com/job1/result", size=1234),
+}
+
+
+def main(number: int = 2000) -> None:
+    """Print the time per call for both serialization paths."""
+    for name, model in MODELS.items():
+        assert to_xml(model) == model.to_xml()
+        generic = timeit.timeit(model.to_xml, number=number) / number
+        compiled = timeit.timeit(lambda model=model: to_xml(model), number=number) / number
+        print(
+            f"{name:20} to_xml: {generic * 1e6:8.1f} us  compiled: {compiled * 1e6:8.1f} us  "
+            f"speedup: {generic / compiled:5.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""Tests for lazy loading of the package namespaces"""
+
+import importlib
+import subprocess
+import sys
+from unittest import TestCase
+
+NAMESPACES = [
+    "vo_models",
+    "vo_models.registry_interfaces",
+    "vo_models.tapregext",
+    "vo_models.utils",
+    "vo_models.uws",
+    "vo_models.vodataservice",
+    "vo_models.voregistry",
+    "vo_models.voresource",
+    "vo_models.vosi",
+    "vo_models.vosi.availability",
+    "vo_models.vosi.capabilities",
+    "vo_models.vosi.tables",
+    "vo_models.xlink",
+]
+
+# Cumulative import time allowed for each namespace, in microseconds. Importing the models behind a namespace takes
+# hundreds of milliseconds, so this only fails if a namespace starts importing them eagerly again.
+IMPORT_TIME_BUDGET_US = 50_000
+
+
+def _import_times(module: str) -> dict[str, int]:
+    """Import a module in a fresh interpreter, returning the cumulative import time of each module loaded."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+class TestLazyNamespaces(TestCase):
+    """Tests for lazily loaded package namespaces"""
+
+    def test_import_time_budget(self):
+        """Test importing a namespace doesn't import the models behind it"""
+
+        for namespace in NAMESPACES:
+            with self.subTest(namespace=namespace):
+                times = _import_times(namespace)
+                self.assertNotIn("pydantic_xml", times)
+                self.assertNotIn("lxml", times)
+                self.assertLess(times[namespace], IMPORT_TIME_BUDGET_US)
+
+    def test_types_import_without_models(self):
+        """Test plain enum modules can be imported without the models of their package"""
+
+        times = _import_times("vo_models.uws.types")
+        self.assertNotIn("vo_models.uws.models", times)
+        self.assertLess(times["vo_models.uws.types"], IMPORT_TIME_BUDGET_US)
+
+    def test_exports_resolve(self):
+        """Test every exported name resolves, and is cached in the namespace once loaded"""
+
+        for namespace in NAMESPACES:
+            package = importlib.import_module(namespace)
+            for name in getattr(package, "__all__", ()):
+                with self.subTest(namespace=namespace, name=name):
+                    self.assertIn(name, dir(package))
+                    value = getattr(package, name)
+                    self.assertIs(vars(package)[name], value)
+
+    def test_submodules_resolve(self):
+        """Test subpackages are available as attributes of their parent"""
+
+        import vo_models  # pylint: disable=import-outside-toplevel
+
+        self.assertIs(vo_models.vosi.tables, importlib.import_module("vo_models.vosi.tables"))
+        self.assertIs(vo_models.uws.JobSummary, importlib.import_module("vo_models.uws.models").JobSummary)
+
+    def test_unknown_attribute(self):
+        """Test unknown names still raise AttributeError"""
+
+        uws = importlib.import_module("vo_models.uws")
+        with self.assertRaises(AttributeError):
+            uws.NotAModel  # pylint: disable=pointless-statement
+        self.assertFalse(hasattr(uws, "NotAModel"))
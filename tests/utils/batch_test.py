@@ -0,0 +1,47 @@
+"""Tests for batch serialization helpers"""
+
+from unittest import TestCase
+
+from vo_models.utils import serialize_many
+from vo_models.uws import ErrorSummary, JobSummary, Parameters, ResultReference, Results
+from vo_models.uws.types import ExecutionPhase
+
+
+class TestSerializeMany(TestCase):
+    """Tests for serialize_many"""
+
+    models = [
+        JobSummary[Parameters](
+            job_id=f"job{i}",
+            phase=ExecutionPhase.EXECUTING,
+            results=Results(results=[ResultReference(id=f"result{i}", href=f"http://testlink.com/{i}")]),
+        )
+        for i in range(20)
+    ] + [ErrorSummary(message="Invalid query.")]
+
+    def test_matches_to_xml(self):
+        """Test the batch output matches serializing each model individually, in order"""
+
+        batch = serialize_many(self.models, workers=4)
+        self.assertEqual(batch.documents, [model.to_xml() for model in self.models])
+        self.assertEqual(len(batch.timings), len(self.models))
+        self.assertEqual(batch.workers, 4)
+        self.assertTrue(all(timing >= 0 for timing in batch.timings))
+        self.assertGreater(batch.parallelism, 0)
+
+    def test_sequential(self):
+        """Test serializing with a single worker"""
+
+        batch = serialize_many(self.models, workers=1, skip_empty=True, encoding="UTF-8")
+        self.assertEqual(
+            batch.documents,
+            [model.to_xml(skip_empty=True, encoding="UTF-8") for model in self.models],
+        )
+
+    def test_invalid_arguments(self):
+        """Test invalid arguments are rejected"""
+
+        with self.assertRaises(ValueError):
+            serialize_many(self.models, workers=0)
+        with self.assertRaises(ValueError):
+            serialize_many(self.models, encoding=str)
@@ -0,0 +1,87 @@
+"""Tests for models with deferred schema building"""
+
+import subprocess
+import sys
+from unittest import TestCase
+
+from pydantic_xml import BaseXmlModel, element
+
+from vo_models.utils.deferred import DeferredXmlModel
+
+
+class TestDeferredXmlModel(TestCase):
+    """Tests for deferred models"""
+
+    def test_not_built_when_defined(self):
+        """Test defining a deferred model doesn't build its schema or serializer"""
+
+        class Deferred(DeferredXmlModel, tag="deferred"):
+            """A deferred model"""
+
+            value: int = element()
+
+        self.assertFalse(Deferred.__pydantic_complete__)
+        self.assertIsNone(Deferred.__xml_serializer__)
+
+    def test_parse_first(self):
+        """Test parsing XML before the model was otherwise used"""
+
+        class Deferred(DeferredXmlModel, tag="deferred"):
+            """A deferred model"""
+
+            value: int = element()
+
+        self.assertEqual(Deferred.from_xml("<deferred><value>1</value></deferred>").value, 1)
+        self.assertTrue(Deferred.__pydantic_complete__)
+
+    def test_serialize_constructed(self):
+        """Test serializing an instance created without validation"""
+
+        class Deferred(DeferredXmlModel, tag="deferred"):
+            """A deferred model"""
+
+            value: int = element()
+
+        self.assertEqual(Deferred.model_construct(value=2).to_xml(), b"<deferred><value>2</value></deferred>")
+
+    def test_nested(self):
+        """Test using a deferred model as a field of an eagerly built model"""
+
+        class Deferred(DeferredXmlModel, tag="deferred"):
+            """A deferred model"""
+
+            value: int = element()
+
+        class Parent(BaseXmlModel, tag="parent"):
+            """A model containing deferred models"""
+
+            children: list[Deferred] = element()
+
+        parent = Parent.from_xml("<parent><deferred><value>1</value></deferred></parent>")
+        self.assertEqual(parent.children[0].value, 1)
+        self.assertEqual(parent.to_xml(), b"<parent><deferred><value>1</value></deferred></parent>")
+
+    def test_inherits_xml_settings(self):
+        """Test a deferred model inherits the tag and nsmap of its other bases"""
+
+        class Base(BaseXmlModel, tag="base", nsmap={"": "urn:base"}):
+            """A base model"""
+
+            value: int = element()
+
+        class Deferred(Base, DeferredXmlModel):
+            """A deferred subclass"""
+
+        self.assertEqual(Deferred(value=3).to_xml(), b'<base xmlns="urn:base"><value>3</value></base>')
+
+    def test_rarely_used_models_deferred(self):
+        """Test importing the registry models doesn't build them"""
+
+        code = (
+            "from vo_models.voregistry.models import Authority, Harvest, OAIHTTP, OAISOAP, Registry, Search\n"
+            "from vo_models.vodataservice.models import ParamHTTP\n"
+            "models = [Authority, Harvest, OAIHTTP, OAISOAP, Registry, Search, ParamHTTP]\n"
+            "print(any(model.__pydantic_complete__ for model in models))"
+        )
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        self.assertEqual(result.stdout.strip(), "False")
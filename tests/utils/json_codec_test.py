@@ -0,0 +1,150 @@
+"""Tests for the JSON codec"""
+
+import json
+from datetime import timezone as tz
+from unittest import TestCase
+
+from pydantic import ValidationError
+
+from vo_models.utils.json_codec import from_json, to_json
+from vo_models.uws import (
+    ErrorSummary,
+    Jobs,
+    JobSummary,
+    Parameter,
+    Parameters,
+    ResultReference,
+    Results,
+    ShortJobDescription,
+)
+from vo_models.uws.types import ExecutionPhase
+from vo_models.vodataservice import ForeignKey, Table, TableParam, TableSchema
+from vo_models.vosi.availability.models import Availability
+from vo_models.vosi.tables import VOSITableSet
+from vo_models.voresource.types import UTCTimestamp
+
+
+class TestJSONCodec(TestCase):
+    """Tests for JSON encoding and decoding"""
+
+    timestamp = UTCTimestamp(1900, 1, 1, 1, 1, 1, tzinfo=tz.utc)
+
+    class TestParameters(Parameters):
+        """A test subclass of Parameters."""
+
+        lang: Parameter
+        query: Parameter
+
+    def test_job_summary(self):
+        """Test JobSummary uses the XML names and round-trips"""
+
+        job_summary = JobSummary[self.TestParameters](
+            job_id="jobId1",
+            owner_id="ownerId1",
+            phase=ExecutionPhase.COMPLETED,
+            creation_time=self.timestamp,
+            parameters=self.TestParameters(
+                lang=Parameter(id="lang", value="ADQL"), query=Parameter(id="query", value="SELECT 1", is_post=True)
+            ),
+            results=Results(results=[ResultReference(id="result1", mime_type="text/xml", size=10)]),
+            error_summary=ErrorSummary(message="Warning", has_detail=True),
+            job_info=["info"],
+        )
+        encoded = to_json(job_summary)
+        document = json.loads(encoded)
+        self.assertEqual(document["jobId"], "jobId1")
+        self.assertEqual(document["ownerId"], "ownerId1")
+        self.assertEqual(document["creationTime"], "1900-01-01T01:01:01.000Z")
+        self.assertEqual(document["executionDuration"], 0)
+        self.assertEqual(document["parameters"]["query"]["isPost"], True)
+        self.assertEqual(document["results"]["result"][0]["mime-type"], "text/xml")
+        self.assertEqual(document["errorSummary"]["hasDetail"], True)
+        self.assertEqual(document["jobInfo"], ["info"])
+
+        decoded = from_json(JobSummary[self.TestParameters], encoded)
+        self.assertEqual(decoded, job_summary)
+        self.assertEqual(decoded.to_xml(), job_summary.to_xml())
+
+    def test_field_names_accepted(self):
+        """Test decoding accepts the Python field names too"""
+
+        decoded = from_json(ShortJobDescription, '{"job_id": "id1", "phase": "QUEUED", "creation_time": null}')
+        self.assertEqual(decoded.job_id, "id1")
+        self.assertEqual(decoded.phase, ExecutionPhase.QUEUED)
+
+    def test_pydantic_dump_unchanged(self):
+        """Test the XML names are only used by the codec, not by pydantic's own dumps"""
+
+        jobref = ShortJobDescription(job_id="id1", run_id="run1", phase=ExecutionPhase.QUEUED)
+        self.assertIn("run_id", jobref.model_dump(by_alias=True))
+        self.assertIn('"job_id":"id1"', jobref.model_dump_json(by_alias=True))
+        self.assertIn("has_detail", ErrorSummary(has_detail=True).model_dump(by_alias=True))
+        self.assertIn(b'"runId":"run1"', to_json(jobref))
+
+    def test_invalid(self):
+        """Test invalid documents are rejected"""
+
+        with self.assertRaises(ValidationError):
+            from_json(Jobs, '{"jobref": [{"id": "id1", "phase": "NOT_A_PHASE"}]}')
+
+    def test_jobs(self):
+        """Test Jobs round-trips"""
+
+        jobs = Jobs(
+            jobref=[
+                ShortJobDescription(job_id=f"id{i}", href=f"http://uri{i}", phase=ExecutionPhase.PENDING)
+                for i in range(3)
+            ]
+        )
+        encoded = to_json(jobs)
+        self.assertEqual(json.loads(encoded)["jobref"][1]["id"], "id1")
+        self.assertEqual(from_json(Jobs, encoded), jobs)
+
+    def test_availability(self):
+        """Test Availability round-trips"""
+
+        availability = Availability(available=True, up_since=self.timestamp, note=["all good"])
+        encoded = to_json(availability, exclude_none=True)
+        self.assertEqual(
+            json.loads(encoded), {"available": True, "upSince": "1900-01-01T01:01:01.000Z", "note": ["all good"]}
+        )
+        self.assertEqual(from_json(Availability, encoded), availability)
+
+    def test_tableset(self):
+        """Test VOSITableSet round-trips"""
+
+        tableset = VOSITableSet(
+            tableset_schema=[
+                TableSchema(
+                    schema_name="ivoa",
+                    table=[
+                        Table(
+                            table_name="ivoa.obscore",
+                            table_type="view",
+                            column=[TableParam(column_name="s_ra", datatype="double", flag=["indexed"])],
+                            foreign_key=[
+                                ForeignKey(target_table="ivoa.other", from_column="s_ra", target_column="ra")
+                            ],
+                        )
+                    ],
+                )
+            ]
+        )
+        encoded = to_json(tableset)
+        table = json.loads(encoded)["schema"][0]["table"][0]
+        self.assertEqual(table["name"], "ivoa.obscore")
+        self.assertEqual(table["type"], "view")
+        self.assertEqual(table["column"][0]["dataType"]["value"], "double")
+        self.assertEqual(table["foreignKey"][0]["fkColumn"][0]["fromColumn"], "s_ra")
+
+        decoded = from_json(VOSITableSet, encoded)
+        self.assertEqual(decoded, tableset)
+        self.assertEqual(decoded.to_xml(), tableset.to_xml())
+
+    def test_constructor_defaults(self):
+        """Test constructor defaults round-trip through to_json, but are not applied to missing keys"""
+
+        param = TableParam(column_name="a")
+        self.assertEqual(from_json(TableParam, to_json(param)), param)
+        self.assertIsNone(from_json(TableParam, '{"name": "a"}').datatype)
+        self.assertEqual(TableParam(**json.loads('{"column_name": "a"}')), param)
@@ -0,0 +1,85 @@
+"""Tests for binary model snapshots"""
+
+import io
+import os
+import tempfile
+from unittest import TestCase
+
+from vo_models.utils.snapshot import (
+    SNAPSHOT_MAGIC,
+    StaleSnapshotError,
+    dump_snapshot,
+    dumps_snapshot,
+    load_snapshot,
+    loads_snapshot,
+    model_fingerprint,
+)
+from vo_models.vodataservice import Table, TableParam, TableSchema, TableSet
+from vo_models.vosi.tables import VOSITableSet
+
+
+class TestSnapshot(TestCase):
+    """Tests for writing and loading snapshots"""
+
+    tableset = VOSITableSet(
+        tableset_schema=[
+            TableSchema(
+                schema_name="ivoa",
+                table=[
+                    Table(
+                        table_name="ivoa.obscore",
+                        column=[TableParam(column_name=f"col{i}", datatype="double") for i in range(10)],
+                    )
+                ],
+            )
+        ]
+    )
+
+    def test_round_trip(self):
+        """Test a snapshot loads back to an equal model"""
+
+        data = dumps_snapshot(self.tableset)
+        self.assertTrue(data.startswith(SNAPSHOT_MAGIC))
+        loaded = loads_snapshot(VOSITableSet, data)
+        self.assertEqual(loaded, self.tableset)
+        self.assertEqual(loaded.to_xml(), self.tableset.to_xml())
+
+    def test_files(self):
+        """Test writing to and reading from paths and file objects"""
+
+        buffer = io.BytesIO()
+        dump_snapshot(self.tableset, buffer)
+        buffer.seek(0)
+        self.assertEqual(load_snapshot(VOSITableSet, buffer), self.tableset)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "tables.snapshot")
+            dump_snapshot(self.tableset, path)
+            self.assertEqual(load_snapshot(VOSITableSet, path), self.tableset)
+
+    def test_rejects_other_model(self):
+        """Test a snapshot of one model is not loaded as another"""
+
+        with self.assertRaises(StaleSnapshotError):
+            loads_snapshot(TableSet, dumps_snapshot(self.tableset))
+
+    def test_rejects_stale_fingerprint(self):
+        """Test snapshots with a different fingerprint are rejected"""
+
+        data = dumps_snapshot(self.tableset)
+        fingerprint = model_fingerprint(VOSITableSet).encode()
+        stale = data.replace(fingerprint, b"0" * len(fingerprint))
+        with self.assertRaises(StaleSnapshotError):
+            loads_snapshot(VOSITableSet, stale)
+
+    def test_rejects_garbage(self):
+        """Test data that is not a snapshot is rejected"""
+
+        with self.assertRaises(ValueError):
+            loads_snapshot(VOSITableSet, b"<tableset/>")
+
+    def test_fingerprint(self):
+        """Test fingerprints depend on the model layout"""
+
+        self.assertEqual(model_fingerprint(VOSITableSet), model_fingerprint(VOSITableSet))
+        self.assertNotEqual(model_fingerprint(VOSITableSet), model_fingerprint(TableSet))
@@ -0,0 +1,19 @@
+"""A controllable clock for tests of deadlines"""
+
+from datetime import datetime, timedelta, timezone
+
+START = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+class FakeClock:
+    """A clock that only moves when told to"""
+
+    def __init__(self, now=START):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, seconds):
+        """Move the clock forward"""
+        self.now += timedelta(seconds=seconds)
@@ -0,0 +1,56 @@
+"""Example parameters models and jobs shared by the UWS tests"""
+
+from datetime import datetime
+from typing import Optional
+
+from pydantic_xml import BaseXmlModel, element
+
+from vo_models.uws import (
+    JobSummary,
+    MultiValuedParameter,
+    PackedMultiValuedParameter,
+    Parameter,
+    Parameters,
+    TypedParameter,
+)
+from vo_models.uws.types import ExecutionPhase
+
+
+class ExampleParameters(Parameters):
+    """An example subclass of Parameters, with a field of each kind of parameter."""
+
+    maxrec: Optional[TypedParameter[int]] = element(tag="parameter", default=None)
+    query: Optional[Parameter] = element(tag="parameter", default=None)
+    upload: Optional[MultiValuedParameter] = element(tag="parameter", default=None)
+    pos: Optional[PackedMultiValuedParameter] = element(tag="parameter", default=None)
+
+
+class ScheduleParameters(Parameters):
+    """Parameters with a value that is not a JSON type."""
+
+    run_at: Optional[TypedParameter[datetime]] = element(tag="parameter", default=None)
+
+
+class QueryDocument(BaseXmlModel, tag="parameters", ns="uws", nsmap={"uws": "http://www.ivoa.net/xml/UWS/v1.0"}):
+    """Parameters given as a document rather than key/value pairs."""
+
+    query: str = element(tag="query", ns="uws")
+
+
+def make_job(
+    job_id="job1",
+    destruction=None,
+    phase=ExecutionPhase.PENDING,
+    start_time=None,
+    execution_duration=0,
+    query="SELECT 1",
+):
+    """Build a job with a query and the given deadline fields"""
+    return JobSummary[ExampleParameters](
+        job_id=job_id,
+        phase=phase,
+        destruction=destruction,
+        start_time=start_time,
+        execution_duration=execution_duration,
+        parameters=ExampleParameters(query=Parameter(id="query", value=query)),
+    )
@@ -0,0 +1,181 @@
+"""Tests for the compact row encoding of archived jobs"""
+
+import sqlite3
+from datetime import datetime
+from datetime import timezone as tz
+from unittest import TestCase
+
+from tests.uws.examples import ExampleParameters, QueryDocument, ScheduleParameters
+from vo_models.uws import (
+    ErrorSummary,
+    Job,
+    JobSummary,
+    PackedMultiValuedParameter,
+    Parameter,
+    ResultReference,
+    Results,
+    TemplatedResults,
+)
+from vo_models.uws.archive import FORMAT_VERSION, ArchivedJob, decode_job, decode_jobs, encode_job, encode_jobs
+from vo_models.uws.types import ErrorType, ExecutionPhase, UWSVersion
+from vo_models.voresource.types import UTCTimestamp
+from vo_models.xlink import XlinkType
+
+
+class TestArchive(TestCase):
+    """Test archived jobs round trip to equal models and identical XML"""
+
+    timestamp = UTCTimestamp(2024, 1, 2, 3, 4, 5, 678000, tzinfo=tz.utc)
+
+    def assert_round_trip(self, job, job_cls):
+        """Check a job decodes to an equal model writing the same XML"""
+        row = encode_job(job)
+        self.assertIsInstance(row, ArchivedJob)
+        self.assertEqual(row.format_version, FORMAT_VERSION)
+        decoded = decode_job(row, job_cls)
+        self.assertIs(type(decoded), job_cls)
+        self.assertEqual(decoded, job)
+        self.assertEqual(decoded.to_xml(), job.to_xml())
+        return row
+
+    def test_full_job(self):
+        """Test a job with every field set"""
+
+        job_cls = JobSummary[ExampleParameters]
+        job = job_cls(
+            job_id="job1",
+            run_id="run1",
+            owner_id="owner",
+            phase=ExecutionPhase.ARCHIVED,
+            quote=self.timestamp,
+            creation_time=self.timestamp,
+            start_time=self.timestamp,
+            end_time=self.timestamp,
+            execution_duration=600,
+            destruction=self.timestamp,
+            parameters=ExampleParameters(
+                maxrec=Parameter(id="maxrec", value="100"),
+                query=Parameter(id="query", value="SELECT é".encode(), is_post=None),
+                upload=[Parameter(id="upload", value="a", by_reference=True), Parameter(id="upload", value=1.5)],
+                pos=PackedMultiValuedParameter("pos", ["CIRCLE 1 2 3", None, True], is_post=True),
+            ),
+            results=Results(
+                results=[
+                    ResultReference(id="result1", href="http://example.com/result1", size=10, mime_type="text/xml"),
+                    ResultReference(id="result2", type=XlinkType.LOCATOR, any_attrs={"extra": "value"}),
+                ]
+            ),
+            error_summary=ErrorSummary(message="Bad query", type=ErrorType.FATAL, has_detail=True),
+            job_info=["<info/>", "more"],
+            version=UWSVersion.V1_0,
+        )
+        row = self.assert_round_trip(job, job_cls)
+        self.assertEqual(row.phase, "ARCHIVED")
+        self.assertEqual(row.creation_time, 1704164645678000)
+        self.assertLess(sum(len(column) for column in row if isinstance(column, (str, bytes))), len(job.to_xml()) / 3)
+
+    def test_minimal_job(self):
+        """Test unset and None fields are kept apart"""
+
+        job_cls = JobSummary[ExampleParameters]
+        self.assert_round_trip(job_cls(job_id="job1", phase="PENDING"), job_cls)
+        self.assert_round_trip(
+            Job[ExampleParameters](
+                job_id="job1",
+                phase="ABORTED",
+                execution_duration=None,
+                parameters=ExampleParameters(),
+                results=None,
+                job_info=None,
+                version=None,
+            ),
+            Job[ExampleParameters],
+        )
+
+    def test_results(self):
+        """Test empty and templated results"""
+
+        job_cls = JobSummary[ExampleParameters]
+        job = job_cls(job_id="job1", phase="COMPLETED", results=Results(results=None))
+        decoded = decode_job(encode_job(job), job_cls)
+        self.assertEqual(decoded.results, Results(results=[]))
+        self.assertEqual(decoded.to_xml(), job.to_xml())
+
+        results = TemplatedResults.from_entries(
+            "{base}/jobs/job1/results/{id}",
+            [("votable", 1024, "application/x-votable+xml"), ("log", None, None)],
+            base="https://example.org/tap",
+        )
+        job = job_cls(job_id="job1", phase="COMPLETED", results=results)
+        # The references are neither built by encoding nor stored
+        row = encode_job(job)
+        self.assertIsNotNone(results.entries)
+        self.assertNotIn(b"/results/votable", row.results)
+        decoded = decode_job(row, job_cls).results
+        self.assertIsInstance(decoded, TemplatedResults)
+        self.assertEqual(decoded.entries, results.entries)
+        self.assert_round_trip(job, job_cls)
+
+        results.results[1].size = 10
+        decoded = decode_job(self.assert_round_trip(job, job_cls), job_cls).results
+        self.assertIsNone(decoded.entries)
+        self.assertEqual(decoded.results[1].size, 10)
+        decoded.append("extra")
+        self.assertEqual(decoded.results[2].href, "https://example.org/tap/jobs/job1/results/extra")
+
+        # Template fields that are not JSON types are formatted into plain results
+        results = TemplatedResults.from_entries("{day:%Y%m%d}/{id}", [("votable", None, None)], day=self.timestamp)
+        decoded = decode_job(encode_job(job_cls(job_id="job1", phase="COMPLETED", results=results)), job_cls)
+        self.assertEqual(decoded.results, Results(results=results.results))
+
+    def test_typed_parameters(self):
+        """Test typed values are stored as JSON types and read back as their type"""
+
+        job = JobSummary[ScheduleParameters](
+            job_id="job1",
+            phase="PENDING",
+            parameters={"run_at": {"id": "run_at", "value": "2024-01-02T03:04:05Z"}},
+        )
+        self.assertIsInstance(job.parameters.run_at.value, datetime)
+        row = self.assert_round_trip(job, JobSummary[ScheduleParameters])
+        self.assertIn(b'"2024-01-02T03:04:05Z"', row.parameters)
+        decoded = decode_job(row, JobSummary[ScheduleParameters])
+        self.assertIsInstance(decoded.parameters.run_at.value, datetime)
+
+    def test_document_parameters(self):
+        """Test parameters that are not key/value pairs are stored as XML"""
+
+        job = JobSummary[QueryDocument](job_id="job1", phase="COMPLETED", parameters=QueryDocument(query="SELECT 1"))
+        row = self.assert_round_trip(job, JobSummary[QueryDocument])
+        self.assertTrue(row.parameters.startswith(b"<"))
+
+    def test_errors(self):
+        """Test rows that can not be decoded"""
+
+        job = JobSummary[ExampleParameters](job_id="job1", phase="PENDING", parameters=ExampleParameters())
+        with self.assertRaises(ValueError):
+            decode_job(encode_job(job)._replace(format_version=FORMAT_VERSION + 1), JobSummary[ExampleParameters])
+        with self.assertRaises(ValueError):
+            decode_job(encode_job(job))
+        with self.assertRaises(ValueError):
+            decode_job(encode_job(job), JobSummary[QueryDocument])
+
+    def test_database(self):
+        """Test encoding and decoding many jobs through a database table"""
+
+        job_cls = JobSummary[ExampleParameters]
+        jobs = [
+            job_cls(
+                job_id=f"job{i}",
+                phase="ARCHIVED",
+                creation_time=self.timestamp,
+                parameters=ExampleParameters(maxrec=Parameter(id="maxrec", value=i)),
+            )
+            for i in range(100)
+        ]
+        with sqlite3.connect(":memory:") as connection:
+            connection.execute(f"CREATE TABLE jobs ({', '.join(ArchivedJob._fields)})")
+            placeholders = ", ".join("?" * len(ArchivedJob._fields))
+            connection.executemany(f"INSERT INTO jobs VALUES ({placeholders})", encode_jobs(jobs))
+            decoded = list(decode_jobs(connection.execute("SELECT * FROM jobs ORDER BY rowid"), job_cls))
+        self.assertEqual(decoded, jobs)
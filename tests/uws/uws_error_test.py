@@ -0,0 +1,104 @@
+"""Tests for detailed error documents"""
+
+import io
+import tempfile
+from pathlib import Path
+from unittest import TestCase
+
+from vo_models.uws import ErrorSummary, JobSummary
+from vo_models.uws.error import ErrorDetail
+from vo_models.uws.serialization import to_xml
+from vo_models.uws.types import ErrorType
+
+
+class TestErrorDetail(TestCase):
+    """Tests for error detail documents"""
+
+    def test_sources(self):
+        """Test documents are read in chunks from each kind of source"""
+
+        content = "Traceback: é\n" * 100
+        encoded = content.encode("utf-8")
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "error.log"
+            path.write_bytes(encoded)
+            for detail in (
+                ErrorDetail(content),
+                ErrorDetail(encoded),
+                ErrorDetail(path),
+                ErrorDetail.from_file(str(path)),
+                ErrorDetail(io.BytesIO(encoded)),
+                ErrorDetail(["Traceback: é\n"] * 100),
+            ):
+                chunks = list(detail.chunks(chunk_size=256))
+                self.assertTrue(all(len(chunk) <= 256 for chunk in chunks))
+                self.assertEqual(b"".join(chunks), encoded)
+                self.assertEqual(detail.read(), encoded)
+                out = io.BytesIO()
+                detail.copy_to(out)
+                self.assertEqual(out.getvalue(), encoded)
+            self.assertEqual(ErrorDetail.from_file(str(path)).size, len(encoded))
+        self.assertEqual(ErrorDetail(content).size, len(encoded))
+        self.assertIsNone(ErrorDetail(io.BytesIO(encoded)).size)
+
+    def test_iterator(self):
+        """Test a document produced by an iterator can only be read once"""
+
+        detail = ErrorDetail((line for line in [b"line 1\n", "line 2\n"]), media_type="text/x-log")
+        self.assertEqual(detail.media_type, "text/x-log")
+        self.assertEqual(detail.read(), b"line 1\nline 2\n")
+        with self.assertRaises(RuntimeError):
+            detail.read()
+
+    def test_from_exception(self):
+        """Test a traceback document"""
+
+        try:
+            raise ValueError("Bad query")
+        except ValueError as exc:
+            detail = ErrorDetail.from_exception(exc)
+        text = detail.read().decode("utf-8")
+        self.assertTrue(text.startswith("Traceback"))
+        self.assertIn("ValueError: Bad query", text)
+        self.assertEqual(detail.read().decode("utf-8"), text)
+
+
+class TestErrorSummaryDetail(TestCase):
+    """Tests for keeping has_detail consistent with the detail document"""
+
+    def test_has_detail(self):
+        """Test setting the detail sets has_detail"""
+
+        summary = ErrorSummary(message="Bad query", type=ErrorType.FATAL, detail=ErrorDetail("details"))
+        self.assertTrue(summary.has_detail)
+        self.assertIn(b'hasDetail="true"', summary.to_xml())
+        self.assertEqual(summary.detail.read(), b"details")
+
+        summary.detail = None
+        self.assertFalse(summary.has_detail)
+        self.assertEqual(to_xml(summary), ErrorSummary(message="Bad query", type=ErrorType.FATAL).to_xml())
+
+        summary.detail = ErrorDetail("details")
+        summary.has_detail = False
+        self.assertIsNone(summary.detail)
+
+        job = JobSummary(job_id="job1", phase="ERROR", error_summary=ErrorSummary(message="Failed"))
+        job.error_summary.detail = ErrorDetail("details")
+        self.assertIn(b'hasDetail="true"', to_xml(job))
+
+    def test_without_detail(self):
+        """Test summaries built without a detail have none"""
+
+        self.assertIsNone(ErrorSummary().detail)
+        self.assertIsNone(ErrorSummary.from_xml(ErrorSummary(has_detail=True).to_xml()).detail)
+        self.assertTrue(ErrorSummary(has_detail=True).has_detail)
+
+    def test_equality(self):
+        """Test the detail is not compared, as it is not part of the XML document"""
+
+        summary = ErrorSummary(message="Bad query", type=ErrorType.FATAL, detail=ErrorDetail("details"))
+        self.assertEqual(ErrorSummary.from_xml(summary.to_xml()), summary)
+        self.assertEqual(summary, ErrorSummary(message="Bad query", type=ErrorType.FATAL, has_detail=True))
+        self.assertNotEqual(summary, ErrorSummary(message="Bad query", type=ErrorType.FATAL))
+        job = JobSummary(job_id="job1", phase="ERROR", error_summary=summary)
+        self.assertEqual(JobSummary.model_validate(job.model_dump()), job)
@@ -0,0 +1,140 @@
+"""Tests for job deadline tracking"""
+
+import asyncio
+from datetime import timedelta
+from unittest import IsolatedAsyncioTestCase, TestCase
+
+from tests.uws.clock import START, FakeClock
+from tests.uws.examples import make_job
+from vo_models.uws.expiry import Expiry, ExpiryIndex, ExpiryKind, ExpirySweeper, job_deadlines
+from vo_models.uws.types import ExecutionPhase
+
+
+class TestExpiryIndex(TestCase):
+    """Tests for the expiry index"""
+
+    def test_job_deadlines(self):
+        """Test deadlines are derived from the job's fields"""
+
+        self.assertEqual(job_deadlines(make_job("job1")), {})
+        self.assertEqual(
+            job_deadlines(make_job("job1", START, ExecutionPhase.EXECUTING, START, execution_duration=60)),
+            {ExpiryKind.DESTRUCTION: START, ExpiryKind.EXECUTION: START + timedelta(seconds=60)},
+        )
+        # Unlimited duration, or not executing
+        self.assertEqual(job_deadlines(make_job("job1", None, ExecutionPhase.EXECUTING, START)), {})
+        self.assertEqual(job_deadlines(make_job("job1", None, ExecutionPhase.COMPLETED, START, 60)), {})
+
+    def test_pop_due(self):
+        """Test due deadlines are returned in order and removed"""
+
+        index = ExpiryIndex()
+        for i in (3, 1, 2):
+            index.add(make_job(f"job{i}", START + timedelta(hours=i)))
+        index.add(make_job("job4", START + timedelta(hours=4), ExecutionPhase.EXECUTING, START, 60))
+        self.assertEqual(len(index), 4)
+        self.assertEqual(index.next_deadline(), START + timedelta(seconds=60))
+
+        due = list(index.pop_due(START + timedelta(hours=2)))
+        self.assertEqual(
+            due,
+            [
+                Expiry(START + timedelta(seconds=60), "job4", ExpiryKind.EXECUTION),
+                Expiry(START + timedelta(hours=1), "job1", ExpiryKind.DESTRUCTION),
+                Expiry(START + timedelta(hours=2), "job2", ExpiryKind.DESTRUCTION),
+            ],
+        )
+        self.assertNotIn("job1", index)
+        self.assertEqual(index.deadlines("job4"), {ExpiryKind.DESTRUCTION: START + timedelta(hours=4)})
+        self.assertEqual(list(index.pop_due(START + timedelta(hours=2))), [])
+        self.assertEqual(index.next_deadline(), START + timedelta(hours=3))
+
+    def test_update_and_remove(self):
+        """Test stale deadlines are skipped"""
+
+        index = ExpiryIndex()
+        index.add(make_job("job1", START + timedelta(hours=1)))
+        index.add(make_job("job2", START + timedelta(hours=2)))
+        index.add(make_job("job1", START + timedelta(hours=3)))
+        index.remove("job2")
+        index.remove("unknown")
+        self.assertEqual(index.next_deadline(), START + timedelta(hours=3))
+        self.assertEqual(list(index.pop_due(START + timedelta(hours=2))), [])
+        index.add(make_job("job1"))
+        self.assertEqual(len(index), 0)
+        self.assertIsNone(index.next_deadline())
+
+    def test_compaction(self):
+        """Test the heap does not grow with repeated updates"""
+
+        index = ExpiryIndex()
+        for i in range(1000):
+            index.add(make_job("job1", START + timedelta(seconds=i)))
+        self.assertLess(len(index._heap), 200)  # pylint: disable=protected-access
+        due = list(index.pop_due(START + timedelta(days=1)))
+        self.assertEqual([expiry.deadline for expiry in due], [START + timedelta(seconds=999)])
+
+
+class TestExpirySweeper(IsolatedAsyncioTestCase):
+    """Tests for the expiry sweeper"""
+
+    async def asyncSetUp(self):
+        self.clock = FakeClock()
+        self.expired = []
+        self.handled = asyncio.Event()
+
+        async def on_expired(expiry):
+            self.expired.append(expiry)
+            self.handled.set()
+
+        self.sweeper = ExpirySweeper(ExpiryIndex(), on_expired, clock=self.clock)
+        self.sweeper.start()
+
+    async def asyncTearDown(self):
+        await self.sweeper.stop()
+
+    async def wait_handled(self):
+        """Wait for the sweeper to handle a deadline"""
+        await asyncio.wait_for(self.handled.wait(), timeout=1)
+        self.handled.clear()
+
+    async def test_sweeps_when_due(self):
+        """Test deadlines are handled once the clock reaches them"""
+
+        self.sweeper.add(make_job("job1", START + timedelta(hours=1)))
+        await asyncio.sleep(0.01)
+        self.assertEqual(self.expired, [])
+
+        self.clock.advance(3600)
+        self.sweeper.wake()
+        await self.wait_handled()
+        self.assertEqual(self.expired, [Expiry(START + timedelta(hours=1), "job1", ExpiryKind.DESTRUCTION)])
+
+    async def test_earlier_deadline(self):
+        """Test adding a deadline earlier than the next one wakes the sweeper"""
+
+        self.sweeper.add(make_job("job1", START + timedelta(hours=1)))
+        await asyncio.sleep(0)
+        self.sweeper.add(make_job("job2", START))
+        await self.wait_handled()
+        self.assertEqual([expiry.job_id for expiry in self.expired], ["job2"])
+
+    async def test_errors(self):
+        """Test callback errors are passed to on_error, or end the task"""
+
+        errors = []
+
+        def on_expired(expiry):
+            raise RuntimeError(expiry.job_id)
+
+        index = ExpiryIndex()
+        index.add(make_job("job1", START))
+        index.add(make_job("job2", START))
+        sweeper = ExpirySweeper(index, on_expired, clock=self.clock, on_error=lambda e, exc: errors.append(exc))
+        self.assertEqual(await sweeper.sweep(), 2)
+        self.assertEqual([str(exc) for exc in errors], ["job1", "job2"])
+
+        index.add(make_job("job3", START))
+        task = ExpirySweeper(index, on_expired, clock=self.clock).start()
+        with self.assertRaises(RuntimeError):
+            await asyncio.wait_for(task, timeout=1)
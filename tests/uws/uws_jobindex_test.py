@@ -0,0 +1,133 @@
+"""Tests for the indexed collection of job references"""
+
+from datetime import datetime, timedelta, timezone
+from unittest import TestCase
+
+from vo_models.uws import Jobs, ShortJobDescription
+from vo_models.uws.jobindex import JobIndex
+from vo_models.uws.serialization import to_xml
+from vo_models.uws.types import ExecutionPhase, UWSVersion
+
+START = datetime(2024, 1, 1, tzinfo=timezone.utc)
+PHASES = [ExecutionPhase.PENDING, ExecutionPhase.EXECUTING, ExecutionPhase.COMPLETED]
+
+
+def make_jobref(i, owner_id="alice", phase=None, creation_time=None):
+    """Build a job reference created i minutes after START"""
+    return ShortJobDescription(
+        job_id=f"job{i}",
+        phase=phase or PHASES[i % 3],
+        owner_id=owner_id,
+        creation_time=creation_time or START + timedelta(minutes=i),
+    )
+
+
+class TestJobIndex(TestCase):
+    """Tests for the job index"""
+
+    def setUp(self):
+        # Added out of creation order
+        self.jobrefs = [make_jobref(i, "alice" if i % 2 else "bob") for i in (5, 3, 0, 4, 1, 2)]
+        self.index = JobIndex(self.jobrefs)
+
+    def ids(self, jobrefs):
+        """The job ids of job references"""
+        return [jobref.job_id for jobref in jobrefs]
+
+    def test_lookup(self):
+        """Test job references are looked up by id and iterated in order of creation"""
+
+        self.assertEqual(len(self.index), 6)
+        self.assertIn("job3", self.index)
+        self.assertIs(self.index["job3"], self.jobrefs[1])
+        self.assertIsNone(self.index.get("unknown"))
+        with self.assertRaises(KeyError):
+            self.index["unknown"]  # pylint: disable=pointless-statement
+        self.assertEqual(self.ids(self.index), [f"job{i}" for i in range(6)])
+        self.assertEqual(sorted(self.index.owners()), ["alice", "bob"])
+
+    def test_select(self):
+        """Test filtering by owner and phase"""
+
+        self.assertEqual(self.ids(self.index.select(owners=["alice"])), ["job1", "job3", "job5"])
+        self.assertEqual(self.ids(self.index.select(phases=[ExecutionPhase.PENDING])), ["job0", "job3"])
+        self.assertEqual(self.ids(self.index.select(phases=["PENDING", "EXECUTING"])), ["job0", "job1", "job3", "job4"])
+        self.assertEqual(
+            self.ids(self.index.select(owners=["bob"], phases=[ExecutionPhase.PENDING, ExecutionPhase.COMPLETED])),
+            ["job0", "job2"],
+        )
+        self.assertEqual(self.index.select(owners=["carol"]), [])
+        self.assertEqual(self.index.select(owners=["alice"], phases=[ExecutionPhase.ABORTED]), [])
+        self.assertEqual(self.ids(self.index.select()), [f"job{i}" for i in range(6)])
+
+    def test_update(self):
+        """Test changed job references are re-indexed"""
+
+        jobref = self.index["job0"]
+        jobref.phase = ExecutionPhase.ABORTED
+        jobref.owner_id = None
+        self.index.add(jobref)
+        self.assertEqual(self.ids(self.index.select(phases=[ExecutionPhase.ABORTED])), ["job0"])
+        self.assertEqual(self.ids(self.index.select(owners=[None])), ["job0"])
+        self.assertEqual(self.ids(self.index.select(owners=["bob"])), ["job2", "job4"])
+
+        replacement = make_jobref(0, owner_id=None, phase=ExecutionPhase.ABORTED)
+        self.index.add(replacement)
+        self.assertIs(self.index.select(owners=[None])[0], replacement)
+
+        later = make_jobref(1, creation_time=START + timedelta(days=1))
+        self.index.add(later)
+        self.assertEqual(self.ids(self.index)[-1], "job1")
+        self.assertEqual(len(self.index), 6)
+
+        self.assertIs(self.index.remove("job1"), later)
+        self.assertIsNone(self.index.remove("job1"))
+        self.assertEqual(self.ids(self.index.select(owners=["alice"])), ["job3", "job5"])
+        self.assertEqual(len(self.index), 5)
+
+    def test_missing_creation_time(self):
+        """Test jobs without a creation time sort first"""
+
+        index = JobIndex([make_jobref(1), ShortJobDescription(job_id="job0", phase="PENDING")])
+        self.assertEqual(self.ids(index), ["job0", "job1"])
+
+    def test_after_and_last(self):
+        """Test the AFTER and LAST filters, alone and after the other filters"""
+
+        self.assertEqual(self.ids(self.index.after(START + timedelta(minutes=3))), ["job4", "job5"])
+        self.assertEqual(self.ids(self.index.after(datetime(2024, 1, 1, 0, 2, 30))), ["job3", "job4", "job5"])
+        self.assertEqual(self.ids(self.index.after(START - timedelta(days=1))), [f"job{i}" for i in range(6)])
+        self.assertEqual(self.index.after(START + timedelta(days=1)), [])
+        self.assertEqual(self.ids(self.index.last(2)), ["job5", "job4"])
+        self.assertEqual(self.ids(self.index.last(10)), [f"job{i}" for i in reversed(range(6))])
+        self.assertEqual(self.index.last(0), [])
+        with self.assertRaises(ValueError):
+            self.index.last(-1)
+
+        self.assertEqual(self.ids(self.index.select(after=START, last=3)), ["job5", "job4", "job3"])
+        self.assertEqual(self.ids(self.index.select(after=START + timedelta(minutes=3), last=3)), ["job5", "job4"])
+        self.assertEqual(self.ids(self.index.select(owners=["bob"], after=START)), ["job2", "job4"])
+        self.assertEqual(
+            self.ids(self.index.select(owners=["alice"], phases=[ExecutionPhase.EXECUTING, "PENDING"], last=1)),
+            ["job3"],
+        )
+
+    def test_iter_xml(self):
+        """Test filtered views are written in chunks"""
+
+        expected = self.index.jobs(phases=[ExecutionPhase.COMPLETED], last=5).to_xml()
+        self.assertEqual(b"".join(self.index.iter_xml(phases=[ExecutionPhase.COMPLETED], last=5)), expected)
+        self.assertEqual("".join(self.index.iter_xml(encoding=str)), self.index.jobs().to_xml(encoding=str))
+
+    def test_jobs(self):
+        """Test filtered views are job lists of the indexed models"""
+
+        jobs = self.index.jobs(owners=["alice"], version=UWSVersion.V1_0)
+        self.assertIsInstance(jobs, Jobs)
+        self.assertIs(jobs.jobref[0], self.index["job1"])
+        expected = Jobs(jobref=[self.index[job_id] for job_id in ("job1", "job3", "job5")], version=UWSVersion.V1_0)
+        self.assertEqual(jobs.to_xml(), expected.to_xml())
+        self.assertEqual(to_xml(self.index.jobs()), Jobs(jobref=list(self.index)).to_xml())
+
+        round_trip = JobIndex.from_jobs(Jobs.from_xml(self.index.jobs().to_xml()))
+        self.assertEqual(self.ids(round_trip), self.ids(self.index))
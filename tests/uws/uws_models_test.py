@@ -1,24 +1,33 @@
 """Tests for UWS pydantic-xml models"""
 
+import sqlite3
+from datetime import datetime
 from datetime import timezone as tz
 from typing import Optional
-from unittest import TestCase
+from unittest import TestCase, skipUnless
+from unittest.mock import patch
 from xml.etree.ElementTree import canonicalize
 
+import pydantic_xml
 from lxml import etree
+from pydantic import BaseModel, ValidationError
 from pydantic_xml import element
 
 from tests.xml_utils import load_schema
 from vo_models.uws import (
     ErrorSummary,
+    Job,
     Jobs,
     JobSummary,
     MultiValuedParameter,
+    PackedMultiValuedParameter,
     Parameter,
     Parameters,
     ResultReference,
     Results,
     ShortJobDescription,
+    TemplatedResults,
+    TypedParameter,
 )
 from vo_models.uws.types import ExecutionPhase
 from vo_models.voresource.types import UTCTimestamp
@@ -195,6 +204,104 @@ class TestResultsElement(TestCase):
         uws_schema.assertValid(results_xml)
 
 
+class TestTemplatedResultsElement(TestCase):
+    """Test results with templated links"""
+
+    def make_results(self):
+        """Create templated results equivalent to TestResultsElement's"""
+        return TemplatedResults.from_entries(
+            "{base}/{id}",
+            [("result1", None, "text/xml"), ("result2", 10, None)],
+            base="http://testlink.com/results",
+        )
+
+    def test_lazy_references(self):
+        """Test references are only built when the results are read"""
+
+        results = self.make_results()
+        self.assertEqual(results.entries, [("result1", None, "text/xml"), ("result2", 10, None)])
+        self.assertNotIn("results", results.__dict__)
+        results.append("result3", mime_type="text/plain")
+
+        self.assertEqual(results.results[0].href, "http://testlink.com/results/result1")
+        self.assertEqual(results.results[1].size, 10)
+        self.assertEqual(results.results[2].mime_type, "text/plain")
+        self.assertIsNone(results.entries)
+        results.append("result4")
+        self.assertEqual(results.results[3].href, "http://testlink.com/results/result4")
+
+    def test_write_to_xml(self):
+        """Test writing to XML, alone and within a job"""
+
+        expected = Results(
+            results=[
+                ResultReference(id="result1", href="http://testlink.com/results/result1", mime_type="text/xml"),
+                ResultReference(id="result2", href="http://testlink.com/results/result2", size=10),
+            ]
+        )
+        results = self.make_results()
+        self.assertEqual(results.to_xml(), expected.to_xml())
+        self.assertEqual(results.model_dump(), expected.model_dump())
+        self.assertEqual(results.model_dump_json(), expected.model_dump_json())
+        # Writing the results alone does not build them into the model
+        self.assertIsNotNone(results.entries)
+
+        job = JobSummary[Parameters](job_id="jobId1", phase=ExecutionPhase.COMPLETED, results=self.make_results())
+        expected_job = JobSummary[Parameters](job_id="jobId1", phase=ExecutionPhase.COMPLETED, results=expected)
+        self.assertEqual(job.to_xml(), expected_job.to_xml())
+        job = JobSummary[Parameters](job_id="jobId1", phase=ExecutionPhase.COMPLETED, results=self.make_results())
+        self.assertEqual(job.model_dump_json(), expected_job.model_dump_json())
+
+    def test_equality(self):
+        """Test comparing templated results"""
+
+        self.assertEqual(self.make_results(), self.make_results())
+        results = self.make_results()
+        results.append("result3")
+        self.assertNotEqual(results, self.make_results())
+
+        # Comparing does not build the references, and built references compare equal to unbuilt ones
+        results, other = self.make_results(), self.make_results()
+        self.assertEqual(results, other)
+        self.assertNotIn("results", results.__dict__)
+        self.assertNotIn("results", other.__dict__)
+        getattr(other, "results")
+        self.assertEqual(results, other)
+        self.assertEqual(other, results)
+        self.assertNotEqual(results, TemplatedResults.from_entries("{id}", results.entries))
+
+    def test_standard_constructors(self):
+        """Test the pydantic and pydantic-xml constructors take the fields of Results"""
+
+        expected = Results(results=[ResultReference(id="result1", href="http://testlink.com/results/result1")])
+        data = {"results": [{"id": "result1", "href": "http://testlink.com/results/result1"}]}
+        for results, plain in (
+            (TemplatedResults(results=expected.results), expected),
+            (TemplatedResults.model_validate(data), Results.model_validate(data)),
+            (TemplatedResults.from_xml(expected.to_xml()), Results.from_xml(expected.to_xml())),
+        ):
+            self.assertIsInstance(results, TemplatedResults)
+            self.assertIsNone(results.entries)
+            self.assertEqual(results.results, plain.results)
+            self.assertEqual(results.to_xml(), plain.to_xml())
+        self.assertEqual(TemplatedResults().results, [])
+
+    def test_copy(self):
+        """Test copies can be appended to independently"""
+
+        results = self.make_results()
+        for copied in (results.model_copy(), results.model_copy(deep=True)):
+            copied.append("result3")
+            self.assertEqual(len(copied.entries), 3)
+            self.assertEqual(len(results.entries), 2)
+
+        getattr(results, "results")
+        copied = results.model_copy()
+        copied.append("result3")
+        self.assertEqual(len(copied.results), 3)
+        self.assertEqual(len(results.results), 2)
+
+
 class TestShortJobDescriptionType(TestCase):
     """Test the UWS ShortJobDescription complex type"""
 
@@ -343,6 +450,116 @@ class TestParametersElement(TestCase):
         uws_schema.assertValid(parameters_xml)
 
 
+class TestPackedMultiValuedParameter(TestCase):
+    """Test packed multi-valued parameters"""
+
+    class TestParameters(Parameters):
+        """A test subclass of Parameters with a packed parameter."""
+
+        param1: Optional[Parameter] = element(tag="parameter", default=None)
+        param4: Optional[PackedMultiValuedParameter] = element(tag="parameter", default=None)
+
+    class UnpackedParameters(Parameters):
+        """The same parameters, with a plain multi-valued parameter."""
+
+        param1: Optional[Parameter] = element(tag="parameter", default=None)
+        param4: Optional[MultiValuedParameter] = element(tag="parameter", default=None)
+
+    def test_read_from_xml(self):
+        """Test reading from XML, in and out of order"""
+
+        for xml in (TestParametersElement.test_parameters_xml, TestParametersElement.test_parameters_xml_reordered):
+            parameters = self.TestParameters.from_xml(xml)
+            self.assertIsInstance(parameters.param4, PackedMultiValuedParameter)
+            self.assertEqual(parameters.param4.values, ["value4", "second value4"])
+            self.assertEqual(len(parameters.param4), 2)
+            self.assertEqual(parameters.param4[1], Parameter(id="param4", value="second value4"))
+            self.assertEqual(parameters.param1.value, "value1")
+
+    def test_write_to_xml(self):
+        """Test packed values are written as repeated parameters"""
+
+        unpacked = self.UnpackedParameters(
+            param4=[Parameter(id="param4", value="value4"), Parameter(id="param4", value="second value4")]
+        )
+        packed = self.TestParameters(param4=PackedMultiValuedParameter("param4", ["value4", "second value4"]))
+        self.assertEqual(packed.to_xml(), unpacked.to_xml())
+        self.assertEqual(
+            self.TestParameters(param4=[Parameter(id="param4", value="value4")]).param4,
+            [Parameter(id="param4", value="value4")],
+        )
+
+    def test_validate(self):
+        """Test values with differing attributes can not be packed"""
+
+        with self.assertRaises(ValidationError):
+            self.TestParameters(
+                param4=[Parameter(id="param4", value="1"), Parameter(id="param4", value="2", by_reference=True)]
+            )
+        packed = self.TestParameters(param4=PackedMultiValuedParameter("param4", ["1"], by_reference=True))
+        packed.param4.append("2")
+        self.assertEqual([param.by_reference for param in packed.param4], [True, True])
+        self.assertEqual(self.TestParameters.model_validate_json(packed.model_dump_json()), packed)
+
+
+class TestTypedParameter(TestCase):
+    """Test parameters with a declared value type"""
+
+    class TestParameters(Parameters):
+        """A test subclass of Parameters with typed parameters."""
+
+        param1: Optional[TypedParameter[str]] = element(tag="parameter", default=None)
+        param2: Optional[TypedParameter[int]] = element(tag="parameter", default=None)
+        param4: Optional[MultiValuedParameter] = element(tag="parameter", default=None)
+        param5: Optional[TypedParameter[bool]] = element(tag="parameter", default=None)
+
+    test_parameters_xml = (
+        f"<uws:parameters {UWS_NAMESPACE_HEADER}>"
+        '<uws:parameter byReference="false" isPost="false" id="param5">true</uws:parameter>'
+        '<uws:parameter byReference="false" isPost="false" id="param4">value4</uws:parameter>'
+        '<uws:parameter byReference="false" isPost="false" id="param1">10</uws:parameter>'
+        '<uws:parameter byReference="false" isPost="false" id="param4">second value4</uws:parameter>'
+        '<uws:parameter byReference="false" isPost="false" id="param2">10</uws:parameter>'
+        "</uws:parameters>"
+    )
+
+    def test_specialize(self):
+        """Test typed parameter classes are cached and validate their value type"""
+
+        self.assertIs(TypedParameter[int], TypedParameter[int])
+        self.assertIs(TypedParameter[int].value_type, int)
+        self.assertEqual(TypedParameter[int](id="param2", value="10").value, 10)
+        with self.assertRaises(ValidationError):
+            TypedParameter[int](id="param2", value="ten")
+
+    @skipUnless(hasattr(pydantic_xml, "xml_field_validator"), "Requires pydantic-xml 2.13")
+    def test_read_from_xml(self):
+        """Test values are parsed to their declared type, whatever the order of the parameters"""
+
+        parameters = self.TestParameters.from_xml(self.test_parameters_xml)
+        self.assertIsInstance(parameters.param2, TypedParameter[int])
+        self.assertEqual(parameters.param1.value, "10")
+        self.assertEqual(parameters.param2.value, 10)
+        self.assertIs(parameters.param5.value, True)
+        self.assertEqual([param.value for param in parameters.param4], ["value4", "second value4"])
+
+        with self.assertRaises(ValidationError):
+            self.TestParameters.from_xml(self.test_parameters_xml.replace(">10<", ">ten<"))
+
+    def test_write_to_xml(self):
+        """Test typed values are written as plain parameters"""
+
+        parameters = self.TestParameters(
+            param1=Parameter(id="param1", value="10"),
+            param2=Parameter(id="param2", value="10"),
+            param5=Parameter(id="param5", value="true"),
+        )
+        self.assertIsInstance(parameters.param2, TypedParameter[int])
+        self.assertEqual(parameters.param2.value, 10)
+        self.assertEqual(self.TestParameters.from_xml(parameters.to_xml()), parameters)
+        self.assertEqual(self.TestParameters.model_validate_json(parameters.model_dump_json()), parameters)
+
+
 class TestJobSummaryElement(TestCase):
     """Test the UWS JobSummary element"""
 
@@ -448,6 +665,28 @@ class TestJobSummaryElement(TestCase):
         job_summary_xml = etree.fromstring(job_summary.to_xml(encoding=str))
         uws_schema.assertValid(job_summary_xml)
 
+    def test_specialization_cached(self):
+        """Test subscripting with a parameters type builds the specialised model only once"""
+
+        class CachedParameters(Parameters):
+            """Parameters only used by this test."""
+
+            param1: Optional[Parameter] = element(tag="parameter", default=None)
+
+        job_summary_cls = JobSummary[CachedParameters]
+        job_cls = Job.specialize(CachedParameters)
+        self.assertIsNot(job_summary_cls, job_cls)
+        self.assertTrue(issubclass(job_cls, Job))
+
+        def fail(*args):
+            raise AssertionError(f"specialisation rebuilt for {args}")
+
+        with patch.object(BaseModel, "__class_getitem__", classmethod(fail)):
+            for _ in range(3):
+                self.assertIs(JobSummary[CachedParameters], job_summary_cls)
+                self.assertIs(JobSummary.specialize(CachedParameters), job_summary_cls)
+                self.assertIs(Job[CachedParameters], job_cls)
+
 
 class TestJobsElement(TestCase):
     """Test the UWS Jobs element"""
@@ -512,3 +751,81 @@ class TestJobsElement(TestCase):
         )
         jobs_element_xml = etree.fromstring(jobs_element.to_xml(skip_empty=True, encoding=str))
         uws_schema.assertValid(jobs_element_xml)
+
+    def test_from_rows(self):
+        """Test building a job list from database rows"""
+
+        rows = [
+            {
+                "job_id": "id1",
+                "phase": "EXECUTING",
+                "run_id": "run1",
+                "owner_id": None,
+                "creation_time": datetime(1900, 1, 1, 1, 1, 1, 500000),
+                "other": "ignored",
+            },
+            {
+                "job_id": 2,
+                "phase": ExecutionPhase.PENDING,
+                "run_id": None,
+                "owner_id": "owner",
+                "creation_time": "1900-01-01T01:01:01.000Z",
+                "other": "ignored",
+            },
+        ]
+        jobs = Jobs.from_rows(rows, href_template="http://example.com/jobs/{job_id}")
+        expected = Jobs(
+            jobref=[
+                ShortJobDescription(
+                    job_id="id1",
+                    phase=ExecutionPhase.EXECUTING,
+                    run_id="run1",
+                    owner_id=None,
+                    creation_time=UTCTimestamp(1900, 1, 1, 1, 1, 1, 500000, tzinfo=tz.utc),
+                    href="http://example.com/jobs/id1",
+                ),
+                ShortJobDescription(
+                    job_id="2",
+                    phase=ExecutionPhase.PENDING,
+                    owner_id="owner",
+                    creation_time=UTCTimestamp(1900, 1, 1, 1, 1, 1, tzinfo=tz.utc),
+                    href="http://example.com/jobs/2",
+                ),
+            ]
+        )
+        self.assertEqual(jobs, expected)
+        self.assertIsInstance(jobs.jobref[0].creation_time, UTCTimestamp)
+        self.assertEqual(jobs.to_xml(), expected.to_xml())
+
+        minimal = Jobs.from_rows([{"job_id": "id1", "phase": "QUEUED"}])
+        self.assertEqual(minimal, Jobs(jobref=[ShortJobDescription(job_id="id1", phase=ExecutionPhase.QUEUED)]))
+        self.assertEqual(Jobs.from_rows([]), Jobs())
+
+        with self.assertRaises(ValueError):
+            Jobs.from_rows([{"job_id": "id1", "phase": "SLEEPING"}])
+
+    def test_from_rows_columns(self):
+        """Test rows with different optional columns and non-string identifiers"""
+
+        jobs = Jobs.from_rows(
+            [
+                {"job_id": 1, "phase": "QUEUED"},
+                {"job_id": 2, "phase": "QUEUED", "run_id": 20, "owner_id": 200, "creation_time": "1900-01-01T01:01:01"},
+                {"job_id": 3, "phase": "QUEUED", "run_id": "run3"},
+            ]
+        )
+        self.assertEqual([jobref.run_id for jobref in jobs.jobref], [None, "20", "run3"])
+        self.assertEqual(jobs.jobref[1].owner_id, "200")
+        self.assertEqual(jobs.jobref[1].creation_time, UTCTimestamp(1900, 1, 1, 1, 1, 1, tzinfo=tz.utc))
+        self.assertIsNone(jobs.jobref[2].creation_time)
+
+        connection = sqlite3.connect(":memory:")
+        connection.row_factory = sqlite3.Row
+        rows = connection.execute("SELECT 4 AS job_id, 'EXECUTING' AS phase, 40 AS owner_id").fetchall()
+        self.assertEqual(Jobs.from_rows(rows).jobref[0].owner_id, "40")
+        connection.close()
+
+        with self.assertRaises(ValueError):
+            Jobs.from_rows([{"job_id": "id1", "phase": "QUEUED"}, {"job_id": "id2"}])
+        with self.assertRaises(ValueError):
+            Jobs.from_rows([{"phase": "QUEUED"}])
@@ -0,0 +1,165 @@
+"""Tests for trusted parsing of UWS documents"""
+
+from datetime import timezone as tz
+from typing import Optional
+from unittest import TestCase
+
+from pydantic import ValidationError
+from pydantic_xml import element
+
+from tests.uws.examples import ExampleParameters, QueryDocument
+from vo_models.uws import (
+    ErrorSummary,
+    Job,
+    Jobs,
+    JobSummary,
+    MultiValuedParameter,
+    PackedMultiValuedParameter,
+    Parameter,
+    Parameters,
+    ResultReference,
+    Results,
+    ShortJobDescription,
+    TypedParameter,
+)
+from vo_models.uws.parsing import from_xml
+from vo_models.uws.types import ErrorType, ExecutionPhase
+from vo_models.voresource.types import UTCTimestamp
+
+
+class TypedParameters(Parameters):
+    """Parameters with declared value types."""
+
+    param1: Optional[TypedParameter[int]] = element(tag="parameter", default=None)
+    param2: Optional[MultiValuedParameter] = element(tag="parameter", default=None)
+    param3: Optional[TypedParameter[float]] = element(tag="parameter", default=None)
+
+
+class TestTrustedParsing(TestCase):
+    """Test trusted parsing produces the same models as validating parsing"""
+
+    timestamp = UTCTimestamp(1900, 1, 1, 1, 1, 1, 123000, tzinfo=tz.utc)
+
+    def assert_same(self, model_cls, xml):
+        """Check trusted and validating parsing agree"""
+        expected = model_cls.from_xml(xml)
+        parsed = from_xml(model_cls, xml, trusted=True)
+        self.assertIs(type(parsed), type(expected))
+        self.assertEqual(parsed, expected)
+        self.assertEqual(parsed.to_xml(), expected.to_xml())
+        return parsed
+
+    def test_job_summary(self):
+        """Test parsing complete and minimal jobs"""
+
+        job = Job[ExampleParameters](
+            job_id="job1",
+            run_id="run1",
+            owner_id=None,
+            phase=ExecutionPhase.ERROR,
+            quote=self.timestamp,
+            creation_time=self.timestamp,
+            start_time=self.timestamp,
+            end_time=None,
+            execution_duration=600,
+            destruction=self.timestamp,
+            parameters=ExampleParameters(
+                upload=[Parameter(id="upload", value="a", by_reference=True), Parameter(id="upload", value="b")],
+                query=Parameter(id="query", value="x & y", is_post=True),
+                maxrec=Parameter(id="maxrec", value="100"),
+            ),
+            results=Results(results=[ResultReference(id="result1", href="http://example.com/r", size=10)]),
+            error_summary=ErrorSummary(message="Failed", type=ErrorType.FATAL, has_detail=True),
+            job_info=["info1", "info2"],
+        )
+        parsed = self.assert_same(Job[ExampleParameters], job.to_xml())
+        self.assertEqual(parsed.parameters, job.parameters)
+        self.assertIsInstance(parsed.quote, UTCTimestamp)
+
+        self.assert_same(
+            JobSummary[ExampleParameters], JobSummary[ExampleParameters](job_id="job2", phase="PENDING").to_xml()
+        )
+
+    def test_packed_parameters(self):
+        """Test packed parameters are parsed as by the validating parser"""
+
+        job = JobSummary[ExampleParameters](
+            job_id="job1",
+            phase="PENDING",
+            parameters=ExampleParameters(pos=PackedMultiValuedParameter("pos", ["a", "b"], by_reference=True)),
+        )
+        parsed = self.assert_same(JobSummary[ExampleParameters], job.to_xml())
+        self.assertIsInstance(parsed.parameters.pos, PackedMultiValuedParameter)
+
+    def test_typed_parameters(self):
+        """Test typed parameters are parsed to their type as by the validating parser"""
+
+        job = JobSummary[TypedParameters](
+            job_id="job1",
+            phase="PENDING",
+            parameters=TypedParameters(
+                param3=Parameter(id="param3", value="1.5"),
+                param2=[Parameter(id="param2", value="a")],
+                param1=Parameter(id="param1", value="100"),
+            ),
+        )
+        parsed = self.assert_same(JobSummary[TypedParameters], job.to_xml())
+        self.assertEqual(parsed.parameters.param1.value, 100)
+        self.assertEqual(parsed.parameters.param3.value, 1.5)
+
+    def test_document_parameters(self):
+        """Test parameters that are not key/value pairs are parsed by their model"""
+
+        job = JobSummary[QueryDocument](job_id="job1", phase="PENDING", parameters=QueryDocument(query="SELECT 1"))
+        self.assert_same(JobSummary[QueryDocument], job.to_xml())
+
+    def test_jobs(self):
+        """Test parsing job lists"""
+
+        jobs = Jobs(
+            jobref=[
+                ShortJobDescription(
+                    job_id="job1",
+                    href="http://example.com/job1",
+                    phase=ExecutionPhase.EXECUTING,
+                    run_id="run1",
+                    owner_id="owner",
+                    creation_time=self.timestamp,
+                ),
+                ShortJobDescription(job_id="job2", phase=ExecutionPhase.PENDING),
+            ]
+        )
+        self.assert_same(Jobs, jobs.to_xml())
+        self.assert_same(Jobs, Jobs().to_xml())
+
+    def test_results(self):
+        """Test parsing results, including extra attributes"""
+
+        xml = (
+            '<uws:results xmlns:uws="http://www.ivoa.net/xml/UWS/v1.0" xmlns:xlink="http://www.w3.org/1999/xlink">'
+            '<uws:result id="r1" xlink:href="http://example.com/r1" size="5" mime-type="text/plain" extra="1"/>'
+            '<uws:result id="r2"/>'
+            "</uws:results>"
+        )
+        parsed = self.assert_same(Results, xml)
+        self.assertEqual(parsed.results[0].any_attrs, {"extra": "1"})
+
+    def test_other_offsets(self):
+        """Test timestamps without a Z suffix are handled as by the validating parser"""
+
+        xml = JobSummary[ExampleParameters](job_id="job1", phase="PENDING", creation_time=self.timestamp).to_xml()
+        self.assert_same(JobSummary[ExampleParameters], xml.replace(b".123Z<", b".123+00:00<"))
+
+    def test_fallback(self):
+        """Test unexpected documents are parsed with validation"""
+
+        xml = JobSummary[ExampleParameters](job_id="job1", phase="PENDING").to_xml()
+        self.assert_same(JobSummary[ExampleParameters], xml.replace(b"</uws:job>", b"<uws:other/></uws:job>"))
+        with self.assertRaises(ValidationError):
+            from_xml(JobSummary[ExampleParameters], xml.replace(b"PENDING", b"SLEEPING"), trusted=True)
+
+    def test_not_trusted(self):
+        """Test the default path validates"""
+
+        xml = JobSummary[ExampleParameters](job_id="job1", phase="PENDING").to_xml()
+        self.assertEqual(from_xml(JobSummary[ExampleParameters], xml), JobSummary[ExampleParameters].from_xml(xml))
@@ -0,0 +1,151 @@
+"""Tests for cached quote estimation"""
+
+import asyncio
+from datetime import timedelta
+from unittest import IsolatedAsyncioTestCase, TestCase
+
+from tests.uws.clock import START
+from tests.uws.examples import ScheduleParameters, make_job
+from vo_models.uws import JobSummary
+from vo_models.uws.quote import QuoteCache
+from vo_models.uws.types import ExecutionPhase
+
+
+class Estimator:
+    """A quote estimator counting its calls"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, job):
+        self.calls += 1
+        return START + timedelta(seconds=len(job.parameters.query.value))
+
+
+class TestQuoteCache(TestCase):
+    """Tests for the quote cache with a synchronous estimator"""
+
+    def setUp(self):
+        self.estimator = Estimator()
+        self.cache = QuoteCache(self.estimator)
+
+    def test_memoised(self):
+        """Test quotes are estimated once per job"""
+
+        job = make_job()
+        self.assertEqual(self.cache.quote(job), START + timedelta(seconds=8))
+        self.assertEqual(self.cache.quote(job), START + timedelta(seconds=8))
+        self.assertEqual(self.cache.quote(make_job()), START + timedelta(seconds=8))
+        self.assertEqual(self.estimator.calls, 1)
+        self.cache.quote(make_job("job2"))
+        self.assertEqual(self.estimator.calls, 2)
+        self.assertEqual(len(self.cache), 2)
+
+    def test_invalidation(self):
+        """Test changes to the parameters or phase are noticed, and explicit invalidation"""
+
+        job = make_job()
+        self.cache.quote(job)
+        job.parameters.query.value = "SELECT 10"
+        self.assertEqual(self.cache.quote(job), START + timedelta(seconds=9))
+        job.phase = ExecutionPhase.QUEUED
+        self.cache.quote(job)
+        self.assertEqual(self.estimator.calls, 3)
+
+        self.cache.invalidate("job1")
+        self.cache.quote(job)
+        self.cache.invalidate()
+        self.assertEqual(len(self.cache), 0)
+        self.cache.quote(job)
+        self.assertEqual(self.estimator.calls, 5)
+
+    def test_maxsize(self):
+        """Test the least recently used quotes are dropped"""
+
+        cache = QuoteCache(self.estimator, maxsize=2)
+        for job_id in ("job1", "job2", "job1", "job3", "job1", "job2"):
+            cache.quote(make_job(job_id))
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(self.estimator.calls, 4)
+
+    def test_typed_parameters(self):
+        """Test jobs with parameter values of any type are quoted"""
+
+        job = JobSummary[ScheduleParameters](
+            job_id="job1",
+            phase=ExecutionPhase.PENDING,
+            parameters={"run_at": {"id": "run_at", "value": "2024-01-02T00:00:00Z"}},
+        )
+        cache = QuoteCache(lambda job: job.parameters.run_at.value)
+        self.assertEqual(cache.quote(job), START + timedelta(days=1))
+        job.parameters.run_at.value += timedelta(days=1)
+        self.assertEqual(cache.quote(job), START + timedelta(days=2))
+
+    def test_async_estimator(self):
+        """Test an asynchronous estimator needs aquote"""
+
+        async def estimator(job):
+            return START
+
+        with self.assertRaises(TypeError):
+            QuoteCache(estimator).quote(make_job())
+
+
+class TestAsyncQuoteCache(IsolatedAsyncioTestCase):
+    """Tests for the quote cache with an asynchronous estimator"""
+
+    async def test_shared_estimation(self):
+        """Test concurrent lookups share one estimation"""
+
+        calls = []
+        release = asyncio.Event()
+
+        async def estimator(job):
+            calls.append(job.job_id)
+            await release.wait()
+            return START
+
+        cache = QuoteCache(estimator)
+        job = make_job()
+        lookups = [asyncio.ensure_future(cache.aquote(job)) for _ in range(3)]
+        await asyncio.sleep(0)
+        release.set()
+        self.assertEqual(await asyncio.gather(*lookups), [START] * 3)
+        self.assertEqual(await cache.aquote(job), START)
+        self.assertEqual(calls, ["job1"])
+
+    async def test_cancelled_caller(self):
+        """Test cancelling one lookup does not cancel the estimation shared with the others"""
+
+        calls = []
+        release = asyncio.Event()
+
+        async def estimator(job):
+            calls.append(job.job_id)
+            await release.wait()
+            return START
+
+        cache = QuoteCache(estimator)
+        job = make_job()
+        lookups = [asyncio.ensure_future(cache.aquote(job)) for _ in range(3)]
+        await asyncio.sleep(0)
+        lookups[0].cancel()
+        await asyncio.sleep(0)
+        release.set()
+        self.assertEqual(await asyncio.gather(*lookups[1:]), [START] * 2)
+        self.assertTrue(lookups[0].cancelled())
+        self.assertEqual(await cache.aquote(job), START)
+        self.assertEqual(calls, ["job1"])
+
+    async def test_errors(self):
+        """Test failed estimations are not cached"""
+
+        async def estimator(job):
+            raise RuntimeError("no plan")
+
+        cache = QuoteCache(estimator)
+        for _ in range(2):
+            with self.assertRaises(RuntimeError):
+                await cache.aquote(make_job())
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(await QuoteCache(Estimator()).aquote(make_job()), START + timedelta(seconds=8))
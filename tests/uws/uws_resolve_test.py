@@ -0,0 +1,224 @@
+"""Tests for by-reference parameter resolution"""
+
+import asyncio
+import tempfile
+import threading
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Optional
+from unittest import IsolatedAsyncioTestCase, TestCase
+
+from pydantic_xml import element
+
+from vo_models.uws import MultiValuedParameter, PackedMultiValuedParameter, Parameter, Parameters
+from vo_models.uws.resolve import (
+    ContentCache,
+    ParameterResolutionError,
+    ParameterResolver,
+    fetch_http,
+    file_fetcher,
+)
+
+
+class ExampleParameters(Parameters):
+    """An example subclass of Parameters."""
+
+    query: Optional[Parameter] = element(tag="parameter", default=None)
+    upload: Optional[MultiValuedParameter] = element(tag="parameter", default=None)
+    pos: Optional[PackedMultiValuedParameter] = element(tag="parameter", default=None)
+
+
+class RecordingFetcher:
+    """A fetcher serving fixed content, recording calls and the number of fetches in progress"""
+
+    def __init__(self, contents):
+        self.contents = contents
+        self.calls = []
+        self.active = 0
+        self.max_active = 0
+
+    async def __call__(self, url):
+        self.calls.append(url)
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await asyncio.sleep(0.01)
+            return self.contents[url]
+        finally:
+            self.active -= 1
+
+
+class TestContentCache(TestCase):
+    """Test the size-bounded LRU cache"""
+
+    def test_eviction(self):
+        """Test the least recently used content is evicted first"""
+
+        cache = ContentCache(10)
+        cache.put("a", b"1234")
+        cache.put("b", b"1234")
+        self.assertEqual(cache.get("a"), b"1234")
+        cache.put("c", b"1234")
+        self.assertNotIn("b", cache)
+        self.assertEqual((len(cache), cache.size), (2, 8))
+
+        cache.put("a", b"123456")
+        self.assertEqual(cache.size, 10)
+        cache.put("d", b"12345678901")
+        self.assertNotIn("d", cache)
+        self.assertEqual(cache.size, 10)
+
+
+class TestParameterResolver(IsolatedAsyncioTestCase):
+    """Test resolving by-reference parameters"""
+
+    def make_parameters(self):
+        """Create parameters with inline and by-reference values"""
+        return ExampleParameters(
+            query=Parameter(id="query", value="mem://query", by_reference=True),
+            upload=[
+                Parameter(id="upload", value="mem://upload", by_reference=True),
+                Parameter(id="upload", value="inline"),
+            ],
+            pos=PackedMultiValuedParameter("pos", ["mem://pos1", "mem://query"], by_reference=True),
+        )
+
+    async def test_resolve(self):
+        """Test values are fetched once each and inlined"""
+
+        contents = {"mem://query": b"SELECT 1", "mem://upload": b"<VOTABLE/>", "mem://pos1": b"CIRCLE 1 2 3"}
+        fetcher = RecordingFetcher(contents)
+        resolver = ParameterResolver({"mem": fetcher})
+        parameters = self.make_parameters()
+
+        resolved = await resolver.resolve(parameters)
+        self.assertEqual(resolved.query, Parameter(id="query", value=b"SELECT 1"))
+        self.assertEqual(resolved.upload[0], Parameter(id="upload", value=b"<VOTABLE/>"))
+        self.assertEqual(resolved.upload[1], Parameter(id="upload", value="inline"))
+        self.assertEqual(resolved.pos, PackedMultiValuedParameter("pos", [b"CIRCLE 1 2 3", b"SELECT 1"]))
+        self.assertEqual(sorted(fetcher.calls), sorted(contents))
+        self.assertTrue(parameters.query.by_reference)
+
+        # A second job referring to the same URLs is served from the cache
+        await resolver.resolve(self.make_parameters())
+        self.assertEqual(len(fetcher.calls), 3)
+        unresolved = ExampleParameters(query=Parameter(id="query", value="SELECT 2"))
+        self.assertIs(await resolver.resolve(unresolved), unresolved)
+
+    async def test_concurrency(self):
+        """Test fetches run concurrently, within the limit, and are shared between callers"""
+
+        urls = [f"mem://{i}" for i in range(20)]
+        fetcher = RecordingFetcher({url: url.encode() for url in urls})
+        resolver = ParameterResolver({"mem": fetcher}, max_concurrency=4, cache_size=0)
+        parameters = ExampleParameters(upload=[Parameter(id="upload", value=url, by_reference=True) for url in urls])
+
+        results = await asyncio.gather(resolver.resolve(parameters), resolver.fetch("mem://0"))
+        self.assertEqual([param.value for param in results[0].upload], [url.encode() for url in urls])
+        self.assertEqual(results[1], b"mem://0")
+        self.assertEqual(fetcher.max_active, 4)
+        self.assertEqual(len(fetcher.calls), 20)
+        self.assertEqual(len(resolver.cache), 0)
+
+    async def test_errors(self):
+        """Test failures are reported with the URL"""
+
+        resolver = ParameterResolver({"mem": RecordingFetcher({})})
+        parameters = ExampleParameters(query=Parameter(id="query", value="mem://missing", by_reference=True))
+        with self.assertRaises(ParameterResolutionError) as context:
+            await resolver.resolve(parameters)
+        self.assertEqual(context.exception.url, "mem://missing")
+        self.assertIsInstance(context.exception.__cause__, KeyError)
+
+        with self.assertRaises(ParameterResolutionError):
+            await resolver.fetch("gopher://example.com/")
+
+    async def test_file_and_http(self):
+        """Test the default fetchers against local files and a local HTTP server"""
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir, "upload.xml")
+            path.write_bytes(b"<VOTABLE/>")
+
+            server = ThreadingHTTPServer(("127.0.0.1", 0), partial(QuietHandler, directory=tmpdir))
+            thread = threading.Thread(target=server.serve_forever, daemon=True)
+            thread.start()
+            try:
+                resolver = ParameterResolver()
+                http_url = f"http://127.0.0.1:{server.server_address[1]}/upload.xml"
+                self.assertEqual(await resolver.fetch(http_url), b"<VOTABLE/>")
+                with self.assertRaises(ParameterResolutionError):
+                    await resolver.fetch(f"http://127.0.0.1:{server.server_address[1]}/missing.xml")
+                # Local files are not read unless opted in to
+                with self.assertRaises(ParameterResolutionError):
+                    await resolver.fetch(path.as_uri())
+
+                resolver = ParameterResolver({"file": file_fetcher(tmpdir)})
+                self.assertEqual(await resolver.fetch(path.as_uri()), b"<VOTABLE/>")
+                with self.assertRaises(ParameterResolutionError):
+                    await resolver.fetch(Path(tmpdir, "missing.xml").as_uri())
+            finally:
+                server.shutdown()
+                server.server_close()
+
+    async def test_max_size(self):
+        """Test content larger than the limit is rejected"""
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            Path(tmpdir, "small.xml").write_bytes(b"<VOTABLE/>")
+            Path(tmpdir, "large.xml").write_bytes(b"x" * 200_000)
+
+            server = ThreadingHTTPServer(("127.0.0.1", 0), partial(QuietHandler, directory=tmpdir))
+            thread = threading.Thread(target=server.serve_forever, daemon=True)
+            thread.start()
+            try:
+                base = f"http://127.0.0.1:{server.server_address[1]}"
+                resolver = ParameterResolver(max_size=100_000)
+                self.assertEqual(await resolver.fetch(f"{base}/small.xml"), b"<VOTABLE/>")
+                with self.assertRaises(ParameterResolutionError):
+                    await resolver.fetch(f"{base}/large.xml")
+                self.assertEqual(len(await ParameterResolver(max_size=None).fetch(f"{base}/large.xml")), 200_000)
+
+                # The body is read in chunks when the server does not announce its length
+                with self.assertRaises(ParameterResolutionError):
+                    await fetch_http(f"{base}/large.xml?chunked", max_size=100_000)
+            finally:
+                server.shutdown()
+                server.server_close()
+
+            with self.assertRaises(ParameterResolutionError):
+                await file_fetcher(tmpdir, max_size=100_000)(Path(tmpdir, "large.xml").as_uri())
+            fetchers = {"file": file_fetcher(tmpdir), "mem": RecordingFetcher({"mem://large": b"x" * 200_000})}
+            resolver = ParameterResolver(fetchers, max_size=100_000)
+            for url in (Path(tmpdir, "large.xml").as_uri(), "mem://large"):
+                with self.assertRaises(ParameterResolutionError):
+                    await resolver.fetch(url)
+
+    async def test_file_fetcher_root(self):
+        """Test the file fetcher only reads files within its directory"""
+
+        with tempfile.TemporaryDirectory() as tmpdir, tempfile.TemporaryDirectory() as outside:
+            secret = Path(outside, "secret.txt")
+            secret.write_bytes(b"secret")
+            Path(tmpdir, "link.txt").symlink_to(secret)
+            fetch = file_fetcher(Path(tmpdir))
+            for url in (secret.as_uri(), Path(tmpdir, "..", Path(outside).name, "secret.txt").as_uri()):
+                with self.assertRaises(ParameterResolutionError):
+                    await fetch(url)
+            with self.assertRaises(ParameterResolutionError):
+                await fetch(Path(tmpdir, "link.txt").as_uri())
+            with self.assertRaises(ParameterResolutionError):
+                await fetch("file://otherhost/etc/passwd")
+
+
+class QuietHandler(SimpleHTTPRequestHandler):
+    """A file server that doesn't log requests, and leaves out the length of responses to ``?chunked`` requests"""
+
+    def send_header(self, keyword, value):
+        if keyword == "Content-Length" and self.path.endswith("?chunked"):
+            return
+        super().send_header(keyword, value)
+
+    def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+        pass
@@ -0,0 +1,327 @@
+"""Tests for the compiled UWS serializers"""
+
+from datetime import timezone as tz
+from typing import Optional
+from unittest import TestCase
+
+from pydantic import ValidationError
+from pydantic_xml import element
+
+from vo_models.uws import (
+    ErrorSummary,
+    Job,
+    Jobs,
+    JobSummary,
+    MultiValuedParameter,
+    PackedMultiValuedParameter,
+    Parameter,
+    Parameters,
+    ResultReference,
+    Results,
+    ShortJobDescription,
+    TemplatedResults,
+    TypedParameter,
+)
+from vo_models.uws.serialization import JobSummaryDocument, compile_serializer, iter_jobs_xml, to_xml
+from vo_models.uws.types import ErrorType, ExecutionPhase, UWSVersion
+from vo_models.voresource.types import UTCTimestamp
+
+
+class ExampleParameters(Parameters):
+    """An example subclass of Parameters."""
+
+    param1: Optional[Parameter] = element(tag="parameter", default=None)
+    param2: Optional[MultiValuedParameter] = element(tag="parameter", default=None)
+
+
+class TestCompiledSerializer(TestCase):
+    """Test the compiled serializers produce the same output as pydantic-xml"""
+
+    timestamp = UTCTimestamp(1900, 1, 1, 1, 1, 1, tzinfo=tz.utc)
+
+    def assert_identical(self, model):
+        """Check the compiled output against to_xml for all supported encodings"""
+        self.assertEqual(to_xml(model), model.to_xml())
+        self.assertEqual(to_xml(model, encoding=str), model.to_xml(encoding=str))
+        self.assertEqual(to_xml(model, encoding="UTF-8"), model.to_xml(encoding="UTF-8"))
+
+    def test_error_summary(self):
+        """Test ErrorSummary output"""
+
+        self.assert_identical(ErrorSummary())
+        self.assert_identical(ErrorSummary(message="Bad <query> & \"stuff\"\r\n", type=ErrorType.FATAL, has_detail=True))
+        self.assert_identical(ErrorSummary(message="Café ☃"))
+
+    def test_result_reference(self):
+        """Test ResultReference and Results output"""
+
+        self.assert_identical(ResultReference(id="result1"))
+        self.assert_identical(
+            ResultReference(id='a"&\n\t<>', type=None, href="http://testlink.com/?a=1&b=2", size=0, mime_type="")
+        )
+        self.assert_identical(Results())
+        self.assert_identical(Results(results=None))
+        self.assert_identical(TemplatedResults.from_entries("http://testlink.com/{id}"))
+        self.assert_identical(
+            TemplatedResults.from_entries(
+                "{base}/{id}?a=1&b=2", [("result1", 10, "text/xml"), ("<2>", None, None)], base="http:"
+            )
+        )
+        self.assert_identical(
+            Results(results=[ResultReference(id="result1", size=10), ResultReference(id="result2", mime_type="a/b")])
+        )
+
+    def test_short_job_description(self):
+        """Test ShortJobDescription and Jobs output"""
+
+        self.assert_identical(ShortJobDescription(job_id="id1", phase=ExecutionPhase.PENDING))
+        self.assert_identical(
+            ShortJobDescription(
+                job_id="id1",
+                type=None,
+                href="http://uri1",
+                phase=ExecutionPhase.EXECUTING,
+                run_id="runId1",
+                owner_id="",
+                creation_time=self.timestamp,
+            )
+        )
+        self.assert_identical(Jobs())
+        self.assert_identical(Jobs(version=None))
+        self.assert_identical(
+            Jobs(jobref=[ShortJobDescription(job_id=f"id{i}", phase=ExecutionPhase.QUEUED) for i in range(3)])
+        )
+
+    def test_job_summary(self):
+        """Test JobSummary output"""
+
+        self.assert_identical(JobSummary[ExampleParameters](job_id="jobId1", phase=ExecutionPhase.PENDING))
+        self.assert_identical(
+            JobSummary[ExampleParameters](
+                job_id="jobId1",
+                run_id="runId1",
+                owner_id="ownerId1",
+                phase=ExecutionPhase.ERROR,
+                quote=self.timestamp,
+                creation_time=self.timestamp,
+                start_time=self.timestamp,
+                end_time=self.timestamp,
+                execution_duration=None,
+                destruction=self.timestamp,
+                parameters=ExampleParameters(
+                    param1=Parameter(id="param1", value=True, is_post=True),
+                    param2=[
+                        Parameter(id="param2", value=1.5),
+                        Parameter(id="param2", value=42),
+                        Parameter(id="param2", value=b"bytes"),
+                        Parameter(id="param2", value="SELECT * FROM t WHERE a < 1", by_reference=None),
+                        Parameter(id="param2"),
+                    ],
+                ),
+                results=Results(results=[ResultReference(id="result1", href="http://testlink.com/")]),
+                error_summary=ErrorSummary(message="Invalid query."),
+                job_info=["", "jobInfo1", "<info/>"],
+                version=None,
+            )
+        )
+        self.assert_identical(
+            JobSummary[ExampleParameters](job_id="jobId1", phase=ExecutionPhase.PENDING, parameters=ExampleParameters())
+        )
+        self.assert_identical(JobSummary[ExampleParameters](job_id="jobId1", phase=ExecutionPhase.PENDING, results=None))
+        self.assert_identical(Job[ExampleParameters](job_id="jobId1", phase=ExecutionPhase.PENDING))
+
+    def test_packed_parameters(self):
+        """Test packed multi-valued parameters are written as repeated parameters"""
+
+        class PackedParameters(Parameters):
+            """Parameters with a packed multi-valued parameter."""
+
+            param2: Optional[PackedMultiValuedParameter] = element(tag="parameter", default=None)
+
+        packed = PackedMultiValuedParameter("param2", [1.5, 42, b"bytes", "a < b & c", None], is_post=None)
+        job = JobSummary[PackedParameters](
+            job_id="jobId1", phase=ExecutionPhase.PENDING, parameters=PackedParameters(param2=packed)
+        )
+        self.assert_identical(job)
+
+    def test_typed_parameters(self):
+        """Test typed parameters are written as plain parameters"""
+
+        class TypedParameters(Parameters):
+            """Parameters with declared value types."""
+
+            param1: Optional[TypedParameter[int]] = element(tag="parameter", default=None)
+            param2: Optional[TypedParameter[bool]] = element(tag="parameter", default=None)
+
+        job = JobSummary[TypedParameters](
+            job_id="jobId1",
+            phase=ExecutionPhase.PENDING,
+            parameters=TypedParameters(
+                param1=Parameter(id="param1", value="42"), param2=Parameter(id="param2", value=0)
+            ),
+        )
+        self.assert_identical(job)
+
+    def test_fallback(self):
+        """Test values the compiled serializer can not write are handed to pydantic-xml"""
+
+        result = ResultReference(id="result1", any_attrs={"extra": "value"})
+        self.assertEqual(to_xml(result), result.to_xml())
+
+        with self.assertRaises(ValueError):
+            to_xml(ErrorSummary(message="bad \x00 character"))
+
+        self.assertEqual(to_xml(ErrorSummary(), encoding="ISO-8859-1"), ErrorSummary().to_xml(encoding="ISO-8859-1"))
+
+    def test_unsupported_class(self):
+        """Test classes which change the document shape are rejected"""
+
+        class ExtendedJobSummary(JobSummary[ExampleParameters], tag="job"):
+            """A JobSummary with an additional field"""
+
+            extra: Optional[str] = element(tag="extra", default=None)
+
+        with self.assertRaises(TypeError):
+            compile_serializer(ExtendedJobSummary)
+        with self.assertRaises(TypeError):
+            compile_serializer(Parameter)
+        with self.assertRaises(TypeError):
+            compile_serializer(ErrorSummary).serialize(Results())
+
+    def test_iter_jobs_xml(self):
+        """Test job lists written in chunks join to the same output"""
+
+        jobrefs = [
+            ShortJobDescription(
+                job_id=f"id{i}", phase=ExecutionPhase.QUEUED, owner_id="Café", creation_time=self.timestamp
+            )
+            for i in range(5)
+        ]
+        for count in (0, 1, 2, 5):
+            for version in (UWSVersion.V1_0, None):
+                jobs = Jobs(jobref=jobrefs[:count], version=version)
+                chunks = list(iter_jobs_xml(iter(jobrefs[:count]), version, chunk_size=2))
+                self.assertEqual(len(chunks), count // 2 + 1)
+                self.assertEqual(b"".join(chunks), jobs.to_xml())
+                self.assertEqual(
+                    "".join(iter_jobs_xml(jobrefs[:count], version, encoding=str)), jobs.to_xml(encoding=str)
+                )
+                self.assertEqual(
+                    b"".join(iter_jobs_xml(jobrefs[:count], version, encoding="utf-8")), jobs.to_xml(encoding="utf-8")
+                )
+
+        with self.assertRaises(ValueError):
+            list(iter_jobs_xml(jobrefs, encoding="latin-1"))
+        with self.assertRaises(ValueError):
+            list(iter_jobs_xml([ShortJobDescription(job_id="id\x00", phase=ExecutionPhase.QUEUED)]))
+        with self.assertRaises(TypeError):
+            list(iter_jobs_xml([ErrorSummary()]))
+
+    def test_cached(self):
+        """Test serializers are compiled once per class"""
+
+        self.assertIs(compile_serializer(ErrorSummary), compile_serializer(ErrorSummary))
+
+
+class TestJobSummaryDocument(TestCase):
+    """Test incrementally updated job documents"""
+
+    timestamp = UTCTimestamp(1900, 1, 1, 1, 1, 1, tzinfo=tz.utc)
+
+    def make_document(self):
+        """Create a document for a pending job"""
+        job = JobSummary[ExampleParameters](
+            job_id="jobId1",
+            phase=ExecutionPhase.PENDING,
+            creation_time=self.timestamp,
+            parameters=ExampleParameters(param1=Parameter(id="param1", value="value1")),
+            job_info=["jobInfo1"],
+        )
+        return JobSummaryDocument(job)
+
+    def test_initial_document(self):
+        """Test the initial document matches to_xml"""
+
+        document = self.make_document()
+        self.assertEqual(document.to_xml(), document.job.to_xml())
+        self.assertEqual(document.to_xml(encoding=str), document.job.to_xml(encoding=str))
+        self.assertEqual(document.revision, 0)
+        self.assertEqual(document.etag, '"0"')
+
+    def test_updates(self):
+        """Test patched documents match a full serialization"""
+
+        document = self.make_document()
+        self.assertEqual(document.set_phase("EXECUTING"), 1)
+        self.assertEqual(document.job.phase, ExecutionPhase.EXECUTING)
+        self.assertEqual(document.to_xml(), document.job.to_xml())
+
+        document.update(start_time="2024-01-01T00:00:00Z", end_time=self.timestamp, phase=ExecutionPhase.COMPLETED)
+        self.assertEqual(document.to_xml(), document.job.to_xml())
+
+        document.append_result(ResultReference(id="result1", href="http://testlink.com/1"))
+        document.append_result({"id": "result2", "size": 10})
+        self.assertEqual(len(document.job.results.results), 2)
+        self.assertEqual(document.to_xml(), document.job.to_xml())
+
+        document.set_error_summary(ErrorSummary(message="Failed."))
+        self.assertEqual(document.to_xml(encoding="UTF-8"), document.job.to_xml(encoding="UTF-8"))
+
+        document.update(results=None)
+        document.append_result(ResultReference(id="result3"))
+        self.assertEqual(document.to_xml(), document.job.to_xml())
+        self.assertEqual(document.revision, 7)
+        self.assertEqual(document.etag, '"7"')
+
+    def test_templated_results(self):
+        """Test appending to templated results keeps them compact"""
+
+        document = self.make_document()
+        results = TemplatedResults.from_entries(
+            "http://testlink.com/{job_id}/{id}", [("result1", 10, None)], job_id="jobId1"
+        )
+        document.update(results=results)
+        document.append_result(ResultReference(id="result2", href="http://testlink.com/jobId1/result2"))
+        self.assertEqual(document.job.results.entries, [("result1", 10, None), ("result2", None, None)])
+        self.assertEqual(document.to_xml(), document.job.to_xml())
+
+        # A result not following the template needs the references to be built
+        document.update(results=TemplatedResults.from_entries("http://testlink.com/{id}", [("result1", 10, None)]))
+        document.append_result(ResultReference(id="result3", href="http://elsewhere.com/"))
+        self.assertIsNone(document.job.results.entries)
+        self.assertEqual(len(document.job.results.results), 2)
+        self.assertEqual(document.to_xml(), document.job.to_xml())
+
+    def test_invalid_update(self):
+        """Test invalid values are rejected"""
+
+        document = self.make_document()
+        with self.assertRaises(ValidationError):
+            document.set_phase("NOT_A_PHASE")
+        with self.assertRaises(ValidationError):
+            document.update(start_time="yesterday")
+
+        # A later invalid change leaves the earlier ones unapplied
+        before = document.to_xml()
+        with self.assertRaises(ValidationError):
+            document.update(phase="EXECUTING", start_time="garbage")
+        self.assertEqual(document.job.phase, ExecutionPhase.PENDING)
+        self.assertEqual(document.revision, 0)
+        self.assertEqual(document.to_xml(), before)
+        self.assertEqual(document.to_xml(), document.job.to_xml())
+
+    def test_refresh(self):
+        """Test refreshing after the job is modified directly"""
+
+        document = self.make_document()
+        document.to_xml()
+        document.job.run_id = "runId1"
+        self.assertEqual(document.refresh(), 1)
+        self.assertEqual(document.to_xml(), document.job.to_xml())
+
+    def test_fallback(self):
+        """Test documents with content the compiled serializer can not write"""
+
+        document = self.make_document()
+        document.append_result(ResultReference(id="result1", any_attrs={"extra": "value"}))
+        self.assertEqual(document.to_xml(), document.job.to_xml())
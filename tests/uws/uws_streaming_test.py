@@ -0,0 +1,120 @@
+"""Tests for streaming parsing of job parameters"""
+
+import io
+import os
+import tempfile
+from typing import Optional
+from unittest import TestCase, mock
+from xml.sax.saxutils import escape
+
+from pydantic import ValidationError
+from pydantic_xml import element
+
+from vo_models.uws import JobSummary, MultiValuedParameter, Parameter, Parameters, TypedParameter
+from vo_models.uws.serialization import to_xml
+from vo_models.uws.spool import ParameterSizeError, SpooledValue
+from vo_models.uws.streaming import max_size, parse_parameters
+
+
+class ExampleParameters(Parameters):
+    """An example subclass of Parameters."""
+
+    query: Optional[Parameter] = element(tag="parameter", default=None)
+    upload: Optional[MultiValuedParameter] = element(tag="parameter", default=None)
+    maxrec: Optional[Parameter] = element(tag="parameter", default=None)
+
+
+class TestParseParameters(TestCase):
+    """Test streaming parsing of parameters"""
+
+    query = "SELECT * FROM t WHERE id IN (" + ",".join(str(i) for i in range(5000)) + ") AND name = 'é & <x>'"
+
+    def make_parameters(self):
+        """Create parameters with one large value"""
+        return ExampleParameters(
+            query=Parameter(id="query", value=self.query),
+            upload=[
+                Parameter(id="upload", value="table1 & <more>"),
+                Parameter(id="upload", value="http://example.com/t2", by_reference=True),
+            ],
+            maxrec=Parameter(id="maxrec", value="10", is_post=True),
+        )
+
+    def test_small_values(self):
+        """Test parsing without spooling matches from_xml"""
+
+        xml = self.make_parameters().to_xml()
+        parsed = parse_parameters(ExampleParameters, xml, chunk_size=100)
+        self.assertEqual(parsed, ExampleParameters.from_xml(xml))
+
+    def test_spooled_values(self):
+        """Test values above the threshold are spooled, and written out unchanged"""
+
+        xml = self.make_parameters().to_xml()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            parsed = parse_parameters(ExampleParameters, io.BytesIO(xml), spool_threshold=1000, spool_dir=tmpdir)
+            self.assertIsInstance(parsed.query.value, SpooledValue)
+            self.assertEqual(parsed.query.value.text(), self.query)
+            self.assertEqual(parsed.query.value.size, len(self.query.encode("utf-8")))
+            self.assertEqual(b"".join(parsed.query.value.chunks(100)), self.query.encode("utf-8"))
+            self.assertEqual(parsed.upload[0].value, "table1 & <more>")
+            self.assertEqual(parsed.maxrec, Parameter(id="maxrec", value="10", is_post=True))
+
+            self.assertEqual(parsed.to_xml(), xml)
+            job = JobSummary[ExampleParameters](job_id="job1", phase="PENDING", parameters=parsed)
+            self.assertEqual(to_xml(job), job.to_xml())
+            self.assertIn('"query":{"value":"SELECT', job.model_dump_json())
+            parsed.query.value.close()
+
+    def test_size_limit(self):
+        """Test oversized jobs are rejected while reading, and spooled files are removed"""
+
+        xml = self.make_parameters().to_xml()
+        seen = []
+        parse_parameters(ExampleParameters, xml, size_limit=lambda param_id, size: seen.append((param_id, size)))
+        self.assertEqual(seen[-1][1], len(self.query) + len("table1 & <more>") + len("http://example.com/t2") + 2)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with self.assertRaises(ParameterSizeError):
+                parse_parameters(
+                    ExampleParameters,
+                    xml,
+                    spool_threshold=100,
+                    spool_dir=tmpdir,
+                    size_limit=max_size(len(self.query) + 10),
+                )
+            self.assertEqual(os.listdir(tmpdir), [])
+
+    def test_nesting_depth(self):
+        """Test deeply nested documents are rejected, and spooled files are removed"""
+
+        query = f'<uws:parameter id="query">{escape(self.query)}</uws:parameter>'
+        nested = "<uws:nested>" * 100_000 + "</uws:nested>" * 100_000
+        xml = f'<uws:parameters xmlns:uws="http://www.ivoa.net/xml/UWS/v1.0">{query}{nested}</uws:parameters>'
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with self.assertRaises(ParameterSizeError):
+                parse_parameters(ExampleParameters, xml.encode(), spool_threshold=100, spool_dir=tmpdir)
+            self.assertEqual(os.listdir(tmpdir), [])
+        shallow = xml.replace(nested, "<uws:nested>" * 10 + "</uws:nested>" * 10).encode()
+        self.assertEqual(parse_parameters(ExampleParameters, shallow).query.value, self.query)
+        with self.assertRaises(ParameterSizeError):
+            parse_parameters(ExampleParameters, shallow, max_depth=10)
+
+    def test_invalid_values(self):
+        """Test spooled files are discarded when the values fail validation"""
+
+        class TypedParameters(Parameters):
+            """Parameters with a typed value."""
+
+            query: Optional[Parameter] = element(tag="parameter", default=None)
+            maxrec: Optional[TypedParameter[int]] = element(tag="parameter", default=None)
+
+        xml = ExampleParameters(
+            query=Parameter(id="query", value=self.query), maxrec=Parameter(id="maxrec", value="ten")
+        ).to_xml()
+        closed = []
+        close = SpooledValue.close
+        with mock.patch.object(SpooledValue, "close", autospec=True, side_effect=lambda v: closed.append(close(v))):
+            with self.assertRaises(ValidationError):
+                parse_parameters(TypedParameters, xml, spool_threshold=100)
+        self.assertEqual(len(closed), 1)
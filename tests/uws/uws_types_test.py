@@ -0,0 +1,98 @@
+"""Tests for UWS simple types"""
+
+from typing import Optional
+from unittest import TestCase
+
+from pydantic_xml import element
+
+from vo_models.uws import JobSummary, Parameter, Parameters
+from vo_models.uws.serialization import JobSummaryDocument
+from vo_models.uws.types import ExecutionPhase, can_transition, validate_transition
+
+
+class TestExecutionPhase(TestCase):
+    """Tests for the ExecutionPhase state machine"""
+
+    def test_classification(self):
+        """Test terminal and active phases"""
+
+        terminal = {phase for phase in ExecutionPhase if phase.is_terminal}
+        active = {phase for phase in ExecutionPhase if phase.is_active}
+        self.assertEqual(
+            terminal,
+            {ExecutionPhase.COMPLETED, ExecutionPhase.ERROR, ExecutionPhase.ABORTED, ExecutionPhase.ARCHIVED},
+        )
+        self.assertEqual(active, {ExecutionPhase.PENDING, ExecutionPhase.QUEUED, ExecutionPhase.EXECUTING})
+
+    def test_transitions(self):
+        """Test allowed and disallowed transitions"""
+
+        self.assertTrue(can_transition(ExecutionPhase.PENDING, ExecutionPhase.QUEUED))
+        self.assertTrue(can_transition("QUEUED", "EXECUTING"))
+        self.assertTrue(can_transition("EXECUTING", "COMPLETED"))
+        self.assertTrue(can_transition("COMPLETED", "ARCHIVED"))
+        self.assertTrue(can_transition("EXECUTING", "EXECUTING"))
+        self.assertTrue(ExecutionPhase.SUSPENDED.can_transition_to("EXECUTING"))
+
+        self.assertFalse(can_transition("PENDING", "COMPLETED"))
+        self.assertFalse(can_transition("COMPLETED", "EXECUTING"))
+        self.assertFalse(can_transition("ARCHIVED", "PENDING"))
+        self.assertFalse(can_transition("PENDING", "NOT_A_PHASE"))
+        self.assertFalse(can_transition("NOT_A_PHASE", "PENDING"))
+
+        for phase in ExecutionPhase:
+            self.assertTrue(can_transition(ExecutionPhase.UNKNOWN, phase))
+            if phase is not ExecutionPhase.ARCHIVED:
+                self.assertTrue(can_transition(phase, ExecutionPhase.ARCHIVED))
+
+    def test_validate_transition(self):
+        """Test validating transitions"""
+
+        self.assertIs(validate_transition("PENDING", "QUEUED"), ExecutionPhase.QUEUED)
+        with self.assertRaises(ValueError):
+            validate_transition("COMPLETED", "EXECUTING")
+        with self.assertRaises(ValueError):
+            validate_transition("PENDING", "NOT_A_PHASE")
+
+
+class TestPhaseTransitionEnforcement(TestCase):
+    """Tests for enforcing phase transitions on JobSummary"""
+
+    class TestParameters(Parameters):
+        """A test subclass of Parameters."""
+
+        param1: Optional[Parameter] = element(tag="parameter", default=None)
+
+    class StrictJobSummary(JobSummary[TestParameters]):
+        """A job summary which enforces phase transitions."""
+
+        enforce_phase_transitions = True
+
+    def test_not_enforced_by_default(self):
+        """Test phases may be assigned freely by default"""
+
+        job = JobSummary[self.TestParameters](job_id="jobId1", phase=ExecutionPhase.COMPLETED)
+        job.phase = ExecutionPhase.EXECUTING
+        self.assertEqual(job.phase, ExecutionPhase.EXECUTING)
+
+    def test_enforced(self):
+        """Test illegal phase assignments are rejected"""
+
+        job = self.StrictJobSummary(job_id="jobId1", phase=ExecutionPhase.PENDING)
+        job.phase = "QUEUED"
+        self.assertIs(job.phase, ExecutionPhase.QUEUED)
+        job.phase = ExecutionPhase.EXECUTING
+        job.phase = ExecutionPhase.COMPLETED
+        with self.assertRaises(ValueError):
+            job.phase = ExecutionPhase.EXECUTING
+        self.assertEqual(job.phase, ExecutionPhase.COMPLETED)
+
+    def test_enforced_in_document(self):
+        """Test cached documents respect phase enforcement"""
+
+        document = JobSummaryDocument(self.StrictJobSummary(job_id="jobId1", phase=ExecutionPhase.PENDING))
+        with self.assertRaises(ValueError):
+            document.set_phase(ExecutionPhase.COMPLETED)
+        self.assertEqual(document.revision, 0)
+        document.set_phase(ExecutionPhase.EXECUTING)
+        self.assertEqual(document.to_xml(), document.job.to_xml())
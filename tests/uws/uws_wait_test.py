@@ -0,0 +1,117 @@
+"""Tests for UWS blocking request support"""
+
+import asyncio
+from unittest import IsolatedAsyncioTestCase
+
+from vo_models.uws import JobSummary, Parameters
+from vo_models.uws.types import ExecutionPhase
+from vo_models.uws.wait import InMemoryPhaseNotifier, wait_for_phase_change
+
+
+class TestInMemoryPhaseNotifier(IsolatedAsyncioTestCase):
+    """Tests for the in-memory phase notifier"""
+
+    async def test_wakes_on_change(self):
+        """Test waiters wake as soon as the phase changes"""
+
+        notifier = InMemoryPhaseNotifier()
+        await notifier.notify("job1", ExecutionPhase.QUEUED)
+
+        waiters = [asyncio.create_task(notifier.wait("job1", ExecutionPhase.QUEUED, timeout=10)) for _ in range(3)]
+        await asyncio.sleep(0)
+        self.assertFalse(any(waiter.done() for waiter in waiters))
+
+        await notifier.notify("job1", "EXECUTING")
+        results = await asyncio.wait_for(asyncio.gather(*waiters), timeout=1)
+        self.assertEqual(results, [ExecutionPhase.EXECUTING] * 3)
+
+    async def test_same_phase_does_not_wake(self):
+        """Test reporting an unchanged phase does not wake waiters"""
+
+        notifier = InMemoryPhaseNotifier()
+        await notifier.notify("job1", ExecutionPhase.EXECUTING)
+        waiter = asyncio.create_task(notifier.wait("job1", ExecutionPhase.EXECUTING, timeout=10))
+        await asyncio.sleep(0)
+        await notifier.notify("job1", ExecutionPhase.EXECUTING)
+        await asyncio.sleep(0)
+        self.assertFalse(waiter.done())
+        await notifier.notify("job1", ExecutionPhase.COMPLETED)
+        self.assertEqual(await waiter, ExecutionPhase.COMPLETED)
+
+    async def test_timeout(self):
+        """Test waiting times out with the unchanged phase"""
+
+        notifier = InMemoryPhaseNotifier()
+        phase = await notifier.wait("job1", ExecutionPhase.EXECUTING, timeout=0.01)
+        self.assertEqual(phase, ExecutionPhase.EXECUTING)
+
+    async def test_already_changed(self):
+        """Test waiting returns immediately if the phase already differs"""
+
+        notifier = InMemoryPhaseNotifier()
+        await notifier.notify("job1", ExecutionPhase.COMPLETED)
+        phase = await asyncio.wait_for(notifier.wait("job1", ExecutionPhase.EXECUTING), timeout=1)
+        self.assertEqual(phase, ExecutionPhase.COMPLETED)
+
+    async def test_discard(self):
+        """Test discarding a job wakes its waiters"""
+
+        notifier = InMemoryPhaseNotifier()
+        await notifier.notify("job1", ExecutionPhase.EXECUTING)
+        waiter = asyncio.create_task(notifier.wait("job1", ExecutionPhase.EXECUTING))
+        await asyncio.sleep(0)
+        await notifier.discard("job1")
+        self.assertIsNone(await asyncio.wait_for(waiter, timeout=1))
+        self.assertIsNone(notifier.phase("job1"))
+
+
+    async def test_no_leaks(self):
+        """Test waiting on unknown jobs and timing out leave nothing behind"""
+
+        notifier = InMemoryPhaseNotifier()
+        await notifier.wait("job1", ExecutionPhase.EXECUTING, timeout=0.01)
+        self.assertIsNone(notifier.phase("job1"))
+        self.assertEqual(notifier._events, {})  # pylint: disable=protected-access
+
+        waiters = [asyncio.create_task(notifier.wait("job2", ExecutionPhase.QUEUED, timeout=t)) for t in (0.01, 10)]
+        await asyncio.sleep(0.02)
+        self.assertIn("job2", notifier._events)  # pylint: disable=protected-access
+        waiters[1].cancel()
+        await asyncio.gather(*waiters, return_exceptions=True)
+        self.assertEqual(notifier._events, {})  # pylint: disable=protected-access
+
+    async def test_first_report(self):
+        """Test the first report of an unknown job only wakes waiters if the phase differs"""
+
+        notifier = InMemoryPhaseNotifier()
+        waiter = asyncio.create_task(notifier.wait("job1", ExecutionPhase.QUEUED, timeout=10))
+        await asyncio.sleep(0)
+        await notifier.notify("job1", ExecutionPhase.QUEUED)
+        await asyncio.sleep(0)
+        self.assertFalse(waiter.done())
+        await notifier.notify("job1", ExecutionPhase.EXECUTING)
+        self.assertEqual(await asyncio.wait_for(waiter, timeout=1), ExecutionPhase.EXECUTING)
+
+
+class TestWaitForPhaseChange(IsolatedAsyncioTestCase):
+    """Tests for the UWS 1.1 blocking rules"""
+
+    async def test_blocking_rules(self):
+        """Test when requests block"""
+
+        notifier = InMemoryPhaseNotifier()
+        job = JobSummary[Parameters](job_id="job1", phase=ExecutionPhase.EXECUTING)
+        await notifier.notify_job(job)
+
+        # Terminal phases and non-matching PHASE parameters return immediately
+        completed = JobSummary[Parameters](job_id="job2", phase=ExecutionPhase.COMPLETED)
+        self.assertEqual(await wait_for_phase_change(notifier, completed, None), ExecutionPhase.COMPLETED)
+        self.assertEqual(
+            await wait_for_phase_change(notifier, job, None, phase=ExecutionPhase.QUEUED), ExecutionPhase.EXECUTING
+        )
+
+        waiter = asyncio.create_task(wait_for_phase_change(notifier, job, -1, phase="EXECUTING"))
+        await asyncio.sleep(0)
+        self.assertFalse(waiter.done())
+        await notifier.notify("job1", ExecutionPhase.ERROR)
+        self.assertEqual(await asyncio.wait_for(waiter, timeout=1), ExecutionPhase.ERROR)
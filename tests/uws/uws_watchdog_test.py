@@ -0,0 +1,128 @@
+"""Tests for the execution duration watchdog"""
+
+import asyncio
+from datetime import timedelta
+from unittest import IsolatedAsyncioTestCase
+
+from tests.uws.clock import START, FakeClock
+from vo_models.uws import JobSummary
+from vo_models.uws.serialization import to_xml
+from vo_models.uws.types import ErrorType, ExecutionPhase
+from vo_models.uws.watchdog import ExecutionWatchdog
+from vo_models.voresource.types import UTCTimestamp
+
+
+def executing_job(job_id, execution_duration=60, start_time=START):
+    """Build an executing job"""
+    return JobSummary(
+        job_id=job_id, phase=ExecutionPhase.EXECUTING, start_time=start_time, execution_duration=execution_duration
+    )
+
+
+class TestExecutionWatchdog(IsolatedAsyncioTestCase):
+    """Tests for the execution duration watchdog"""
+
+    async def asyncSetUp(self):
+        self.clock = FakeClock()
+        self.aborted = []
+        self.watchdog = ExecutionWatchdog(self.aborted.append, clock=self.clock)
+
+    async def test_aborts_overrunning_jobs(self):
+        """Test jobs past their duration are aborted with an error summary"""
+
+        job1, job2 = executing_job("job1", 60), executing_job("job2", 120)
+        self.watchdog.watch(job1)
+        self.watchdog.watch(job2)
+        self.assertEqual(len(self.watchdog), 2)
+        self.assertEqual(self.watchdog.deadline("job1"), START + timedelta(seconds=60))
+
+        self.clock.advance(59)
+        self.assertEqual(await self.watchdog.check(), 0)
+        self.clock.advance(1)
+        self.assertEqual(await self.watchdog.check(), 1)
+        self.assertEqual(self.aborted, [job1])
+        self.assertNotIn("job1", self.watchdog)
+        self.assertEqual(job1.phase, ExecutionPhase.ABORTED)
+        self.assertEqual(job1.end_time, START + timedelta(seconds=60))
+        self.assertIsInstance(job1.end_time, UTCTimestamp)
+        self.assertIn(b"<uws:endTime>2024-01-01T00:01:00.000Z</uws:endTime>", to_xml(job1))
+        self.assertEqual(job1.error_summary.type, ErrorType.FATAL)
+        self.assertIn("60 seconds", job1.error_summary.message)
+        self.assertEqual(job2.phase, ExecutionPhase.EXECUTING)
+
+    async def test_unwatched_jobs(self):
+        """Test jobs without an execution deadline are not watched"""
+
+        self.watchdog.watch(executing_job("job1", 0))
+        self.watchdog.watch(JobSummary(job_id="job2", phase=ExecutionPhase.QUEUED, execution_duration=60))
+        self.assertEqual(len(self.watchdog), 0)
+
+        job = executing_job("job3")
+        self.watchdog.watch(job)
+        job.phase = ExecutionPhase.COMPLETED
+        self.watchdog.watch(job)
+        self.assertNotIn("job3", self.watchdog)
+        self.watchdog.unwatch("unknown")
+
+    async def test_changed_jobs(self):
+        """Test jobs changed without being watched again are checked before aborting"""
+
+        finished, extended = executing_job("job1"), executing_job("job2")
+        self.watchdog.watch(finished)
+        self.watchdog.watch(extended)
+        finished.phase = ExecutionPhase.COMPLETED
+        extended.execution_duration = 120
+
+        self.clock.advance(60)
+        await self.watchdog.check()
+        self.assertEqual(self.aborted, [])
+        self.assertEqual(finished.phase, ExecutionPhase.COMPLETED)
+        self.assertEqual(self.watchdog.deadline("job2"), START + timedelta(seconds=120))
+        self.clock.advance(60)
+        await self.watchdog.check()
+        self.assertEqual(self.aborted, [extended])
+
+    async def test_task(self):
+        """Test the watchdog task aborts jobs with a coroutine callback"""
+
+        aborted = asyncio.Event()
+
+        async def on_abort(job):
+            self.aborted.append(job)
+            aborted.set()
+
+        watchdog = ExecutionWatchdog(on_abort, clock=self.clock, error_type=ErrorType.TRANSIENT)
+        watchdog.start()
+        try:
+            job = executing_job("job1", 60, START - timedelta(seconds=60))
+            watchdog.watch(job)
+            await asyncio.wait_for(aborted.wait(), timeout=1)
+        finally:
+            await watchdog.stop()
+        self.assertEqual(self.aborted, [job])
+        self.assertEqual(job.error_summary.type, ErrorType.TRANSIENT)
+
+    async def test_callback_errors(self):
+        """Test errors raised by the callback are logged and the watchdog keeps running"""
+
+        aborted = asyncio.Event()
+
+        def on_abort(job):
+            if job.job_id == "job1":
+                raise RuntimeError("Can not stop the job")
+            aborted.set()
+
+        watchdog = ExecutionWatchdog(on_abort, clock=self.clock)
+        watchdog.start()
+        try:
+            with self.assertLogs("vo_models.uws.watchdog", level="ERROR") as logs:
+                watchdog.watch(executing_job("job1", 60, START - timedelta(seconds=60)))
+                watchdog.watch(executing_job("job2", 60, START - timedelta(seconds=30)))
+                await asyncio.sleep(0)
+                self.clock.advance(30)
+                watchdog.watch(executing_job("job3", 60, START - timedelta(seconds=60)))
+                await asyncio.wait_for(aborted.wait(), timeout=1)
+        finally:
+            await watchdog.stop()
+        self.assertIn("job1", logs.output[0])
+        self.assertEqual(len(watchdog), 0)
@@ -0,0 +1,117 @@
+"""Tests for memory-mapped tableset snapshots"""
+
+import os
+import tempfile
+from unittest import TestCase
+
+from vo_models.utils.snapshot import StaleSnapshotError
+from vo_models.vodataservice import FKColumn, ForeignKey, Table, TableParam, TableSchema, TableSet
+from vo_models.vodataservice.snapshot import TableSetSnapshot, write_tableset_snapshot
+from vo_models.vosi.tables import VOSITableSet
+
+
+class TestTableSetSnapshot(TestCase):
+    """Tests for writing and reading tableset snapshots"""
+
+    tableset = VOSITableSet(
+        tableset_schema=[
+            TableSchema(
+                schema_name="ivoa",
+                title="IVOA tables",
+                table=[
+                    Table(
+                        table_name="ivoa.obscore",
+                        description="Observation core",
+                        column=[TableParam(column_name=f"col{i}", datatype="double") for i in range(50)],
+                    )
+                ],
+            ),
+            TableSchema(
+                schema_name="tap_schema",
+                table=[
+                    Table(table_name="tap_schema.schemas", column=[TableParam(column_name="schema_name")]),
+                    Table(
+                        table_name="tap_schema.tables",
+                        column=[TableParam(column_name="schema_name"), TableParam(column_name="table_name")],
+                        foreign_key=[
+                            ForeignKey(
+                                target_table="tap_schema.schemas",
+                                fk_column=[FKColumn(from_column="schema_name", target_column="schema_name")],
+                            )
+                        ],
+                    ),
+                    Table(table_name="tap_schema.empty"),
+                ],
+            ),
+        ]
+    )
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.path = os.path.join(self.tmpdir.name, "tables.snapshot")
+        write_tableset_snapshot(self.tableset, self.path)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_round_trip(self):
+        """Test a snapshot decodes back to an equal tableset"""
+
+        with TableSetSnapshot(self.path, VOSITableSet) as snapshot:
+            loaded = snapshot.to_model()
+        self.assertIsInstance(loaded, VOSITableSet)
+        self.assertEqual(loaded, self.tableset)
+        self.assertEqual(loaded.to_xml(), self.tableset.to_xml())
+
+    def test_lazy_views(self):
+        """Test tables and columns are accessible individually"""
+
+        with TableSetSnapshot(self.path, VOSITableSet) as snapshot:
+            self.assertEqual([schema.name for schema in snapshot.schemas], ["ivoa", "tap_schema"])
+            self.assertEqual(snapshot.schemas[0].metadata.title, "IVOA tables")
+            self.assertEqual(len(snapshot), 4)
+            self.assertEqual([table.name for table in snapshot][:2], ["ivoa.obscore", "tap_schema.schemas"])
+
+            obscore = snapshot.table("ivoa.obscore")
+            self.assertEqual(obscore.metadata.description, "Observation core")
+            self.assertEqual(obscore.metadata.column, [])
+            self.assertEqual(len(obscore.columns), 50)
+            self.assertEqual(obscore.columns[7], self.tableset.tableset_schema[0].table[0].column[7])
+            self.assertEqual(obscore.columns[-1].column_name, "col49")
+            self.assertEqual([column.column_name for column in obscore.columns[1:3]], ["col1", "col2"])
+            self.assertEqual(obscore.column("col42").column_name, "col42")
+            self.assertIsNone(obscore.column("missing"))
+            with self.assertRaises(IndexError):
+                obscore.columns[50]  # pylint: disable=pointless-statement
+
+            tables = snapshot.table("tap_schema.tables")
+            self.assertEqual(tables.metadata.foreign_key[0].target_table, "tap_schema.schemas")
+            self.assertEqual(len(snapshot.table("tap_schema.empty").columns), 0)
+            self.assertIsNone(snapshot.table("missing"))
+
+            self.assertEqual(snapshot.schemas[1].to_model(), self.tableset.tableset_schema[1])
+
+    def test_decoded_models_outlive_snapshot(self):
+        """Test decoded metadata remains usable once the snapshot is closed"""
+
+        snapshot = TableSetSnapshot(self.path, VOSITableSet)
+        table = snapshot.table("ivoa.obscore")
+        metadata = table.metadata
+        snapshot.close()
+        self.assertEqual(table.metadata, metadata)
+        with self.assertRaises(ValueError):
+            table.columns[0]  # pylint: disable=pointless-statement
+
+    def test_rejects_other_model(self):
+        """Test opening a snapshot with the wrong tableset class"""
+
+        with self.assertRaises(StaleSnapshotError):
+            TableSetSnapshot(self.path, TableSet)
+
+    def test_rejects_other_files(self):
+        """Test opening a file that is not a tableset snapshot"""
+
+        with open(self.path, "wb") as f:
+            f.write(b"<tableset/>")
+        with self.assertRaises(ValueError):
+            TableSetSnapshot(self.path, VOSITableSet)
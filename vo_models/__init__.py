@@ -0,0 +1,19 @@
+"""Pydantic-xml models for IVOA standards. Subpackages are imported when first accessed."""
+from vo_models._lazy import lazy_exports
+
+__getattr__, __dir__, _ = lazy_exports(
+    __name__,
+    submodules=[
+        "adql",
+        "registry_interfaces",
+        "stc",
+        "tapregext",
+        "utils",
+        "uws",
+        "vodataservice",
+        "voregistry",
+        "voresource",
+        "vosi",
+        "xlink",
+    ],
+)
@@ -0,0 +1,41 @@
+"""Lazy loading of package namespaces.
+
+Package ``__init__`` modules re-export their models without importing them: the defining submodule (and with it
+pydantic-xml, lxml and the model classes) is only imported when one of its names is first accessed.
+"""
+from importlib import import_module
+from typing import Any, Callable, Iterable, Mapping, Optional
+
+
+def lazy_exports(
+    package: str, exports: Optional[Mapping[str, Iterable[str]]] = None, submodules: Iterable[str] = ()
+) -> tuple[Callable[[str], Any], Callable[[], list[str]], list[str]]:
+    """Create the module ``__getattr__``, ``__dir__`` and ``__all__`` for a lazily loaded package.
+
+    Args:
+        package: The ``__name__`` of the package.
+        exports: For each submodule (relative to the package, e.g. ``".models"``), the names it provides.
+        submodules: Subpackages or submodules to make available as attributes of the package when first accessed.
+
+    Returns:
+        The ``__getattr__`` function, ``__dir__`` function and ``__all__`` list for the package.
+    """
+    origins = {name: module for module, names in (exports or {}).items() for name in names}
+    submodules = frozenset(submodules)
+    namespace = import_module(package).__dict__
+
+    def __getattr__(name: str) -> Any:
+        if name in origins:
+            value = getattr(import_module(origins[name], package), name)
+        elif name in submodules:
+            value = import_module(f".{name}", package)
+        else:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        # Cache in the package namespace, so later lookups don't reach __getattr__.
+        namespace[name] = value
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted(set(namespace) | set(origins) | submodules)
+
+    return __getattr__, __dir__, list(origins)
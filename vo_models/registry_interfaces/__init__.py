@@ -1,8 +1,14 @@
 """IVOA Registry Interfaces v1.0 Pydantic-XML models"""
+from typing import TYPE_CHECKING
 
-from vo_models.registry_interfaces.models import Resource, VOResources
+from vo_models._lazy import lazy_exports
 
-__all__ = [
-    "Resource",
-    "VOResources",
-]
+if TYPE_CHECKING:
+    from vo_models.registry_interfaces.models import Resource, VOResources
+
+__getattr__, __dir__, __all__ = lazy_exports(
+    __name__,
+    {
+        ".models": ["Resource", "VOResources"],
+    },
+)
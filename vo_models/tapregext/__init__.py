@@ -3,31 +3,40 @@ Module containing VO TapRegExt classes.
 
 IVOA UWS Spec: https://ivoa.net/documents/TAPRegExt/20120827/REC-TAPRegExt-1.0.html
 """
+from typing import TYPE_CHECKING
 
-from vo_models.tapregext.models import (
-    DataLimit,
-    DataLimits,
-    DataModelType,
-    Language,
-    LanguageFeature,
-    LanguageFeatureList,
-    OutputFormat,
-    TableAccess,
-    TimeLimits,
-    UploadMethod,
-    Version,
-)
+from vo_models._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from vo_models.tapregext.models import (
+        DataLimit,
+        DataLimits,
+        DataModelType,
+        Language,
+        LanguageFeature,
+        LanguageFeatureList,
+        OutputFormat,
+        TableAccess,
+        TimeLimits,
+        UploadMethod,
+        Version,
+    )
 
-__all__ = [
-    "DataLimit",
-    "DataLimits",
-    "DataModelType",
-    "Language",
-    "LanguageFeature",
-    "LanguageFeatureList",
-    "OutputFormat",
-    "TableAccess",
-    "TimeLimits",
-    "UploadMethod",
-    "Version",
-]
+__getattr__, __dir__, __all__ = lazy_exports(
+    __name__,
+    {
+        ".models": [
+            "DataLimit",
+            "DataLimits",
+            "DataModelType",
+            "Language",
+            "LanguageFeature",
+            "LanguageFeatureList",
+            "OutputFormat",
+            "TableAccess",
+            "TimeLimits",
+            "UploadMethod",
+            "Version",
+        ],
+    },
+)
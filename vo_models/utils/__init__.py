@@ -0,0 +1,18 @@
+"""Helpers for working with vo-models models at scale."""
+from typing import TYPE_CHECKING
+
+from vo_models._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from vo_models.utils.batch import BatchSerialization, serialize_many
+    from vo_models.utils.deferred import DeferredXmlModel
+    from vo_models.utils.json_codec import from_json, to_json
+
+__getattr__, __dir__, __all__ = lazy_exports(
+    __name__,
+    {
+        ".batch": ["BatchSerialization", "serialize_many"],
+        ".deferred": ["DeferredXmlModel"],
+        ".json_codec": ["from_json", "to_json"],
+    },
+)
@@ -0,0 +1,53 @@
+"""Deferred schema building for rarely used models.
+
+pydantic builds a model's core schema and validator, and pydantic-xml its XML serializer, when the model class is
+defined. For the many models a given service never uses, that work is wasted at import time. Models deriving from
+`DeferredXmlModel` postpone it until the model is first validated, parsed, serialized, or used in another model.
+"""
+from typing import Any
+
+from pydantic import ConfigDict, GetCoreSchemaHandler
+from pydantic_core import CoreSchema
+from pydantic_xml import BaseXmlModel
+
+# Deferred models currently being built, so their own schema generation doesn't trigger another build.
+_building: set[type] = set()
+
+
+class DeferredXmlModel(BaseXmlModel, __xml_abstract__=True):
+    """Base for pydantic-xml models whose schema and serializer are built on first use.
+
+    List it after the model's other bases, e.g. ``class Registry(vr.Service, DeferredXmlModel, ...)``, so the tag,
+    namespace and nsmap are still inherited from them. Subclasses of a deferred model are deferred as well.
+    """
+
+    model_config = ConfigDict(defer_build=True)
+
+    @classmethod
+    def model_rebuild(cls, **kwargs: Any) -> Any:
+        _building.add(cls)
+        try:
+            return super().model_rebuild(**kwargs)
+        finally:
+            _building.discard(cls)
+
+    @classmethod
+    def _ensure_built(cls) -> None:
+        if cls.__xml_serializer__ is None and cls not in _building:
+            cls.model_rebuild()
+
+    @classmethod
+    def __get_pydantic_core_schema__(cls, source: Any, handler: GetCoreSchemaHandler) -> CoreSchema:
+        # A model using this one as a field type reads its XML serializer directly, so build it now.
+        if source is cls and not cls.__pydantic_complete__:
+            cls._ensure_built()
+        return handler(source)
+
+    @classmethod
+    def from_xml_tree(cls, root: Any, *args: Any, **kwargs: Any) -> Any:
+        cls._ensure_built()
+        return super().from_xml_tree(root, *args, **kwargs)
+
+    def to_xml_tree(self, **kwargs: Any) -> Any:
+        type(self)._ensure_built()
+        return super().to_xml_tree(**kwargs)
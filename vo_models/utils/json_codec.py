@@ -0,0 +1,159 @@
+"""JSON encoding and decoding of vo-models models using the XML element and attribute names.
+
+The XML names are read from the pydantic-xml field declarations, rather than declared as pydantic aliases, so that
+``model_dump(by_alias=True)`` is unchanged. Encoding and decoding use a serializer and a validator built once per model
+class from the model's core schema, with each field renamed to its XML name; decoding accepts either the XML names or
+the field names.
+
+Decoding validates the fields but does not call the models' custom ``__init__`` methods, so it round-trips the output
+of `to_json` rather than standing in for the constructors: defaults and normalisation that a constructor applies
+(e.g. the ``char(*)`` data type `vo_models.vodataservice.TableParam` fills in) are not applied to missing keys.
+"""
+import typing
+from functools import lru_cache
+from typing import Any, Callable, Iterator, Optional, Type, TypeVar
+
+from pydantic import BaseModel, SerializerFunctionWrapHandler
+from pydantic_core import SchemaSerializer, SchemaValidator, core_schema
+from pydantic_xml import BaseXmlModel
+from pydantic_xml.model import EntityLocation, XmlEntityInfo
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+def _model_builder(model_cls: Type[BaseModel]) -> Callable[[tuple], BaseModel]:
+    """Create a function building a model instance from the output of a validated ``model-fields`` schema."""
+
+    def build(value: tuple) -> BaseModel:
+        fields, extra, fields_set = value
+        instance = model_cls.__new__(model_cls)
+        object.__setattr__(instance, "__dict__", fields)
+        object.__setattr__(instance, "__pydantic_extra__", extra)
+        object.__setattr__(instance, "__pydantic_fields_set__", fields_set)
+        object.__setattr__(instance, "__pydantic_private__", None)
+        if model_cls.__pydantic_post_init__:
+            instance.model_post_init(None)
+        return instance
+
+    return build
+
+
+@lru_cache(maxsize=None)
+def _xml_names(model_cls: Type[BaseModel]) -> dict[str, str]:
+    """The XML element or attribute names of the fields of a model that differ from the field names."""
+    names = {}
+    for name, field in model_cls.model_fields.items():
+        info = next((info for info in field.metadata if isinstance(info, XmlEntityInfo)), None)
+        if info is None:
+            continue
+        xml_name = info.path
+        if xml_name is None and info.location is EntityLocation.ELEMENT:
+            # Elements holding models without a tag of their own are named after the model's tag
+            xml_name = next((arg.__xml_tag__ for arg in _types(field.annotation) if _is_xml_model(arg)), None)
+        if xml_name and xml_name != name:
+            names[name] = xml_name
+    return names
+
+
+def _types(annotation: Any) -> Iterator[Any]:
+    """The types an annotation is made of, e.g. ``ResultReference`` for ``Optional[list[ResultReference]]``."""
+    yield annotation
+    for arg in typing.get_args(annotation):
+        yield from _types(arg)
+
+
+def _is_xml_model(value: Any) -> bool:
+    return isinstance(value, type) and issubclass(value, BaseXmlModel) and value.__xml_tag__ is not None
+
+
+def _dump_fields(model: BaseModel, serialize: SerializerFunctionWrapHandler) -> Any:
+    return serialize(model.__dict__)
+
+
+def _fields_serialization(fields_schema: Any) -> Any:
+    """A schema writing the ``__dict__`` of a model as its ``model-fields`` schema would, outside of a model."""
+    return core_schema.typed_dict_schema(
+        {
+            name: core_schema.typed_dict_field(
+                field["schema"],
+                required=True,
+                serialization_alias=field.get("serialization_alias"),
+                serialization_exclude=field.get("serialization_exclude"),
+            )
+            for name, field in fields_schema["fields"].items()
+        }
+    )
+
+
+def _xml_schema(schema: Any, model_cls: Optional[Type[BaseModel]] = None) -> Any:
+    """Rewrite a core schema so that every field is written with, and also read from, its XML name."""
+    if isinstance(schema, list):
+        return [_xml_schema(value, model_cls) for value in schema]
+    if not isinstance(schema, dict):
+        return schema
+
+    if schema.get("type") == "model":
+        model_cls = schema["cls"]
+    schema = {key: _xml_schema(value, model_cls) for key, value in schema.items()}
+    if schema.get("type") == "model-fields" and model_cls is not None:
+        for name, xml_name in _xml_names(model_cls).items():
+            field = schema["fields"].get(name)
+            if field is not None:
+                field["serialization_alias"] = xml_name
+                field["validation_alias"] = [[xml_name], [name]]
+    elif schema.get("type") == "model" and not schema.get("root_model"):
+        # pydantic-core reuses the model class's own validator and serializer for model schemas, which would ignore
+        # the XML names, so validate and write the fields ourselves. Custom __init__ methods, which massage
+        # constructor and XML input (e.g. regrouping UWS parameters by id), are not needed as JSON input is already
+        # in the model's shape.
+        fields_schema = schema["schema"]
+        schema = core_schema.no_info_after_validator_function(
+            _model_builder(schema["cls"]),
+            fields_schema,
+            ref=schema.get("ref"),
+            serialization=core_schema.wrap_serializer_function_ser_schema(
+                _dump_fields, schema=_fields_serialization(fields_schema)
+            ),
+        )
+    return schema
+
+
+@lru_cache(maxsize=None)
+def _json_codec(model_cls: Type[BaseModel]) -> tuple[SchemaSerializer, SchemaValidator]:
+    schema = _xml_schema(model_cls.__pydantic_core_schema__)
+    return SchemaSerializer(schema), SchemaValidator(schema)
+
+
+def to_json(model: BaseModel, *, indent: int | None = None, exclude_none: bool = False) -> bytes:
+    """Encode a model as JSON, using the XML element and attribute names as keys.
+
+    Args:
+        model: The model to encode.
+        indent: If given, pretty-print the output with this indentation.
+        exclude_none: Leave out fields whose value is None.
+
+    Returns:
+        bytes: The JSON document.
+    """
+    return _json_codec(type(model))[0].to_json(model, indent=indent, by_alias=True, exclude_none=exclude_none)
+
+
+def from_json(model_cls: Type[ModelT], data: str | bytes | bytearray) -> ModelT:
+    """Decode a model from JSON produced by `to_json`.
+
+    Keys may be either the XML names or the Python field names. Custom ``__init__`` methods are not called, so defaults
+    they apply are not filled in for missing keys: ``from_json(TableParam, '{"name": "a"}')`` has no data type, while
+    ``TableParam(name="a")`` has ``char(*)``. To build a model from other JSON, pass the decoded object to the model's
+    constructor instead.
+
+    Args:
+        model_cls: The model class to decode.
+        data: The JSON document.
+
+    Raises:
+        pydantic.ValidationError: If the document is not valid for the model.
+
+    Returns:
+        The decoded model.
+    """
+    return _json_codec(model_cls)[1].validate_json(data)
@@ -0,0 +1,161 @@
+"""Binary snapshots of parsed models, for caching large documents between process restarts.
+
+Parsing a large ``/tables`` or registry document with ``from_xml`` validates every element. A snapshot stores the
+already-validated model using pickle protocol 5, which loads without re-running validation. Each snapshot records a
+fingerprint of the model class's field layout and the vo-models version, so snapshots written before a model change
+are rejected rather than loaded into an incompatible class.
+
+Snapshots are pickles: only load snapshots your own services wrote.
+"""
+import hashlib
+import json
+import pickle
+import re
+import struct
+import typing
+from functools import lru_cache
+from importlib import metadata
+from os import PathLike
+from typing import BinaryIO, Type, TypeVar
+
+from pydantic import BaseModel
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+SNAPSHOT_MAGIC = b"VOMSNAP\x00"
+SNAPSHOT_FORMAT_VERSION = 1
+
+_HEADER_LENGTH = struct.Struct("<I")
+# Annotations may include validator functions, whose repr includes a per-process memory address.
+_ADDRESS = re.compile(r" at 0x[0-9a-fA-F]+")
+
+
+class StaleSnapshotError(ValueError):
+    """Raised when a snapshot was written by a different version of a model, or for a different model."""
+
+
+def _package_version() -> str:
+    try:
+        return metadata.version("vo-models")
+    except metadata.PackageNotFoundError:
+        return "unknown"
+
+
+def _describe(model_cls: Type[BaseModel], seen: set[type], parts: list[str]) -> None:
+    """Append a description of a model class's fields, and of any models they contain, to ``parts``."""
+    if model_cls in seen:
+        return
+    seen.add(model_cls)
+    parts.append(f"{model_cls.__module__}.{model_cls.__qualname__}")
+    nested = []
+    for name, field in model_cls.model_fields.items():
+        parts.append(_ADDRESS.sub("", f"{name}:{field.annotation!r}:{field.serialization_alias}"))
+        nested.append(field.annotation)
+    while nested:
+        annotation = nested.pop()
+        if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+            _describe(annotation, seen, parts)
+        else:
+            nested.extend(typing.get_args(annotation))
+
+
+@lru_cache(maxsize=None)
+def model_fingerprint(model_cls: Type[BaseModel]) -> str:
+    """A fingerprint of a model class's layout, including nested models and the vo-models version.
+
+    Args:
+        model_cls: The model class.
+
+    Returns:
+        str: A hex digest that changes whenever the class (or a model it contains) changes shape.
+    """
+    parts = [_package_version()]
+    _describe(model_cls, set(), parts)
+    return hashlib.sha256("\n".join(parts).encode("utf-8")).hexdigest()
+
+
+def dumps_snapshot(model: BaseModel) -> bytes:
+    """Write a model to a binary snapshot.
+
+    Args:
+        model: The model to store, e.g. a `VOSITableSet` or `VOResources` parsed from XML.
+
+    Returns:
+        bytes: The snapshot.
+    """
+    model_cls = type(model)
+    header = json.dumps(
+        {
+            "format": SNAPSHOT_FORMAT_VERSION,
+            "model": f"{model_cls.__module__}.{model_cls.__qualname__}",
+            "fingerprint": model_fingerprint(model_cls),
+        }
+    ).encode("utf-8")
+    payload = pickle.dumps(model, protocol=5)
+    return b"".join((SNAPSHOT_MAGIC, _HEADER_LENGTH.pack(len(header)), header, payload))
+
+
+def loads_snapshot(model_cls: Type[ModelT], data: bytes | bytearray | memoryview) -> ModelT:
+    """Load a model from a binary snapshot.
+
+    Args:
+        model_cls: The expected model class.
+        data: The snapshot, as written by `dumps_snapshot`.
+
+    Raises:
+        StaleSnapshotError: If the snapshot is for another model class or an incompatible version of this one.
+        ValueError: If the data is not a snapshot.
+
+    Returns:
+        The stored model.
+    """
+    data = memoryview(data)
+    magic_end = len(SNAPSHOT_MAGIC)
+    if bytes(data[:magic_end]) != SNAPSHOT_MAGIC or len(data) < magic_end + _HEADER_LENGTH.size:
+        raise ValueError("Not a vo-models snapshot")
+    (header_length,) = _HEADER_LENGTH.unpack_from(data, magic_end)
+    header_end = magic_end + _HEADER_LENGTH.size + header_length
+    header = json.loads(bytes(data[magic_end + _HEADER_LENGTH.size : header_end]))
+
+    if header.get("format") != SNAPSHOT_FORMAT_VERSION:
+        raise StaleSnapshotError(f"Unsupported snapshot format {header.get('format')}")
+    if header.get("model") != f"{model_cls.__module__}.{model_cls.__qualname__}":
+        raise StaleSnapshotError(f"Snapshot is for {header.get('model')}, not {model_cls.__qualname__}")
+    if header.get("fingerprint") != model_fingerprint(model_cls):
+        raise StaleSnapshotError(f"Snapshot was written for a different version of {model_cls.__qualname__}")
+
+    return pickle.loads(data[header_end:])
+
+
+def dump_snapshot(model: BaseModel, file: str | PathLike | BinaryIO) -> None:
+    """Write a model's snapshot to a file path or binary file object.
+
+    Args:
+        model: The model to store.
+        file: The path or file object to write to.
+    """
+    data = dumps_snapshot(model)
+    if hasattr(file, "write"):
+        file.write(data)
+    else:
+        with open(file, "wb") as f:
+            f.write(data)
+
+
+def load_snapshot(model_cls: Type[ModelT], file: str | PathLike | BinaryIO) -> ModelT:
+    """Load a model from a snapshot file path or binary file object.
+
+    Args:
+        model_cls: The expected model class.
+        file: The path or file object to read from.
+
+    Raises:
+        StaleSnapshotError: If the snapshot is for another model class or an incompatible version of this one.
+
+    Returns:
+        The stored model.
+    """
+    if hasattr(file, "read"):
+        return loads_snapshot(model_cls, file.read())
+    with open(file, "rb") as f:
+        return loads_snapshot(model_cls, f.read())
@@ -4,30 +4,46 @@ Module containing VO Universal Worker Service (UWS) classes.
 Contains pydantic-xml models for UWS request / response serialization.
 IVOA UWS Spec: https://www.ivoa.net/documents/UWS/20161024/REC-UWS-1.1-20161024.html
 """
-from vo_models.uws.models import (
-    ErrorSummary,
-    Job,
-    Jobs,
-    JobSummary,
-    MultiValuedParameter,
-    Parameter,
-    Parameters,
-    ParametersType,
-    ResultReference,
-    Results,
-    ShortJobDescription,
-)
+from typing import TYPE_CHECKING
+
+from vo_models._lazy import lazy_exports
 
-__all__ = [
-    "ErrorSummary",
-    "Job",
-    "Jobs",
-    "JobSummary",
-    "MultiValuedParameter",
-    "Parameter",
-    "Parameters",
-    "ParametersType",
-    "ResultReference",
-    "Results",
-    "ShortJobDescription",
-]
+if TYPE_CHECKING:
+    from vo_models.uws.models import (
+        ErrorSummary,
+        Job,
+        Jobs,
+        JobSummary,
+        MultiValuedParameter,
+        PackedMultiValuedParameter,
+        Parameter,
+        Parameters,
+        ParametersType,
+        ResultReference,
+        Results,
+        ShortJobDescription,
+        TemplatedResults,
+        TypedParameter,
+    )
+
+__getattr__, __dir__, __all__ = lazy_exports(
+    __name__,
+    {
+        ".models": [
+            "ErrorSummary",
+            "Job",
+            "Jobs",
+            "JobSummary",
+            "MultiValuedParameter",
+            "PackedMultiValuedParameter",
+            "Parameter",
+            "Parameters",
+            "ParametersType",
+            "ResultReference",
+            "Results",
+            "ShortJobDescription",
+            "TemplatedResults",
+            "TypedParameter",
+        ],
+    },
+)
@@ -0,0 +1,127 @@
+"""Helpers for building UWS models from already-trusted values, without running validation."""
+import copy
+from datetime import datetime, timezone
+from enum import Enum
+from functools import lru_cache
+from typing import Any, Callable, Optional, Type
+
+from pydantic import BaseModel
+from pydantic_core import PydanticUndefined
+
+from vo_models.uws.types import ExecutionPhase
+from vo_models.voresource.types import UTCTimestamp
+
+# ExecutionPhase members by value. As ExecutionPhase is a str enum, members can be looked up as well as strings.
+PHASES = {phase.value: phase for phase in ExecutionPhase}
+
+# datetime.fromisoformat, bound to UTCTimestamp so that it returns one without going through its validator
+_timestamp_fromisoformat = datetime.__dict__["fromisoformat"].__get__(None, UTCTimestamp)
+
+
+@lru_cache(maxsize=None)
+def _field_defaults(model_cls: Type[BaseModel]) -> Optional[tuple[tuple[str, Any, Optional[Callable[[], Any]]], ...]]:
+    """Each field's name, default and default factory, or None if a default factory needs the validated data."""
+    defaults = []
+    for name, field in model_cls.model_fields.items():
+        factory = field.default_factory
+        if factory is not None and field.default_factory_takes_validated_data:
+            return None
+        default = field.default
+        if factory is None and not isinstance(default, (type(None), str, int, float, Enum)):
+            # model_construct deep-copies mutable defaults, so that instances don't share them
+            factory = lambda default=default: copy.deepcopy(default)  # pylint: disable=unnecessary-lambda-assignment
+        defaults.append((name, default, factory))
+    return tuple(defaults)
+
+
+def construct(model_cls: Type[BaseModel], **values: Any) -> Any:
+    """Equivalent to ``model_cls.model_construct(**values)`` for field names, without its per-call introspection."""
+    defaults = _field_defaults(model_cls)
+    if defaults is None:
+        return model_cls.model_construct(**values)
+    fields = {}
+    for name, default, factory in defaults:
+        if name in values:
+            fields[name] = values[name]
+        elif factory is not None:
+            fields[name] = factory()
+        elif default is not PydanticUndefined:
+            fields[name] = default
+    instance = model_cls.__new__(model_cls)
+    object.__setattr__(instance, "__dict__", fields)
+    object.__setattr__(instance, "__pydantic_fields_set__", set(values))
+    object.__setattr__(instance, "__pydantic_extra__", None)
+    object.__setattr__(instance, "__pydantic_private__", None)
+    if model_cls.__pydantic_post_init__:
+        instance.model_post_init(None)
+    return instance
+
+
+def batch_constructor(model_cls: Type[BaseModel], names: tuple[str, ...]) -> Callable[..., Any]:
+    """Create a function constructing many instances of a model from values for the same fields.
+
+    The returned function takes the values of ``names`` positionally, and is equivalent to calling `construct` with
+    them as keywords. Defaults for the other fields are resolved once, rather than for every instance.
+    """
+    defaults = _field_defaults(model_cls)
+    if defaults is None:
+        return lambda *values: model_cls.model_construct(**dict(zip(names, values)))
+
+    template = {}
+    factories = []
+    for name, default, factory in defaults:
+        if name in names:
+            template[name] = None
+        elif factory is not None:
+            template[name] = None
+            factories.append((name, factory))
+        elif default is not PydanticUndefined:
+            template[name] = default
+    fields_set = frozenset(names)
+    post_init = bool(model_cls.__pydantic_post_init__)
+    setattr_ = object.__setattr__
+
+    def build(*values: Any) -> Any:
+        fields = template.copy()
+        fields.update(zip(names, values))
+        for name, factory in factories:
+            fields[name] = factory()
+        instance = model_cls.__new__(model_cls)
+        setattr_(instance, "__dict__", fields)
+        setattr_(instance, "__pydantic_fields_set__", set(fields_set))
+        setattr_(instance, "__pydantic_extra__", None)
+        setattr_(instance, "__pydantic_private__", None)
+        if post_init:
+            instance.model_post_init(None)
+        return instance
+
+    return build
+
+
+def timestamp_from_text(text: str) -> UTCTimestamp:
+    """Parse a timestamp as `UTCTimestamp` validation would, skipping the format check for ``Z`` suffixed values."""
+    if text.endswith("Z"):
+        return _timestamp_fromisoformat(text[:-1] + "+00:00")
+    return UTCTimestamp.fromisoformat(text)
+
+
+def timestamp_from_value(value: Any) -> Optional[UTCTimestamp]:
+    """Convert a datetime, string or None to the value `UTCTimestamp` validation would produce."""
+    if value is None or type(value) is UTCTimestamp:  # pylint: disable=unidiomatic-typecheck
+        return value
+    if isinstance(value, datetime) and (value.tzinfo is None or value.utcoffset().total_seconds() == 0):
+        # Naive datetimes are taken to be UTC
+        return UTCTimestamp(
+            value.year,
+            value.month,
+            value.day,
+            value.hour,
+            value.minute,
+            value.second,
+            value.microsecond,
+            tzinfo=timezone.utc,
+            fold=value.fold,
+        )
+    if isinstance(value, str):
+        return timestamp_from_text(value)
+    return UTCTimestamp.fromisoformat(value)
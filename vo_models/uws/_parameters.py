@@ -0,0 +1,69 @@
+"""Helpers for inspecting the fields of `Parameters` classes, shared by the trusted parser and the archive encoding."""
+import types
+import typing
+from functools import lru_cache
+from typing import Annotated, Any, Callable, Optional, Type, Union
+
+from pydantic import TypeAdapter
+
+from vo_models.uws.models import JobSummary, PackedMultiValuedParameter, Parameter, Parameters, TypedParameter
+
+
+def parameter_field(annotation: Any) -> Optional[tuple[bool, Type[Parameter]]]:
+    """Whether a `Parameters` field holds a list of parameters and their class, or None if it holds something else."""
+    args = (annotation,)
+    if typing.get_origin(annotation) in (Union, types.UnionType):
+        args = tuple(arg for arg in typing.get_args(annotation) if arg is not type(None))
+    if len(args) != 1:
+        return None
+    arg = args[0]
+    if typing.get_origin(arg) is Annotated:
+        arg = typing.get_args(arg)[0]
+    if arg is PackedMultiValuedParameter:
+        return True, Parameter
+    if typing.get_origin(arg) is list:
+        multi_valued, arg = True, typing.get_args(arg)[0]
+    else:
+        multi_valued = False
+    if arg is Parameter or (isinstance(arg, type) and issubclass(arg, TypedParameter)):
+        return multi_valued, arg
+    return None
+
+
+@lru_cache(maxsize=None)
+def packed_fields(parameters_cls: Type[Parameters]) -> tuple[str, ...]:
+    """The names of the `PackedMultiValuedParameter` fields of a `Parameters` class."""
+    return tuple(
+        name
+        for name, field in parameters_cls.model_fields.items()
+        if PackedMultiValuedParameter in (field.annotation, *typing.get_args(field.annotation))
+    )
+
+
+@lru_cache(maxsize=None)
+def parameters_type(job_cls: Type[JobSummary]) -> Any:
+    """The type of the ``parameters`` of a `JobSummary` class, e.g. the ``TAPParameters`` of a specialised class."""
+    annotation = job_cls.model_fields["parameters"].annotation
+    args = [arg for arg in typing.get_args(annotation) if arg is not type(None)]
+    return args[0] if len(args) == 1 else annotation
+
+
+@lru_cache(maxsize=None)
+def value_reader(param_cls: Type[Parameter]) -> Optional[Callable[[Any], Any]]:
+    """The function converting the text of a `TypedParameter` to its type, or None for plain parameters."""
+    if not issubclass(param_cls, TypedParameter) or param_cls.value_type is str:
+        return None
+    return TypeAdapter(Optional[param_cls.value_type]).validate_python
+
+
+@lru_cache(maxsize=None)
+def value_writer(param_cls: Type[Parameter]) -> Optional[Callable[[Any], Any]]:
+    """The function converting the value of a `TypedParameter` to JSON types, or None if it needs no conversion.
+
+    Values of other types than strings, numbers and booleans (e.g. ``datetime``) are converted as pydantic serializes
+    them to JSON, and read back with `value_reader`.
+    """
+    if not issubclass(param_cls, TypedParameter) or param_cls.value_type in (str, int, float, bool):
+        return None
+    adapter = TypeAdapter(Optional[param_cls.value_type])
+    return lambda value: adapter.dump_python(value, mode="json")
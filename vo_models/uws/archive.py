@@ -0,0 +1,427 @@
+"""Compact row encoding of job summaries, for archiving jobs.
+
+Jobs in the ``ARCHIVED`` phase keep their metadata long after their results are gone, and a service may hold millions
+of them. Rather than storing each job as a `JobSummary` document, `encode_job` turns it into an `ArchivedJob`: a flat
+tuple of fixed columns, ready to be written to a database table, with timestamps as integer microseconds since the
+Unix epoch and the parameters, results, error summary and job info as compact JSON blobs. `decode_job` rebuilds an
+equal model, which writes the same XML as the original.
+
+Decoding does not validate the rows, so only decode rows written by `encode_job`. `encode_jobs` and `decode_jobs` do
+the same for many rows at a time, resolving the details of the model classes once.
+"""
+import base64
+import json
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from typing import Any, Callable, Iterable, Iterator, NamedTuple, Optional, Sequence, Type, TypeVar
+
+from vo_models.uws._construct import PHASES, batch_constructor, construct
+from vo_models.uws._parameters import packed_fields, parameter_field, parameters_type, value_reader, value_writer
+from vo_models.uws.models import (
+    ErrorSummary,
+    JobSummary,
+    PackedMultiValuedParameter,
+    Parameters,
+    ResultReference,
+    Results,
+    TemplatedResults,
+)
+from vo_models.uws.spool import SpooledValue
+from vo_models.uws.types import ErrorType, UWSVersion
+from vo_models.voresource.types import UTCTimestamp
+from vo_models.xlink import XlinkType
+
+JobT = TypeVar("JobT", bound=JobSummary)
+
+FORMAT_VERSION = 1
+"""The version of the row encoding written by `encode_job`."""
+
+
+class ArchivedJob(NamedTuple):
+    """A job summary encoded as a row of fixed columns.
+
+    Parameters:
+        format_version:
+            The version of the encoding, `FORMAT_VERSION` when written.
+        job_id, run_id, owner_id:
+            The job's identifiers.
+        phase:
+            The value of the job's `ExecutionPhase`.
+        quote, creation_time, start_time, end_time, destruction:
+            The job's timestamps, in integer microseconds since the Unix epoch.
+        execution_duration:
+            The job's execution duration in seconds.
+        parameters:
+            The job's parameters as a JSON blob, or as their XML document if they are not key/value pairs.
+        results:
+            The job's result references as a JSON blob.
+        error_summary:
+            The job's error summary as a JSON blob.
+        job_info:
+            The job's ``jobInfo`` elements as a JSON blob.
+        version:
+            The value of the job's `UWSVersion`.
+    """
+
+    format_version: int
+    job_id: str
+    run_id: Optional[str]
+    owner_id: Optional[str]
+    phase: str
+    quote: Optional[int]
+    creation_time: Optional[int]
+    start_time: Optional[int]
+    end_time: Optional[int]
+    execution_duration: Optional[int]
+    destruction: Optional[int]
+    parameters: Optional[bytes]
+    results: Optional[bytes]
+    error_summary: Optional[bytes]
+    job_info: Optional[bytes]
+    version: Optional[str]
+
+
+_EPOCH = UTCTimestamp(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+
+# The parameters of each field are stored as their id followed by an entry per value. An entry is the value itself if
+# its flags are 0, or a list of the value and its flags, followed by its id if that differs from the first. The flags
+# are the by_reference and is_post attributes as base 3 digits (False, True or None), plus 9 when the value is bytes,
+# stored as base64.
+_FLAG_DIGITS = {False: 0, True: 1, None: 2}
+_FLAG_VALUES = (False, True, None)
+_BYTES_FLAG = 9
+
+# The fields of JobSummary, in the order of the ArchivedJob columns after the format version
+_JOB_FIELDS = ArchivedJob._fields[1:]
+
+_PARAMETER_NAMES = ("id", "value", "by_reference", "is_post")
+_RESULT_NAMES = ("id", "href", "size", "mime_type")
+_build_result = batch_constructor(ResultReference, _RESULT_NAMES)
+_build_result_with_attrs = batch_constructor(ResultReference, (*_RESULT_NAMES, "type", "any_attrs"))
+# A field's kind, parameter constructor, and the functions converting typed values to and from JSON types, if needed
+_ParameterKind = tuple[str, Callable[..., Any], Optional[Callable[[Any], Any]], Optional[Callable[[Any], Any]]]
+_dumps = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False).encode
+_loads = json.loads
+
+
+def _blob(value: Any) -> bytes:
+    return _dumps(value).encode("utf-8")
+
+
+def _epoch_microseconds(value: Optional[datetime]) -> Optional[int]:
+    if value is None:
+        return None
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return (value - _EPOCH) // _MICROSECOND
+
+
+def _timestamp(value: Optional[int]) -> Optional[UTCTimestamp]:
+    if value is None:
+        return None
+    return _EPOCH + timedelta(microseconds=value)
+
+
+@lru_cache(maxsize=None)
+def _parameter_kinds(parameters_cls: Type[Parameters]) -> Optional[dict[str, _ParameterKind]]:
+    """Map the fields of a `Parameters` class to their kind (single, list or packed), parameter constructor, and the
+    functions converting typed values to and from JSON types, if needed.
+
+    Returns None if the class has fields other than simple (or multi-valued) parameters.
+    """
+    packed = packed_fields(parameters_cls)
+    kinds = {}
+    for name, field in parameters_cls.model_fields.items():
+        field_kind = parameter_field(field.annotation)
+        if field_kind is None:
+            return None
+        multi_valued, param_cls = field_kind
+        kind = "packed" if name in packed else "list" if multi_valued else "single"
+        write = value_writer(param_cls)
+        read = None if write is None else value_reader(param_cls)
+        kinds[name] = (kind, batch_constructor(param_cls, _PARAMETER_NAMES), write, read)
+    return kinds
+
+
+def _parameter_entry(
+    value: Any, by_reference: Optional[bool], is_post: Optional[bool], param_id: Optional[str] = None
+) -> Any:
+    flags = _FLAG_DIGITS[by_reference] + 3 * _FLAG_DIGITS[is_post]
+    if isinstance(value, bytes):
+        value = base64.b64encode(value).decode("ascii")
+        flags += _BYTES_FLAG
+    elif isinstance(value, SpooledValue):
+        value = value.text()
+    if param_id is not None:
+        return [value, flags, param_id]
+    return [value, flags] if flags else value
+
+
+def _parameter_values(entry: Any, param_id: str) -> tuple[str, Any, Optional[bool], Optional[bool]]:
+    if not isinstance(entry, list):
+        return param_id, entry, False, False
+    value, flags, *other_id = entry
+    if flags >= _BYTES_FLAG:
+        value = base64.b64decode(value)
+        flags -= _BYTES_FLAG
+    is_post, by_reference = divmod(flags, 3)
+    return other_id[0] if other_id else param_id, value, _FLAG_VALUES[by_reference], _FLAG_VALUES[is_post]
+
+
+def _encode_parameters(parameters: Any) -> Optional[bytes]:
+    if parameters is None:
+        return None
+    kinds = _parameter_kinds(type(parameters)) if isinstance(parameters, Parameters) else None
+    if kinds is None:
+        # Not made of plain parameters, e.g. the original POST content of the job
+        return parameters.to_xml()
+    fields = {}
+    for name, (_, _, write, _) in kinds.items():
+        value = getattr(parameters, name)
+        if value is None:
+            continue
+        if isinstance(value, PackedMultiValuedParameter):
+            fields[name] = [value.id, *(_parameter_entry(v, value.by_reference, value.is_post) for v in value.values)]
+            continue
+        params = value if isinstance(value, list) else [value]
+        if not params:
+            fields[name] = []
+            continue
+        param_id = params[0].id
+        fields[name] = [param_id]
+        for param in params:
+            fields[name].append(
+                _parameter_entry(
+                    param.value if write is None else write(param.value),
+                    param.by_reference,
+                    param.is_post,
+                    None if param.id == param_id else param.id,
+                )
+            )
+    return _blob(fields)
+
+
+def _decode_parameters(blob: Optional[bytes], parameters_cls: Any) -> Any:
+    if blob is None:
+        return None
+    if not (isinstance(parameters_cls, type) and hasattr(parameters_cls, "from_xml")):
+        raise ValueError(f"Can not decode parameters for {parameters_cls!r}; decode with a specialised job class")
+    if blob[:1] == b"<":
+        return parameters_cls.from_xml(blob)
+    kinds = _parameter_kinds(parameters_cls)
+    if kinds is None:
+        raise ValueError(f"Can not decode key/value parameters as {parameters_cls.__name__}")
+    values: dict[str, Any] = {}
+    for name, field in _loads(blob).items():
+        kind, build, _, read = kinds[name]
+        if not field:
+            values[name] = []
+            continue
+        param_id, *entries = field
+        params = [_parameter_values(entry, param_id) for entry in entries]
+        if read is not None:
+            params = [(other_id, read(value), *flags) for other_id, value, *flags in params]
+        if kind == "packed":
+            _, _, by_reference, is_post = params[0]
+            values[name] = PackedMultiValuedParameter(param_id, [param[1] for param in params], by_reference, is_post)
+        elif kind == "list":
+            values[name] = [build(*param) for param in params]
+        else:
+            values[name] = build(*params[0])
+    return construct(parameters_cls, **values)
+
+
+def _encode_result_references(references: Optional[Iterable[ResultReference]]) -> list[list[Any]]:
+    entries = []
+    for result in references or ():
+        entry = [result.id, result.href, result.size, result.mime_type]
+        if result.type is not XlinkType.SIMPLE or result.any_attrs is not None:
+            entry += [None if result.type is None else result.type.value, result.any_attrs]
+        entries.append(entry)
+    return entries
+
+
+def _decode_result_references(entries: list[list[Any]]) -> list[ResultReference]:
+    references = []
+    for entry in entries:
+        if len(entry) == 4:
+            references.append(_build_result(*entry))
+        else:
+            entry[4] = None if entry[4] is None else XlinkType(entry[4])
+            references.append(_build_result_with_attrs(*entry))
+    return references
+
+
+def _encode_results(results: Optional[Results]) -> Optional[bytes]:
+    if results is None:
+        return None
+    if isinstance(results, TemplatedResults):
+        # Stored with their template, without building the references of results that have not been built yet
+        templated = {"href_template": results.href_template, "template_fields": results.template_fields}
+        if results.entries is None:
+            templated["results"] = _encode_result_references(results.results)
+        else:
+            templated["entries"] = results.entries
+        try:
+            return _blob(templated)
+        except TypeError:
+            # Template fields that are not JSON types are formatted into the hrefs instead
+            return _blob(_encode_result_references(results._references()))  # pylint: disable=protected-access
+    return _blob(_encode_result_references(results.results))
+
+
+def _decode_results(blob: Optional[bytes]) -> Optional[Results]:
+    if blob is None:
+        return None
+    stored = _loads(blob)
+    if isinstance(stored, list):
+        return construct(Results, results=_decode_result_references(stored))
+    results = TemplatedResults.from_entries(
+        stored["href_template"], map(tuple, stored.get("entries", ())), **stored["template_fields"]
+    )
+    if "results" in stored:
+        results.results = _decode_result_references(stored["results"])
+    return results
+
+
+def _encode_error_summary(error_summary: Optional[ErrorSummary]) -> Optional[bytes]:
+    if error_summary is None:
+        return None
+    return _blob([error_summary.message, error_summary.type.value, error_summary.has_detail])
+
+
+def _decode_error_summary(blob: Optional[bytes]) -> Optional[ErrorSummary]:
+    if blob is None:
+        return None
+    message, error_type, has_detail = _loads(blob)
+    return construct(ErrorSummary, message=message, type=ErrorType(error_type), has_detail=has_detail)
+
+
+def encode_job(job: JobSummary) -> ArchivedJob:
+    """Encode a job summary as a row.
+
+    Parameter values given as a `SpooledValue` are stored as their text. The values of `TypedParameter` types other
+    than strings, numbers and booleans, e.g. ``datetime``, are stored as pydantic serializes them to JSON.
+
+    `TemplatedResults` are stored with their template and decode as equal `TemplatedResults`, without building their
+    references, unless their template fields are not JSON types: they are then stored and decoded as plain `Results`.
+    Results holding None decode as an empty list of results.
+
+    Args:
+        job: The job, typically in a terminal or ``ARCHIVED`` phase.
+
+    Returns:
+        ArchivedJob: The row.
+    """
+    return ArchivedJob(
+        FORMAT_VERSION,
+        job.job_id,
+        job.run_id,
+        job.owner_id,
+        job.phase.value,
+        _epoch_microseconds(job.quote),
+        _epoch_microseconds(job.creation_time),
+        _epoch_microseconds(job.start_time),
+        _epoch_microseconds(job.end_time),
+        job.execution_duration,
+        _epoch_microseconds(job.destruction),
+        _encode_parameters(job.parameters),
+        _encode_results(job.results),
+        _encode_error_summary(job.error_summary),
+        None if job.job_info is None else _blob(job.job_info),
+        None if job.version is None else job.version.value,
+    )
+
+
+def encode_jobs(jobs: Iterable[JobSummary]) -> Iterator[ArchivedJob]:
+    """Encode many job summaries as rows, e.g. for ``executemany``.
+
+    Args:
+        jobs: The jobs.
+
+    Returns:
+        Iterator[ArchivedJob]: The rows, in the same order.
+    """
+    return map(encode_job, jobs)
+
+
+@lru_cache(maxsize=None)
+def _job_decoder(job_cls: Type[JobT]) -> Callable[[Sequence[Any]], JobT]:
+    build = batch_constructor(job_cls, _JOB_FIELDS)
+    parameters_cls = parameters_type(job_cls)
+
+    def decode(row: Sequence[Any]) -> JobT:
+        (
+            format_version,
+            job_id,
+            run_id,
+            owner_id,
+            phase,
+            quote,
+            creation_time,
+            start_time,
+            end_time,
+            execution_duration,
+            destruction,
+            parameters,
+            results,
+            error_summary,
+            job_info,
+            version,
+        ) = row
+        if format_version != FORMAT_VERSION:
+            raise ValueError(f"Unsupported archived job format version {format_version}")
+        return build(
+            job_id,
+            run_id,
+            owner_id,
+            PHASES[phase],
+            _timestamp(quote),
+            _timestamp(creation_time),
+            _timestamp(start_time),
+            _timestamp(end_time),
+            execution_duration,
+            _timestamp(destruction),
+            _decode_parameters(parameters, parameters_cls),
+            _decode_results(results),
+            _decode_error_summary(error_summary),
+            None if job_info is None else _loads(job_info),
+            None if version is None else UWSVersion(version),
+        )
+
+    return decode
+
+
+def decode_job(row: Sequence[Any], job_cls: Type[JobT] = JobSummary) -> JobT:
+    """Rebuild a job summary from a row written by `encode_job`.
+
+    Args:
+        row: The row, as an `ArchivedJob` or any sequence of its columns in order, e.g. a database row.
+        job_cls: The job model to build, e.g. ``JobSummary[TAPParameters]``. Jobs with parameters need a specialised
+            class, to know the type of their parameters.
+
+    Raises:
+        ValueError: If the row was written by an unsupported version of the encoding, or its parameters can not be
+            decoded as the parameters type of ``job_cls``.
+
+    Returns:
+        The job.
+    """
+    return _job_decoder(job_cls)(row)
+
+
+def decode_jobs(rows: Iterable[Sequence[Any]], job_cls: Type[JobT] = JobSummary) -> Iterator[JobT]:
+    """Rebuild many job summaries from rows written by `encode_job`, e.g. from a database cursor.
+
+    Args:
+        rows: The rows.
+        job_cls: The job model to build, as for `decode_job`.
+
+    Raises:
+        ValueError: As for `decode_job`.
+
+    Returns:
+        Iterator[JobSummary]: The jobs, in the same order.
+    """
+    return map(_job_decoder(job_cls), rows)
@@ -0,0 +1,109 @@
+"""Detailed error documents for UWS jobs.
+
+When a job's `ErrorSummary` has ``hasDetail="true"``, a fuller description of the error is served at
+``/{jobs}/{job-id}/error``. UWS leaves its format open: it may be a plain text traceback, a log or a VOTable error
+document, and can be large. An `ErrorDetail` refers to such a document, held in memory, in a file or produced by an
+iterator, and writes it out in chunks, so that serving it does not load it all into memory. Assigning it to
+`ErrorSummary.detail` sets ``has_detail`` to match.
+"""
+import os
+import shutil
+import traceback
+from pathlib import Path
+from typing import IO, Iterable, Iterator, Optional, Union
+
+Source = Union[str, bytes, "os.PathLike[str]", IO[bytes], Iterable[Union[bytes, str]]]
+"""The content of an `ErrorDetail`."""
+
+
+class ErrorDetail:
+    """The detailed error document of a job.
+
+    Parameters:
+        source:
+            The content of the document: a string or bytes, a path (as an ``os.PathLike``, e.g. `pathlib.Path`; use
+            `from_file` for string paths), a binary file object, or an iterable of string or bytes chunks. Strings are
+            UTF-8 encoded. Files are read when the document is written out, not when it is created. An iterator can
+            only be written out once.
+        media_type:
+            The MIME type of the document, e.g. ``text/plain`` or ``application/x-votable+xml``.
+    """
+
+    def __init__(self, source: Source, media_type: str = "text/plain"):
+        self.source = source
+        self.media_type = media_type
+        self._path = os.fspath(source) if isinstance(source, os.PathLike) else None
+        self._streamed = False
+
+    @classmethod
+    def from_file(cls, path: Union[str, "os.PathLike[str]"], media_type: str = "text/plain") -> "ErrorDetail":
+        """A document held in a file, e.g. the log of the job's execution."""
+        return cls(Path(path), media_type)
+
+    @classmethod
+    def from_exception(cls, exc: BaseException) -> "ErrorDetail":
+        """A plain text document holding the traceback of an exception."""
+        return cls(traceback.format_exception(type(exc), exc, exc.__traceback__))
+
+    @property
+    def size(self) -> Optional[int]:
+        """The size of the document in bytes, or None if it is not known without reading it."""
+        source = self.source
+        if self._path is not None:
+            return os.path.getsize(self._path)
+        if isinstance(source, bytes):
+            return len(source)
+        if isinstance(source, str):
+            return len(source.encode("utf-8"))
+        return None
+
+    def chunks(self, chunk_size: int = 64 * 1024) -> Iterator[bytes]:
+        """Read the document in chunks of at most ``chunk_size`` bytes.
+
+        Only one chunk (or one chunk of an iterable source, if larger) is held in memory at a time.
+
+        Args:
+            chunk_size: The maximum size of each chunk in bytes.
+
+        Raises:
+            RuntimeError: If the source is an iterator that was already written out.
+        """
+        source = self.source
+        if self._path is not None:
+            with open(self._path, "rb") as file:
+                yield from _read_chunks(file, chunk_size)
+        elif isinstance(source, (str, bytes)):
+            data = source.encode("utf-8") if isinstance(source, str) else source
+            for start in range(0, len(data), chunk_size):
+                yield data[start : start + chunk_size]
+        elif hasattr(source, "read"):
+            if source.seekable():
+                source.seek(0)
+            yield from _read_chunks(source, chunk_size)
+        else:
+            if iter(source) is source:
+                if self._streamed:
+                    raise RuntimeError("The error detail was produced by an iterator, and has already been read")
+                self._streamed = True
+            for chunk in source:
+                data = chunk.encode("utf-8") if isinstance(chunk, str) else chunk
+                for start in range(0, len(data), chunk_size):
+                    yield data[start : start + chunk_size]
+
+    def copy_to(self, destination: IO[bytes]) -> None:
+        """Write the document to a binary file."""
+        if self._path is not None:
+            with open(self._path, "rb") as file:
+                shutil.copyfileobj(file, destination)
+            return
+        for chunk in self.chunks():
+            destination.write(chunk)
+
+    def read(self) -> bytes:
+        """Read the whole document into memory."""
+        return b"".join(self.chunks())
+
+
+def _read_chunks(file: IO[bytes], chunk_size: int) -> Iterator[bytes]:
+    while chunk := file.read(chunk_size):
+        yield chunk
@@ -0,0 +1,269 @@
+"""Tracking of UWS job deadlines, for destroying jobs and ending executions on time.
+
+A UWS service must destroy each job once its ``destruction`` time passes, and should stop jobs that run for longer
+than their ``executionDuration``. Rather than periodically scanning every job, services feed their jobs to an
+`ExpiryIndex`, which keeps the deadlines in a heap and hands back the due ones in O(log n) each, and run an
+`ExpirySweeper` task that sleeps until the next deadline and passes the jobs that reach it to a callback.
+"""
+import asyncio
+import heapq
+import inspect
+from datetime import datetime, timedelta, timezone
+from enum import Enum
+from itertools import count
+from typing import Any, Awaitable, Callable, Iterator, NamedTuple, Optional
+
+from vo_models.uws.models import JobSummary
+from vo_models.uws.types import ExecutionPhase
+
+Clock = Callable[[], datetime]
+"""A function returning the current time as a timezone-aware datetime."""
+
+
+def utc_now() -> datetime:
+    """The current time in UTC; the default `Clock`."""
+    return datetime.now(timezone.utc)
+
+
+class ExpiryKind(str, Enum):
+    """The kind of a job deadline."""
+
+    DESTRUCTION = "destruction"
+    """The job's ``destruction`` time, when the job and its results must be destroyed."""
+    EXECUTION = "execution"
+    """The end of the job's ``executionDuration`` from its ``startTime``, while it is executing."""
+
+
+class Expiry(NamedTuple):
+    """A job deadline."""
+
+    deadline: datetime
+    """The time of the deadline."""
+    job_id: str
+    """The identifier of the job."""
+    kind: ExpiryKind
+    """Which of the job's deadlines it is."""
+
+
+def _utc(value: datetime) -> datetime:
+    # Naive timestamps are taken to be UTC, as for UTCTimestamp
+    return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value
+
+
+def job_deadlines(job: JobSummary) -> dict[ExpiryKind, datetime]:
+    """The deadlines of a job.
+
+    A job has a destruction deadline if its ``destruction`` time is set, and an execution deadline while it is
+    ``EXECUTING`` with a ``start_time`` and a non-zero ``execution_duration`` (0 means unlimited).
+
+    Args:
+        job: The job.
+
+    Returns:
+        dict[ExpiryKind, datetime]: The job's deadlines by kind.
+    """
+    deadlines = {}
+    if job.destruction is not None:
+        deadlines[ExpiryKind.DESTRUCTION] = _utc(job.destruction)
+    if job.phase == ExecutionPhase.EXECUTING and job.start_time is not None and job.execution_duration:
+        deadlines[ExpiryKind.EXECUTION] = _utc(job.start_time) + timedelta(seconds=job.execution_duration)
+    return deadlines
+
+
+class ExpiryIndex:
+    """An in-memory index of job deadlines, ordered by time.
+
+    Deadlines are kept in a heap. Updating or removing a job leaves its old heap entries in place to be skipped when
+    they surface, and the heap is rebuilt once most of its entries are stale, so updates are O(log n) too.
+    """
+
+    def __init__(self):
+        self._heap: list[tuple[datetime, int, str, ExpiryKind]] = []
+        self._deadlines: dict[str, dict[ExpiryKind, datetime]] = {}
+        self._live = 0
+        self._sequence = count()
+
+    def __len__(self) -> int:
+        """The number of jobs with at least one deadline."""
+        return len(self._deadlines)
+
+    def __contains__(self, job_id: str) -> bool:
+        return job_id in self._deadlines
+
+    def add(self, job: JobSummary) -> None:
+        """Add a job, or update its deadlines after it changed.
+
+        Call this whenever a job's ``destruction``, ``phase``, ``start_time`` or ``execution_duration`` changes. A job
+        without deadlines is removed.
+
+        Args:
+            job: The job.
+        """
+        self.set_deadlines(job.job_id, job_deadlines(job))
+
+    def set_deadlines(self, job_id: str, deadlines: dict[ExpiryKind, datetime]) -> None:
+        """Replace a job's deadlines.
+
+        Args:
+            job_id: The identifier of the job.
+            deadlines: The job's deadlines by kind. Naive datetimes are taken to be UTC.
+        """
+        deadlines = {kind: _utc(deadline) for kind, deadline in deadlines.items()}
+        old = self._deadlines.pop(job_id, {})
+        self._live -= len(old)
+        if deadlines:
+            self._deadlines[job_id] = deadlines
+            for kind, deadline in deadlines.items():
+                if old.get(kind) != deadline:
+                    heapq.heappush(self._heap, (deadline, next(self._sequence), job_id, kind))
+            self._live += len(deadlines)
+        self._compact()
+
+    def remove(self, job_id: str) -> None:
+        """Remove a job, e.g. once it has been destroyed. Unknown jobs are ignored."""
+        self._live -= len(self._deadlines.pop(job_id, {}))
+        self._compact()
+
+    def deadlines(self, job_id: str) -> dict[ExpiryKind, datetime]:
+        """The deadlines of a job, by kind; empty if the job is unknown."""
+        return dict(self._deadlines.get(job_id, {}))
+
+    def _is_live(self, entry: tuple[datetime, int, str, ExpiryKind]) -> bool:
+        deadline, _, job_id, kind = entry
+        return self._deadlines.get(job_id, {}).get(kind) == deadline
+
+    def _compact(self) -> None:
+        if len(self._heap) > 64 and len(self._heap) > 2 * self._live:
+            self._heap = [entry for entry in self._heap if self._is_live(entry)]
+            heapq.heapify(self._heap)
+
+    def next_deadline(self) -> Optional[datetime]:
+        """The earliest deadline, or None if there are none."""
+        heap = self._heap
+        while heap and not self._is_live(heap[0]):
+            heapq.heappop(heap)
+        return heap[0][0] if heap else None
+
+    def pop_due(self, now: datetime) -> Iterator[Expiry]:
+        """Remove and yield the deadlines that are due, earliest first.
+
+        Each deadline is removed from the index as it is yielded; the job's other deadlines are kept.
+
+        Args:
+            now: The current time. Deadlines at or before it are due.
+        """
+        now = _utc(now)
+        # The heap may be rebuilt by changes made while this is suspended, so it is looked up on every step
+        while self._heap and self._heap[0][0] <= now:
+            entry = heapq.heappop(self._heap)
+            if not self._is_live(entry):
+                continue
+            deadline, _, job_id, kind = entry
+            deadlines = self._deadlines[job_id]
+            del deadlines[kind]
+            if not deadlines:
+                del self._deadlines[job_id]
+            self._live -= 1
+            yield Expiry(deadline, job_id, kind)
+
+
+class ExpirySweeper:
+    """An asyncio task passing the deadlines of an `ExpiryIndex` to a callback as they become due.
+
+    The sweeper sleeps until the next deadline. Add jobs through `add` and `remove` (or call `wake` after changing the
+    index directly) so that it notices deadlines earlier than the one it is waiting for.
+
+    Parameters:
+        index:
+            The index of deadlines.
+        on_expired:
+            Called with each due `Expiry`, e.g. to destroy or abort the job. May be a coroutine function; expiries are
+            handled one at a time.
+        clock:
+            The function giving the current time.
+        max_interval:
+            The longest time in seconds to sleep before checking the clock again, which bounds the lag if the clock
+            jumps forward.
+        on_error:
+            Called with the `Expiry` and the exception if ``on_expired`` raises. If not given, the exception ends the
+            sweeper's task.
+    """
+
+    def __init__(
+        self,
+        index: ExpiryIndex,
+        on_expired: Callable[[Expiry], Optional[Awaitable[Any]]],
+        clock: Clock = utc_now,
+        max_interval: float = 60,
+        on_error: Optional[Callable[[Expiry, Exception], None]] = None,
+    ):
+        self.index = index
+        self.on_expired = on_expired
+        self.clock = clock
+        self.max_interval = max_interval
+        self.on_error = on_error
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task[None]] = None
+
+    def add(self, job: JobSummary) -> None:
+        """Add or update a job in the index, waking the sweeper."""
+        self.index.add(job)
+        self.wake()
+
+    def remove(self, job_id: str) -> None:
+        """Remove a job from the index."""
+        self.index.remove(job_id)
+
+    def wake(self) -> None:
+        """Make the sweeper check the index and the clock again."""
+        self._wakeup.set()
+
+    async def sweep(self) -> int:
+        """Handle the deadlines that are due now.
+
+        Returns:
+            int: The number of deadlines handled.
+        """
+        handled = 0
+        for expiry in self.index.pop_due(self.clock()):
+            handled += 1
+            try:
+                result = self.on_expired(expiry)
+                if inspect.isawaitable(result):
+                    await result
+            except Exception as exc:  # pylint: disable=broad-exception-caught
+                if self.on_error is None:
+                    raise
+                self.on_error(expiry, exc)
+        return handled
+
+    async def run(self) -> None:
+        """Handle deadlines as they become due, until cancelled."""
+        while True:
+            self._wakeup.clear()
+            await self.sweep()
+            timeout = self.max_interval
+            next_deadline = self.index.next_deadline()
+            if next_deadline is not None:
+                timeout = max(0.0, min(timeout, (next_deadline - self.clock()).total_seconds()))
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+
+    def start(self) -> "asyncio.Task[None]":
+        """Start `run` as a task on the running event loop."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.ensure_future(self.run())
+        return self._task
+
+    async def stop(self) -> None:
+        """Cancel the task started by `start`, and wait for it to finish."""
+        task, self._task = self._task, None
+        if task is None:
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
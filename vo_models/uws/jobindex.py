@@ -0,0 +1,262 @@
+"""An indexed collection of job references, for serving UWS job lists.
+
+The job list at ``/{jobs}`` is usually filtered, to the jobs of the current user and by UWS 1.1 ``PHASE=`` filters, and
+filtering `Jobs.jobref` means scanning every `ShortJobDescription`. A `JobIndex` keeps the job references of a service
+by ``job_id``, grouped by ``owner_id`` and ``phase``, and ordered by ``creation_time``, so that lookups are O(1) and
+filtered views only touch the matching jobs. The UWS 1.1 ``AFTER=`` and ``LAST=`` filters bisect the creation order
+rather than sorting the jobs for every request. Views are `Jobs` documents holding the indexed models themselves, which
+are not copied or validated again, or can be written out directly in chunks with `JobIndex.iter_xml`.
+"""
+import math
+from bisect import bisect_left, bisect_right, insort
+from datetime import datetime, timezone
+from itertools import count
+from typing import Any, Iterable, Iterator, Optional, Union
+
+from vo_models.uws._construct import construct
+from vo_models.uws.models import Jobs, ShortJobDescription
+from vo_models.uws.serialization import iter_jobs_xml
+from vo_models.uws.types import ExecutionPhase, UWSVersion
+
+# Jobs without a creation time sort first
+_NO_CREATION_TIME = datetime.min.replace(tzinfo=timezone.utc)
+
+_OrderKey = tuple[datetime, int, str]
+
+
+def _creation_key(jobref: ShortJobDescription) -> datetime:
+    creation_time = jobref.creation_time
+    if creation_time is None:
+        return _NO_CREATION_TIME
+    # Naive timestamps are taken to be UTC, as for UTCTimestamp
+    return creation_time.replace(tzinfo=timezone.utc) if creation_time.tzinfo is None else creation_time
+
+
+class JobIndex:
+    """Job references indexed by ``job_id``, ``owner_id``, ``phase`` and ``creation_time``.
+
+    The index holds the `ShortJobDescription` models it is given. Call `add` again after changing a model's
+    ``owner_id``, ``phase`` or ``creation_time``, so that it is moved to the right groups. Iterating over the index
+    gives the job references in order of creation, oldest first; jobs created at the same time are kept in the order
+    they were added.
+
+    Parameters:
+        jobrefs:
+            The initial job references, e.g. from `Jobs.from_rows`.
+    """
+
+    def __init__(self, jobrefs: Iterable[ShortJobDescription] = ()):
+        self._by_id: dict[str, ShortJobDescription] = {}
+        # The groups are dicts by job_id rather than sets, so that jobs are removed in O(1) and kept in a stable order
+        self._by_owner: dict[Optional[str], dict[str, ShortJobDescription]] = {}
+        self._by_phase: dict[ExecutionPhase, dict[str, ShortJobDescription]] = {}
+        self._order: list[_OrderKey] = []
+        self._keys: dict[str, tuple[Optional[str], ExecutionPhase, _OrderKey]] = {}
+        self._sequence = count()
+        for jobref in jobrefs:
+            self.add(jobref)
+
+    @classmethod
+    def from_jobs(cls, jobs: Jobs) -> "JobIndex":
+        """Index the job references of a job list."""
+        return cls(jobs.jobref or ())
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    def __contains__(self, job_id: str) -> bool:
+        return job_id in self._by_id
+
+    def __getitem__(self, job_id: str) -> ShortJobDescription:
+        return self._by_id[job_id]
+
+    def __iter__(self) -> Iterator[ShortJobDescription]:
+        by_id = self._by_id
+        return (by_id[job_id] for _, _, job_id in self._order)
+
+    def get(self, job_id: str) -> Optional[ShortJobDescription]:
+        """The job reference with the given identifier, or None."""
+        return self._by_id.get(job_id)
+
+    def add(self, jobref: ShortJobDescription) -> None:
+        """Add a job reference, or re-index it after its owner, phase or creation time changed.
+
+        A job reference with the same ``job_id`` as an indexed one replaces it.
+
+        Args:
+            jobref: The job reference.
+        """
+        job_id = jobref.job_id
+        creation_key = _creation_key(jobref)
+        keys = self._keys.get(job_id)
+        if keys is not None:
+            owner_id, phase, order_key = keys
+            if (owner_id, phase, order_key[0]) == (jobref.owner_id, jobref.phase, creation_key):
+                if self._by_id[job_id] is not jobref:
+                    self._replace(jobref, owner_id, phase)
+                return
+            self.remove(job_id)
+        order_key = (creation_key, next(self._sequence), job_id)
+        self._by_id[job_id] = jobref
+        self._by_owner.setdefault(jobref.owner_id, {})[job_id] = jobref
+        self._by_phase.setdefault(jobref.phase, {})[job_id] = jobref
+        insort(self._order, order_key)
+        self._keys[job_id] = (jobref.owner_id, jobref.phase, order_key)
+
+    def _replace(self, jobref: ShortJobDescription, owner_id: Optional[str], phase: ExecutionPhase) -> None:
+        job_id = jobref.job_id
+        self._by_id[job_id] = jobref
+        self._by_owner[owner_id][job_id] = jobref
+        self._by_phase[phase][job_id] = jobref
+
+    def remove(self, job_id: str) -> Optional[ShortJobDescription]:
+        """Remove a job reference.
+
+        Args:
+            job_id: The identifier of the job.
+
+        Returns:
+            Optional[ShortJobDescription]: The removed job reference, or None if the job was not indexed.
+        """
+        jobref = self._by_id.pop(job_id, None)
+        if jobref is None:
+            return None
+        owner_id, phase, order_key = self._keys.pop(job_id)
+        for groups, key in ((self._by_owner, owner_id), (self._by_phase, phase)):
+            group = groups[key]
+            del group[job_id]
+            if not group:
+                del groups[key]
+        del self._order[bisect_left(self._order, order_key)]
+        return jobref
+
+    def owners(self) -> list[Optional[str]]:
+        """The owners of the indexed jobs."""
+        return list(self._by_owner)
+
+    def _order_keys(
+        self, owners: Optional[Iterable[Optional[str]]], phases: Optional[Iterable[ExecutionPhase]]
+    ) -> list[_OrderKey]:
+        """The sorted order keys of the jobs matching the given owners and phases."""
+        if owners is None and phases is None:
+            return self._order
+        owner_set = None if owners is None else set(owners)
+        phase_set = None if phases is None else set(phases)
+        owner_groups = [] if owner_set is None else [self._by_owner[key] for key in owner_set if key in self._by_owner]
+        phase_groups = [] if phase_set is None else [self._by_phase[key] for key in phase_set if key in self._by_phase]
+
+        # Scan the filter matching the fewest jobs, checking each job against the other filter
+        keys = self._keys
+        if owner_set is None or (phase_set is not None and sum(map(len, phase_groups)) < sum(map(len, owner_groups))):
+            matches = [keys[job_id] for group in phase_groups for job_id in group]
+            if owner_set is not None:
+                matches = [key for key in matches if key[0] in owner_set]
+        else:
+            matches = [keys[job_id] for group in owner_groups for job_id in group]
+            if phase_set is not None:
+                matches = [key for key in matches if key[1] in phase_set]
+        # Groups are mostly filled in order of creation, which sorting takes advantage of
+        order_keys = [key[2] for key in matches]
+        order_keys.sort()
+        return order_keys
+
+    def select(
+        self,
+        owners: Optional[Iterable[Optional[str]]] = None,
+        phases: Optional[Iterable[ExecutionPhase]] = None,
+        after: Optional[datetime] = None,
+        last: Optional[int] = None,
+    ) -> list[ShortJobDescription]:
+        """The job references matching the given filters.
+
+        The filters are applied in the order of UWS 1.1 job list filters: ``PHASE``, then ``AFTER``, then ``LAST``.
+        Only the jobs matching the more selective of the owner and phase filters are scanned, and the ``AFTER`` and
+        ``LAST`` filters are found by bisecting the jobs in order of creation, so without owner or phase filters they
+        take O(log n + k) for k selected jobs.
+
+        Args:
+            owners: The owners to include, None (the value) standing for jobs without an owner. All by default.
+            phases: The phases to include, e.g. from UWS 1.1 ``PHASE=`` filters. All by default.
+            after: Only include jobs created after this time (``AFTER=``). Naive datetimes are taken to be UTC.
+            last: Only include this many of the most recently created jobs (``LAST=``).
+
+        Raises:
+            ValueError: If ``last`` is negative.
+
+        Returns:
+            list[ShortJobDescription]: The indexed job references, in order of creation, oldest first, or newest first
+            if ``last`` is given, as UWS 1.1 requires.
+        """
+        if last is not None and last < 0:
+            raise ValueError(f"LAST must not be negative, got {last}")
+        order = self._order_keys(owners, phases)
+        start = 0
+        if after is not None:
+            if after.tzinfo is None:
+                after = after.replace(tzinfo=timezone.utc)
+            # Sorts after every key with the same creation time
+            start = bisect_right(order, (after, math.inf))
+        by_id = self._by_id
+        if last is None:
+            return [by_id[job_id] for _, _, job_id in order[start:]]
+        stop = max(start, len(order) - last) - 1
+        return [by_id[order[i][2]] for i in range(len(order) - 1, stop, -1)]
+
+    def after(self, timestamp: datetime) -> list[ShortJobDescription]:
+        """The jobs created after a time, oldest first, as for ``AFTER=``; see `select`."""
+        return self.select(after=timestamp)
+
+    def last(self, count: int) -> list[ShortJobDescription]:
+        """The most recently created jobs, newest first, as for ``LAST=``; see `select`."""
+        return self.select(last=count)
+
+    def jobs(
+        self,
+        owners: Optional[Iterable[Optional[str]]] = None,
+        phases: Optional[Iterable[ExecutionPhase]] = None,
+        after: Optional[datetime] = None,
+        last: Optional[int] = None,
+        version: Optional[UWSVersion] = UWSVersion.V1_1,
+    ) -> Jobs:
+        """A job list of the job references matching the given filters, as for `select`.
+
+        The job list holds the indexed models without copying them, so it should be written out (e.g. with
+        `vo_models.uws.serialization.to_xml`) before the index changes.
+
+        Args:
+            owners: The owners to include. All by default.
+            phases: The phases to include. All by default.
+            after: Only include jobs created after this time.
+            last: Only include this many of the most recently created jobs.
+            version: The ``version`` attribute of the job list.
+
+        Returns:
+            Jobs: The job list.
+        """
+        return construct(Jobs, jobref=self.select(owners, phases, after, last), version=version)
+
+    def iter_xml(
+        self,
+        owners: Optional[Iterable[Optional[str]]] = None,
+        phases: Optional[Iterable[ExecutionPhase]] = None,
+        after: Optional[datetime] = None,
+        last: Optional[int] = None,
+        version: Optional[UWSVersion] = UWSVersion.V1_1,
+        encoding: Any = None,
+    ) -> Iterator[Union[bytes, str]]:
+        """Write the job list of the job references matching the given filters in chunks, as for `select`.
+
+        See `vo_models.uws.serialization.iter_jobs_xml`; the chunks join to the output of ``jobs(...).to_xml()``.
+
+        Args:
+            owners: The owners to include. All by default.
+            phases: The phases to include. All by default.
+            after: Only include jobs created after this time.
+            last: Only include this many of the most recently created jobs.
+            version: The ``version`` attribute of the job list.
+            encoding: As for ``to_xml()``: None (ASCII bytes), ``str`` or UTF-8.
+
+        Returns:
+            Iterator[bytes | str]: The chunks of the document.
+        """
+        return iter_jobs_xml(self.select(owners, phases, after, last), version, encoding=encoding)
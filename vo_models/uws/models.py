@@ -1,10 +1,38 @@
 """UWS Job Schema using Pydantic-XML models"""
-from typing import Annotated, Dict, Generic, Optional, TypeAlias, TypeVar
-
-from pydantic import BeforeValidator, ConfigDict
+import types
+import typing
+from functools import lru_cache, partial
+from typing import (
+    Annotated,
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    Generic,
+    Iterable,
+    Iterator,
+    Mapping,
+    Optional,
+    Sequence,
+    TypeAlias,
+    TypeVar,
+    Union,
+    overload,
+)
+
+from pydantic import BeforeValidator, ConfigDict, GetCoreSchemaHandler, PrivateAttr, field_serializer, model_serializer
+from pydantic_core import CoreSchema, core_schema
 from pydantic_xml import BaseXmlModel, attr, element
 
-from vo_models.uws.types import ErrorType, ExecutionPhase, UWSVersion
+try:
+    from pydantic_xml import xml_field_validator
+except ImportError:  # pydantic-xml < 2.13
+    xml_field_validator = None
+
+from vo_models.uws._construct import PHASES, batch_constructor, construct, timestamp_from_value
+from vo_models.uws.error import ErrorDetail
+from vo_models.uws.spool import SpooledValue
+from vo_models.uws.types import ErrorType, ExecutionPhase, UWSVersion, validate_transition
 from vo_models.voresource.types import UTCTimestamp
 from vo_models.xlink import XlinkType
 
@@ -17,6 +45,10 @@ NSMAP = {
 # pylint: disable=invalid-name
 ParametersType = TypeVar("ParametersType")
 
+# Specialisations of JobSummary and Job by parameters type. pydantic's own cache of generic models only holds them
+# weakly, and still computes a cache key from the type arguments on every subscript.
+_SPECIALIZATIONS: Dict[tuple[type, Any], type] = {}
+
 
 class Parameter(BaseXmlModel, tag="parameter", ns="uws", nsmap=NSMAP):
     """A UWS Job parameter
@@ -35,13 +67,55 @@ class Parameter(BaseXmlModel, tag="parameter", ns="uws", nsmap=NSMAP):
 
     """
 
-    value: Optional[str | int | float | bool | bytes] = None  # only primitive types are allowed
+    # only primitive types are allowed, or large values spooled to a file by vo_models.uws.streaming
+    value: Optional[str | int | float | bool | bytes | SpooledValue] = None
 
     by_reference: Optional[bool] = attr(name="byReference", default=False)
     id: str = attr()
     is_post: Optional[bool] = attr(name="isPost", default=False)
 
 
+# Specialisations of TypedParameter by value type
+_TYPED_PARAMETERS: Dict[Any, type["TypedParameter"]] = {}
+
+
+class TypedParameter(Parameter):
+    """A UWS Job parameter whose value has a declared type.
+
+    ``TypedParameter[int]`` is a `Parameter` whose value is validated straight to an ``int``, rather than tried against
+    each of the primitive types a `Parameter` accepts, and kept as an ``int`` so that clients don't parse it again.
+    Declare the type of a parameter with the type of its `Parameters` field::
+
+        class TAPParameters(Parameters):
+            maxrec: Optional[TypedParameter[int]] = element(tag="parameter", default=None)
+
+    Parameters with that id are then built as ``TypedParameter[int]`` however they are given to the model, including
+    when parsing from XML regardless of the order of the parameters. The value of a parameter given by reference is a
+    URL, so declare ``str`` for parameters that may be passed by reference.
+    """
+
+    value_type: ClassVar[Any] = None
+
+    def __class_getitem__(cls, value_type: Any) -> Any:
+        try:
+            return _TYPED_PARAMETERS[value_type]
+        except KeyError:
+            pass
+        name = f"TypedParameter[{getattr(value_type, '__name__', repr(value_type))}]"
+        typed = _TYPED_PARAMETERS[value_type] = type(
+            name,
+            (TypedParameter,),
+            {
+                "__module__": __name__,
+                "__qualname__": name,
+                "__annotations__": {"value": Optional[value_type]},
+                "value": None,
+                "value_type": value_type,
+            },
+        )
+        return typed
+
+
 MultiValuedParameter: TypeAlias = Annotated[
     list[Parameter], BeforeValidator(lambda v: v if isinstance(v, list) else [v])
 ]
@@ -52,14 +126,133 @@ take multiple values. The resulting model attribute will be a list of
 `Parameter` objects with the same ``id``.
 """
 
+# Builds the Parameter views of a PackedMultiValuedParameter
+_packed_parameter = batch_constructor(Parameter, ("id", "value", "by_reference", "is_post"))
+
+
+class PackedMultiValuedParameter(Sequence[Parameter]):
+    """A compact alternative to `MultiValuedParameter` for parameters that may take thousands of values.
+
+    The ``id``, ``by_reference`` and ``is_post`` attributes shared by all of the values are stored once, and the values
+    themselves in a plain list. Use it as the type of a `Parameters` field in place of `MultiValuedParameter`; it
+    serializes to the same repeated ``<uws:parameter>`` elements.
+
+    Indexing and iterating yield `Parameter` objects, as for `MultiValuedParameter`. These are built on access, so
+    make changes through `values` or `append` rather than on the yielded parameters.
+
+    Parameters:
+        id:
+            The identifier of the parameter.
+        values:
+            The values of the parameter.
+        by_reference:
+            Whether the values are URLs to retrieve the actual parameter values from.
+        is_post:
+            Undocumented.
+    """
+
+    __slots__ = ("id", "values", "by_reference", "is_post")
+
+    def __init__(
+        self,
+        id: str,  # pylint: disable=redefined-builtin
+        values: Iterable[Any] = (),
+        by_reference: Optional[bool] = False,
+        is_post: Optional[bool] = False,
+    ):
+        self.id = id
+        self.values = list(values)
+        self.by_reference = by_reference
+        self.is_post = is_post
+
+    @classmethod
+    def from_parameters(cls, parameters: Iterable[Parameter]) -> "PackedMultiValuedParameter":
+        """Pack parameters that share their ``id``, ``by_reference`` and ``is_post`` attributes.
+
+        Raises:
+            ValueError: If there are no parameters, or their attributes differ.
+        """
+        parameters = iter(parameters)
+        first = next(parameters, None)
+        if first is None:
+            raise ValueError("A packed parameter needs at least one value")
+        packed = cls(first.id, [first.value], first.by_reference, first.is_post)
+        for param in parameters:
+            if (param.id, param.by_reference, param.is_post) != (packed.id, packed.by_reference, packed.is_post):
+                raise ValueError(f"Parameter {param.id} can not be packed with the other values of {packed.id}")
+            packed.values.append(param.value)
+        return packed
+
+    def append(self, value: Any) -> None:
+        """Add a value."""
+        self.values.append(value)
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    @overload
+    def __getitem__(self, index: int) -> Parameter: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[Parameter]: ...
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._parameter(value) for value in self.values[index]]
+        return self._parameter(self.values[index])
+
+    def __iter__(self) -> Iterator[Parameter]:
+        return map(self._parameter, self.values)
+
+    def _parameter(self, value: Any) -> Parameter:
+        return _packed_parameter(self.id, value, self.by_reference, self.is_post)
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, PackedMultiValuedParameter):
+            return (self.id, self.values, self.by_reference, self.is_post) == (
+                other.id,
+                other.values,
+                other.by_reference,
+                other.is_post,
+            )
+        if isinstance(other, list):
+            return list(self) == other
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(id={self.id!r}, values={self.values!r}, by_reference={self.by_reference!r}, "
+            f"is_post={self.is_post!r})"
+        )
+
+    @classmethod
+    def __get_pydantic_core_schema__(cls, source: Any, handler: GetCoreSchemaHandler) -> CoreSchema:
+        # Validated and serialized as a list of parameters, so that pydantic-xml reads and writes repeated elements.
+        parameters_schema = handler.generate_schema(list[Parameter])
+        return core_schema.no_info_wrap_validator_function(
+            cls._validate,
+            parameters_schema,
+            serialization=core_schema.wrap_serializer_function_ser_schema(
+                lambda value, serialize: serialize(list(value)), schema=parameters_schema
+            ),
+        )
+
+    @classmethod
+    def _validate(cls, value: Any, validate: Any) -> "PackedMultiValuedParameter":
+        if isinstance(value, cls):
+            return value
+        return cls.from_parameters(validate(value if isinstance(value, list) else [value]))
+
 
 class Parameters(BaseXmlModel, tag="parameters", ns="uws", nsmap=NSMAP):
     """An abstract holder of UWS parameters.
 
     The input parameters to the job. For simple key/value pair parameters, there must be one model field per key, with
-    a type of either `Parameter` or `MultiValuedParameter` depending on whether it can be repeated. If the job
-    description language does not naturally have parameters, then this model should contain one element, which is the
-    content of the original POST that created the job.
+    a type of either `Parameter` or `MultiValuedParameter` (or `PackedMultiValuedParameter`) depending on whether it
+    can be repeated. If the job description language does not naturally have parameters, then this model should contain
+    one element, which is the content of the original POST that created the job.
     """
 
     def __init__(__pydantic_self__, **data) -> None:  # pylint: disable=no-self-argument
@@ -74,9 +267,12 @@ class Parameters(BaseXmlModel, tag="parameters", ns="uws", nsmap=NSMAP):
         # as the input data instead. This should cause Pydantic to associate the job parameters with the correct model
         # attributes.
         parameter_vals = []
+        packed_vals = []
         for val in data.values():
             if val is None:
                 continue
+            elif isinstance(val, PackedMultiValuedParameter):
+                packed_vals.append(val)
             elif isinstance(val, list):
                 parameter_vals.extend(v for v in val if v is not None)
             else:
@@ -87,10 +283,17 @@ class Parameters(BaseXmlModel, tag="parameters", ns="uws", nsmap=NSMAP):
         # value or list of values. If we see multiple parameters with the same id, assume the parameter may be
         # multivalued and build a list. If this assumption is incorrect, Pydantic will reject the list during input
         # validation.
+        #
+        # Parameters whose id has a declared type are built as that TypedParameter class.
+        typed_classes = _typed_parameter_classes(type(__pydantic_self__))
         remapped_vals = {}
         for param in parameter_vals:
             if isinstance(param, dict):
-                param = Parameter(**param)
+                param = typed_classes.get(param.get("id"), Parameter)(**param)
+            elif typed_classes and (typed_cls := typed_classes.get(param.id)) and type(param) is not typed_cls:
+                param = typed_cls(
+                    id=param.id, value=param.value, by_reference=param.by_reference, is_post=param.is_post
+                )
             if param.id in remapped_vals:
                 if isinstance(remapped_vals[param.id], list):
                     remapped_vals[param.id].append(param)
@@ -98,9 +301,74 @@ class Parameters(BaseXmlModel, tag="parameters", ns="uws", nsmap=NSMAP):
                     remapped_vals[param.id] = [remapped_vals[param.id], param]
             else:
                 remapped_vals[param.id] = param
+        # Packed parameters are already grouped by id, and are passed through without unpacking their values.
+        for packed in packed_vals:
+            remapped_vals[packed.id] = packed
         data = remapped_vals
         super().__init__(**data)
 
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        super().__pydantic_init_subclass__(**kwargs)
+        # pydantic-xml would parse each parameter element with the class of the field at its position, so a typed
+        # parameter would be validated against the type of whichever parameter came before it in the document. Read
+        # all of the parameters as raw values with the first field instead, to be built by id in __init__. XML field
+        # validators are only available from pydantic-xml 2.13; older versions keep the positional parsing.
+        fields = cls.model_fields.values()
+        reader = None
+        if (
+            xml_field_validator is not None
+            and _typed_parameter_classes(cls)
+            and all(_parameter_classes(field.annotation) for field in fields)
+        ):
+            reader = xml_field_validator(next(iter(cls.model_fields)))(partial(_read_parameters))
+        # Set on every subclass, so that a subclass which no longer qualifies does not inherit its parent's reader.
+        cls._xml_parameters_reader = reader
+
+
+def _parameter_classes(annotation: Any) -> tuple[type, ...]:
+    """The `Parameter` classes held by a `Parameters` field, or an empty tuple if it holds something else."""
+    args = (annotation,)
+    if typing.get_origin(annotation) in (Union, types.UnionType):
+        args = tuple(arg for arg in typing.get_args(annotation) if arg is not type(None))
+    classes = []
+    for arg in args:
+        if typing.get_origin(arg) is Annotated:
+            arg = typing.get_args(arg)[0]
+        if typing.get_origin(arg) is list:
+            arg = typing.get_args(arg)[0]
+        if arg is PackedMultiValuedParameter:
+            arg = Parameter
+        if not (isinstance(arg, type) and issubclass(arg, Parameter)):
+            return ()
+        classes.append(arg)
+    return tuple(classes)
+
+
+@lru_cache(maxsize=None)
+def _typed_parameter_classes(parameters_cls: type[Parameters]) -> dict[str, type[TypedParameter]]:
+    """Map the ids of the typed parameters of a `Parameters` class to their `TypedParameter` class."""
+    classes = {}
+    for name, field in parameters_cls.model_fields.items():
+        for param_cls in _parameter_classes(field.annotation):
+            if issubclass(param_cls, TypedParameter) and param_cls.value_type is not None:
+                classes[field.alias or name] = param_cls
+    return classes
+
+
+def _read_parameters(parameters_cls: type[Parameters], element: Any, _field_name: str) -> list[dict[str, Any]]:
+    """Read all of the parameter elements of a `Parameters` element as raw values."""
+    tag = Parameter.__xml_serializer__.element_name
+    params = []
+    while (sub_element := element.pop_element(tag, parameters_cls.__xml_search_mode__)) is not None:
+        values = {"id": sub_element.pop_attrib("id"), "value": sub_element.pop_text()}
+        if (by_reference := sub_element.pop_attrib("byReference")) is not None:
+            values["by_reference"] = by_reference
+        if (is_post := sub_element.pop_attrib("isPost")) is not None:
+            values["is_post"] = is_post
+        params.append(values)
+    return params
+
 
 class ErrorSummary(BaseXmlModel, tag="errorSummary", ns="uws", nsmap=NSMAP):
     """A short summary of an error
@@ -111,6 +379,9 @@ class ErrorSummary(BaseXmlModel, tag="errorSummary", ns="uws", nsmap=NSMAP):
         message:    (element) - A short description of the error.
         type:       (attr) - Characterization of the type of the error
         has_detail: (attr) - If true then there is a more detailed error message available at /{jobs}/{job-id}/error
+
+    The detailed error document itself can be given as ``detail`` and kept with the summary, which sets ``has_detail``
+    to match, and setting ``has_detail`` to false drops it. Like the XML document, equality only compares the summary.
     """
 
     message: str = element(default="")
@@ -118,6 +389,41 @@ class ErrorSummary(BaseXmlModel, tag="errorSummary", ns="uws", nsmap=NSMAP):
     type: ErrorType = attr(default=ErrorType.TRANSIENT)
     has_detail: bool = attr(name="hasDetail", default=False)
 
+    _detail: Optional[ErrorDetail] = PrivateAttr(default=None)
+
+    def __init__(self, detail: Optional[ErrorDetail] = None, **data: Any) -> None:
+        super().__init__(**data)
+        if detail is not None:
+            self.detail = detail
+
+    @property
+    def detail(self) -> Optional[ErrorDetail]:
+        """The detailed error document served at /{jobs}/{job-id}/error, if held with the summary.
+
+        Setting it sets ``has_detail`` to whether there is a document. It is not part of the XML document, and is not
+        kept by `vo_models.uws.archive`.
+        """
+        return self._detail
+
+    @detail.setter
+    def detail(self, value: Optional[ErrorDetail]) -> None:
+        self._detail = value
+        self.has_detail = value is not None
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name == "has_detail" and not value:
+            self._detail = None
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, ErrorSummary):
+            return super().__eq__(other)
+        return (type(self), self.__dict__, self.__pydantic_extra__) == (
+            type(other),
+            other.__dict__,
+            other.__pydantic_extra__,
+        )
+
 
 class ResultReference(BaseXmlModel, tag="result", ns="uws", skip_empty=True, nsmap=NSMAP):
     """A reference to a UWS result.
@@ -153,6 +459,157 @@ class Results(BaseXmlModel, tag="results", ns="uws", nsmap=NSMAP):
     results: Optional[list[ResultReference]] = element(name="result", default_factory=list)
 
 
+class TemplatedResults(Results):
+    """Results whose links all follow one template, held as compact ``(id, size, mime_type)`` tuples.
+
+    Create them with `from_entries`. The constructor, ``model_validate`` and ``from_xml`` take the fields of
+    `Results` as usual, giving results that are already built as models.
+
+    No `ResultReference` is created, and no ``xlink:href`` formatted, until the ``results`` attribute is first read.
+    That read builds the references and keeps them in the model, so that changes made to them are kept: from then on
+    it behaves as a plain `Results`, and `entries` is None. Serializing with pydantic (``model_dump``) or writing the
+    model itself with ``to_xml`` builds the references for the output only, but pydantic-xml reads the attribute when
+    writing a document holding the model, e.g. a `JobSummary`. The compiled serializer in
+    `vo_models.uws.serialization` writes the results straight from the tuples instead.
+    """
+
+    _href_template: str = PrivateAttr(default="{id}")
+    _template_fields: dict[str, Any] = PrivateAttr(default_factory=dict)
+    _entries: list[tuple[str, Optional[int], Optional[str]]] = PrivateAttr(default_factory=list)
+
+    @classmethod
+    def from_entries(
+        cls,
+        href_template: str,
+        entries: Iterable[tuple[str, Optional[int], Optional[str]]] = (),
+        **template_fields: Any,
+    ) -> "TemplatedResults":
+        """Create results from compact entries.
+
+        Args:
+            href_template: A `str.format` template for each result's ``xlink:href``, formatted with ``id`` (the result
+                id) and the ``template_fields``, e.g. ``"{base}/jobs/{job_id}/results/{id}"``.
+            entries: ``(id, size, mime_type)`` tuples, one per result. The size and MIME type may be None.
+            template_fields: Fields shared by every href, e.g. ``base`` and ``job_id``.
+
+        Returns:
+            TemplatedResults: The results, not yet built as models.
+        """
+        results = cls()
+        results._href_template = href_template
+        results._template_fields = template_fields
+        results._entries = list(entries)
+        # Leave the field unset, so that reading it goes through __getattr__ and builds the references.
+        del results.__dict__["results"]
+        return results
+
+    def __getattr__(self, name: str) -> Any:
+        if name == "results":
+            self.__dict__["results"] = self._references()
+            self._entries = []
+            return self.__dict__["results"]
+        return super().__getattr__(name)
+
+    def _references(self) -> list[ResultReference]:
+        """The results as references, without building them into the model."""
+        if "results" in self.__dict__:
+            return self.__dict__["results"]
+        href_template, fields = self._href_template, self._template_fields
+        return [
+            ResultReference(
+                id=result_id, href=href_template.format(id=result_id, **fields), size=size, mime_type=mime_type
+            )
+            for result_id, size, mime_type in self._entries
+        ]
+
+    @property
+    def href_template(self) -> str:
+        """The template for each result's ``xlink:href``."""
+        return self._href_template
+
+    @property
+    def template_fields(self) -> dict[str, Any]:
+        """The fields shared by every href."""
+        return self._template_fields
+
+    @property
+    def entries(self) -> Optional[list[tuple[str, Optional[int], Optional[str]]]]:
+        """The ``(id, size, mime_type)`` tuples, or None once the results have been built as models."""
+        return None if "results" in self.__dict__ else self._entries
+
+    def href(self, result_id: str) -> str:
+        """The link to a result.
+
+        Args:
+            result_id: The identifier of the result.
+
+        Returns:
+            str: The formatted ``href_template``.
+        """
+        return self._href_template.format(id=result_id, **self._template_fields)
+
+    def append(self, result_id: str, size: Optional[int] = None, mime_type: Optional[str] = None) -> None:
+        """Add a result.
+
+        Args:
+            result_id: The identifier of the result.
+            size: The size of the result in bytes.
+            mime_type: The MIME type of the result.
+        """
+        if "results" in self.__dict__:
+            self.results.append(
+                ResultReference(id=result_id, href=self.href(result_id), size=size, mime_type=mime_type)
+            )
+        else:
+            self._entries.append((result_id, size, mime_type))
+
+    def __repr_args__(self) -> Any:
+        if "results" in self.__dict__:
+            yield from super().__repr_args__()
+        else:
+            yield "href_template", self._href_template
+            yield "entries", self._entries
+
+    def _with_references(self, serialize: Callable[["TemplatedResults"], Any]) -> Any:
+        """Serialize the model with the references built for the output only."""
+        if "results" in self.__dict__:
+            return serialize(self)
+        self.__dict__["results"] = self._references()
+        try:
+            return serialize(self)
+        finally:
+            del self.__dict__["results"]
+
+    @model_serializer(mode="wrap")
+    def _serialize(self, handler: Any) -> Any:
+        # pydantic-core reads the fields from __dict__
+        return self._with_references(handler)
+
+    def to_xml_tree(self, **kwargs: Any) -> Any:
+        return self._with_references(lambda results: super(TemplatedResults, results).to_xml_tree(**kwargs))
+
+    def __copy__(self) -> "TemplatedResults":
+        copied = super().__copy__()
+        # Copies can be appended to independently
+        copied._entries = list(self._entries)  # pylint: disable=protected-access
+        if "results" in self.__dict__:
+            copied.__dict__["results"] = list(self.__dict__["results"])
+        return copied
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, TemplatedResults):
+            return super().__eq__(other)
+        # pylint: disable=protected-access
+        if type(self) is not type(other) or (self._href_template, self._template_fields) != (
+            other._href_template,
+            other._template_fields,
+        ):
+            return False
+        if "results" not in self.__dict__ and "results" not in other.__dict__:
+            return self._entries == other._entries
+        return self._references() == other._references()
+
+
 class ShortJobDescription(BaseXmlModel, tag="jobref", ns="uws", nsmap=NSMAP):
     """A short description of a job.
 
@@ -185,6 +642,19 @@ class ShortJobDescription(BaseXmlModel, tag="jobref", ns="uws", nsmap=NSMAP):
     href: Optional[str] = attr(ns="xlink", default=None)
 
 
+def _row_getter(row: Mapping[str, Any]) -> Callable[[str], Any]:
+    """Look up the columns of a row, None for missing ones. ``sqlite3.Row`` has no ``get`` method."""
+    get = getattr(row, "get", None)
+    if get is not None:
+        return get
+    keys = row.keys()
+    return lambda column: row[column] if column in keys else None
+
+
+def _row_str(value: Any) -> Optional[str]:
+    return value if value is None or isinstance(value, str) else str(value)
+
+
 class Jobs(BaseXmlModel, tag="jobs", ns="uws", nsmap=NSMAP):
     """The list of job references returned at /(jobs)
 
@@ -205,6 +675,50 @@ class Jobs(BaseXmlModel, tag="jobs", ns="uws", nsmap=NSMAP):
 
     version: Optional[UWSVersion] = attr(default=UWSVersion.V1_1)
 
+    @classmethod
+    def from_rows(cls, rows: Iterable[Mapping[str, Any]], href_template: Optional[str] = None) -> "Jobs":
+        """Build a job list from database rows, without validating each job reference individually.
+
+        Each row is a mapping (e.g. a dict or ``sqlite3.Row``) with ``job_id`` and ``phase`` columns, and optionally
+        ``run_id``, ``owner_id`` and ``creation_time``; other columns are ignored. Rows may differ in which optional
+        columns they have. Identifiers that are not strings (e.g. integer database ids) are converted to strings,
+        phases may be `ExecutionPhase` members or their values, and creation times may be datetimes (naive ones are
+        taken to be UTC) or ISO 8601 strings. To write the list, the compiled serializer in
+        `vo_models.uws.serialization` is the fastest option.
+
+        Args:
+            rows: The rows, one per job.
+            href_template: A `str.format` template for each job's ``xlink:href``, formatted with the row's columns,
+                e.g. ``"https://example.com/tap/async/{job_id}"``.
+
+        Raises:
+            ValueError: If a row has no job_id or phase, or an invalid phase or creation time.
+
+        Returns:
+            Jobs: The job list.
+        """
+        names: tuple[str, ...] = ("job_id", "phase", "run_id", "owner_id", "creation_time")
+        if href_template is not None:
+            names += ("href",)
+        build = batch_constructor(ShortJobDescription, names)
+
+        jobref = []
+        for row in rows:
+            get = _row_getter(row)
+            job_id = _row_str(get("job_id"))
+            phase = get("phase")
+            if job_id is None:
+                raise ValueError(f"Job row has no job_id: {dict(row)!r}")
+            try:
+                values = [job_id, PHASES[phase], _row_str(get("run_id")), _row_str(get("owner_id"))]
+            except KeyError as exc:
+                raise ValueError(f"Invalid phase {phase!r} for job {job_id}") from exc
+            values.append(timestamp_from_value(get("creation_time")))
+            if href_template is not None:
+                values.append(href_template.format(**row))
+            jobref.append(build(*values))
+        return construct(cls, jobref=jobref)
+
 
 class JobSummary(BaseXmlModel, Generic[ParametersType], tag="job", ns="uws", nsmap=NSMAP):
     """The complete representation of the state of a job
@@ -255,10 +769,18 @@ class JobSummary(BaseXmlModel, Generic[ParametersType], tag="job", ns="uws", nsm
 
                     Note that this attribute is actually required by the 1.1 specification - however remains optional
                     in the schema for backwards compatibility. It will be formally required in the next major revision.
+
+    Set ``enforce_phase_transitions = True`` on a subclass to reject assignments to ``phase`` that the UWS state
+    machine does not allow (see `vo_models.uws.types.can_transition`).
+
+    Specialisations such as ``JobSummary[TAPParameters]`` are built once per process and cached, so subscripting in
+    request handlers is a dictionary lookup after the first time; see `specialize`.
     """
 
     # pylint: disable = too-few-public-methods
 
+    enforce_phase_transitions: ClassVar[bool] = False
+
     job_id: str = element(tag="jobId")
     run_id: Optional[str] = element(tag="runId", default=None)
     owner_id: Optional[str] = element(tag="ownerId", default=None, nillable=True)
@@ -278,6 +800,43 @@ class JobSummary(BaseXmlModel, Generic[ParametersType], tag="job", ns="uws", nsm
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
+    @field_serializer("results", mode="wrap")
+    def _serialize_results(self, value: Optional[Results], handler: Any):
+        # The field is serialized with the schema of Results, which reads the fields of TemplatedResults from __dict__.
+        if isinstance(value, TemplatedResults):
+            return value._with_references(handler)  # pylint: disable=protected-access
+        return handler(value)
+
+    def __class_getitem__(cls, params: Any) -> Any:
+        key = (cls, params)
+        try:
+            return _SPECIALIZATIONS[key]
+        except KeyError:
+            pass
+        except TypeError:  # unhashable type arguments can't be cached
+            return super().__class_getitem__(params)
+        specialized = _SPECIALIZATIONS[key] = super().__class_getitem__(params)
+        return specialized
+
+    @classmethod
+    def specialize(cls, parameters_type: Any) -> type["JobSummary"]:
+        """The job model for a given parameters model, built on first use and cached for the life of the process.
+
+        Equivalent to ``cls[parameters_type]``, e.g. ``Job.specialize(TAPParameters)`` is ``Job[TAPParameters]``.
+
+        Args:
+            parameters_type: The `Parameters` subclass describing the job's parameters.
+
+        Returns:
+            The specialised job model class.
+        """
+        return cls[parameters_type]
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name == "phase" and self.enforce_phase_transitions:
+            value = validate_transition(self.phase, value)
+        super().__setattr__(name, value)
+
 
 class Job(JobSummary, tag="job"):
     """This is the information that is returned when a GET is made for a single job resource - i.e. /{jobs}/{job-id}"""
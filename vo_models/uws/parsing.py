@@ -0,0 +1,296 @@
+"""Fast parsing of UWS documents from trusted sources.
+
+A job runner reading back job documents that its own service wrote gains nothing from validating them again. With
+``trusted=True``, `from_xml` builds the models straight from the lxml tree using ``model_construct`` semantics: no
+validators run, timestamps are parsed directly, and `Parameters` are grouped by id without going through the model's
+constructor. Documents the trusted parser does not recognise are handed to the model's own ``from_xml``.
+
+Only use ``trusted=True`` for documents written by `vo_models` models: malformed input may produce invalid models
+rather than a `pydantic.ValidationError`.
+"""
+from functools import lru_cache
+from typing import Any, Callable, Optional, Type, TypeVar
+
+from lxml import etree
+from pydantic_xml import BaseXmlModel
+
+from vo_models.uws._construct import PHASES, construct, timestamp_from_text
+from vo_models.uws._parameters import packed_fields, parameter_field, parameters_type, value_reader
+from vo_models.uws.models import (
+    ErrorSummary,
+    Jobs,
+    JobSummary,
+    PackedMultiValuedParameter,
+    Parameter,
+    Parameters,
+    ResultReference,
+    Results,
+    ShortJobDescription,
+)
+from vo_models.uws.types import ErrorType, ExecutionPhase, UWSVersion
+from vo_models.voresource.types import UTCTimestamp
+from vo_models.xlink import XlinkType
+
+ModelT = TypeVar("ModelT", bound=BaseXmlModel)
+
+_UWS = "{http://www.ivoa.net/xml/UWS/v1.0}"
+_XLINK_TYPE = "{http://www.w3.org/1999/xlink}type"
+_XLINK_HREF = "{http://www.w3.org/1999/xlink}href"
+_XSI_NIL = "{http://www.w3.org/2001/XMLSchema-instance}nil"
+
+_RESULT_ATTRS = frozenset(("id", _XLINK_TYPE, _XLINK_HREF, "size", "mime-type"))
+
+_MESSAGE_TAG = f"{_UWS}message"
+_RESULT_TAG = f"{_UWS}result"
+_JOBREF_TAG = f"{_UWS}jobref"
+_PARAMETER_TAG = f"{_UWS}parameter"
+_PARAMETERS_TAG = f"{_UWS}parameters"
+_RESULTS_TAG = f"{_UWS}results"
+_ERROR_SUMMARY_TAG = f"{_UWS}errorSummary"
+_JOB_INFO_TAG = f"{_UWS}jobInfo"
+
+
+class _Untrusted(Exception):
+    """Raised while parsing when the document is not in the shape the trusted parser expects."""
+
+
+def _bool(value: str) -> bool:
+    return value in ("true", "1")
+
+
+def _text(elem: Any) -> Optional[str]:
+    if elem.get(_XSI_NIL) == "true":
+        return None
+    return elem.text
+
+
+def _phase(elem: Any) -> ExecutionPhase:
+    return PHASES[elem.text]
+
+
+def _int(elem: Any) -> int:
+    return int(elem.text)
+
+
+def _timestamp(elem: Any) -> Optional[UTCTimestamp]:
+    text = _text(elem)
+    if text is None:
+        return None
+    return timestamp_from_text(text)
+
+
+# Element tag -> (field name, reader) for the simple elements of a jobref and a job
+_JOBREF_FIELDS: dict[str, tuple[str, Callable[[Any], Any]]] = {
+    f"{_UWS}phase": ("phase", _phase),
+    f"{_UWS}runId": ("run_id", _text),
+    f"{_UWS}ownerId": ("owner_id", _text),
+    f"{_UWS}creationTime": ("creation_time", _timestamp),
+}
+_JOB_FIELDS: dict[str, tuple[str, Callable[[Any], Any]]] = {
+    f"{_UWS}jobId": ("job_id", _text),
+    f"{_UWS}runId": ("run_id", _text),
+    f"{_UWS}ownerId": ("owner_id", _text),
+    f"{_UWS}phase": ("phase", _phase),
+    f"{_UWS}quote": ("quote", _timestamp),
+    f"{_UWS}creationTime": ("creation_time", _timestamp),
+    f"{_UWS}startTime": ("start_time", _timestamp),
+    f"{_UWS}endTime": ("end_time", _timestamp),
+    f"{_UWS}executionDuration": ("execution_duration", _int),
+    f"{_UWS}destruction": ("destruction", _timestamp),
+}
+
+
+def _error_summary(elem: Any) -> ErrorSummary:
+    values: dict[str, Any] = {}
+    for child in elem:
+        if child.tag != _MESSAGE_TAG:
+            raise _Untrusted
+        if child.text is not None:
+            values["message"] = child.text
+    if (error_type := elem.get("type")) is not None:
+        values["type"] = ErrorType(error_type)
+    if (has_detail := elem.get("hasDetail")) is not None:
+        values["has_detail"] = _bool(has_detail)
+    return construct(ErrorSummary, **values)
+
+
+def _result_reference(elem: Any) -> ResultReference:
+    attrib = elem.attrib
+    values: dict[str, Any] = {"id": attrib["id"]}
+    if (xlink_type := attrib.get(_XLINK_TYPE)) is not None:
+        values["type"] = XlinkType(xlink_type)
+    if (href := attrib.get(_XLINK_HREF)) is not None:
+        values["href"] = href
+    if (size := attrib.get("size")) is not None:
+        values["size"] = int(size)
+    if (mime_type := attrib.get("mime-type")) is not None:
+        values["mime_type"] = mime_type
+    values["any_attrs"] = {key: value for key, value in attrib.items() if key not in _RESULT_ATTRS}
+    return construct(ResultReference, **values)
+
+
+def _results(elem: Any) -> Results:
+    results = []
+    for child in elem:
+        if child.tag != _RESULT_TAG:
+            raise _Untrusted
+        results.append(_result_reference(child))
+    return construct(Results, results=results)
+
+
+def _short_job_description(elem: Any) -> ShortJobDescription:
+    values: dict[str, Any] = {"job_id": elem.get("id")}
+    if (xlink_type := elem.get(_XLINK_TYPE)) is not None:
+        values["type"] = XlinkType(xlink_type)
+    if (href := elem.get(_XLINK_HREF)) is not None:
+        values["href"] = href
+    for child in elem:
+        name, read = _JOBREF_FIELDS[child.tag]
+        values[name] = read(child)
+    return construct(ShortJobDescription, **values)
+
+
+def _jobs(elem: Any) -> Jobs:
+    jobref = []
+    for child in elem:
+        if child.tag != _JOBREF_TAG:
+            raise _Untrusted
+        jobref.append(_short_job_description(child))
+    values: dict[str, Any] = {"jobref": jobref}
+    if (version := elem.get("version")) is not None:
+        values["version"] = UWSVersion(version)
+    return construct(Jobs, **values)
+
+
+def _parameter(elem: Any, param_cls: Type[Parameter] = Parameter) -> Parameter:
+    attrib = elem.attrib
+    value = elem.text
+    if (read := value_reader(param_cls)) is not None:
+        value = read(value)
+    values: dict[str, Any] = {"id": attrib["id"], "value": value}
+    if (by_reference := attrib.get("byReference")) is not None:
+        values["by_reference"] = _bool(by_reference)
+    if (is_post := attrib.get("isPost")) is not None:
+        values["is_post"] = _bool(is_post)
+    return construct(param_cls, **values)
+
+
+@lru_cache(maxsize=None)
+def _parameter_fields(parameters_cls: Type[Parameters]) -> Optional[dict[str, tuple[str, bool, Type[Parameter]]]]:
+    """Map parameter ids to the field holding them, whether it is multi-valued and the class of its parameters.
+
+    Returns None if the class has fields other than simple (or multi-valued) parameters.
+    """
+    fields = {}
+    for name, field in parameters_cls.model_fields.items():
+        field_kind = parameter_field(field.annotation)
+        if field_kind is None:
+            return None
+        fields[field.alias or name] = (name, *field_kind)
+    return fields
+
+
+def _parameters(elem: Any, parameters_cls: Any) -> Any:
+    fields = None
+    if isinstance(parameters_cls, type) and issubclass(parameters_cls, Parameters):
+        fields = _parameter_fields(parameters_cls)
+    if fields is None:
+        if isinstance(parameters_cls, type) and issubclass(parameters_cls, BaseXmlModel):
+            # Not made of plain parameters, e.g. the original POST content of the job. Let the model parse itself.
+            return parameters_cls.from_xml_tree(elem)
+        raise _Untrusted
+
+    values: dict[str, Any] = {}
+    for child in elem:
+        if child.tag != _PARAMETER_TAG:
+            raise _Untrusted
+        field = fields.get(child.get("id"))
+        if field is None:
+            continue
+        name, multi_valued, param_cls = field
+        param = _parameter(child, param_cls)
+        if multi_valued:
+            values.setdefault(name, []).append(param)
+        elif name in values:
+            raise _Untrusted
+        else:
+            values[name] = param
+    for name in packed_fields(parameters_cls):
+        if name in values:
+            values[name] = PackedMultiValuedParameter.from_parameters(values[name])
+    return construct(parameters_cls, **values)
+
+
+def _job_summary(elem: Any, job_cls: Type[JobSummary]) -> JobSummary:
+    values: dict[str, Any] = {}
+    job_info = []
+    for child in elem:
+        tag = child.tag
+        if tag in _JOB_FIELDS:
+            name, read = _JOB_FIELDS[tag]
+            values[name] = read(child)
+        elif tag == _PARAMETERS_TAG:
+            values["parameters"] = _parameters(child, parameters_type(job_cls))
+        elif tag == _RESULTS_TAG:
+            values["results"] = _results(child)
+        elif tag == _ERROR_SUMMARY_TAG:
+            values["error_summary"] = _error_summary(child)
+        elif tag == _JOB_INFO_TAG:
+            job_info.append(child.text)
+        else:
+            raise _Untrusted
+    if job_info:
+        values["job_info"] = job_info
+    if (version := elem.get("version")) is not None:
+        values["version"] = UWSVersion(version)
+    return construct(job_cls, **values)
+
+
+_PARSERS: dict[type, Callable[[Any, Any], BaseXmlModel]] = {
+    JobSummary: _job_summary,
+    Jobs: lambda elem, _cls: _jobs(elem),
+    Results: lambda elem, _cls: _results(elem),
+    ShortJobDescription: lambda elem, _cls: _short_job_description(elem),
+    ResultReference: lambda elem, _cls: _result_reference(elem),
+    ErrorSummary: lambda elem, _cls: _error_summary(elem),
+}
+
+
+@lru_cache(maxsize=None)
+def _trusted_parser(model_cls: Type[BaseXmlModel]) -> Optional[Callable[[Any, Any], BaseXmlModel]]:
+    """The trusted parser for a model class, or None if its fields or element differ from the standard UWS model."""
+    base = next((base for base in _PARSERS if issubclass(model_cls, base)), None)
+    if base is None or set(model_cls.model_fields) != set(base.model_fields):
+        return None
+    if model_cls.__xml_tag__ != base.__xml_tag__ or model_cls.__xml_ns__ != base.__xml_ns__:
+        return None
+    if base is not JobSummary and model_cls is not base:
+        return None
+    return _PARSERS[base]
+
+
+def from_xml(model_cls: Type[ModelT], source: str | bytes, *, trusted: bool = False) -> ModelT:
+    """Parse a UWS document.
+
+    Args:
+        model_cls: The model class to parse, e.g. ``JobSummary[MyParameters]``, `Jobs` or `Results`.
+        source: The XML document.
+        trusted: Skip validation, for documents written by `vo_models` models. Supported for `JobSummary` (including
+            its parameterized forms and `Job`), `Jobs`, `Results`, `ShortJobDescription`, `ResultReference` and
+            `ErrorSummary`; other classes, and documents that do not have the expected structure, are parsed with
+            validation.
+
+    Returns:
+        The parsed model.
+    """
+    parser = _trusted_parser(model_cls) if trusted else None
+    if parser is None:
+        return model_cls.from_xml(source)
+
+    root = etree.fromstring(source)
+    if root.tag != f"{_UWS}{model_cls.__xml_tag__}":
+        return model_cls.from_xml_tree(root)
+    try:
+        return parser(root, model_cls)
+    except (_Untrusted, KeyError, ValueError, TypeError):
+        return model_cls.from_xml_tree(root)
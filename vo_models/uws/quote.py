@@ -0,0 +1,159 @@
+"""Cached estimation of UWS job quotes.
+
+A job's ``quote`` is the time by which the service expects it to complete, and estimating it can be expensive, e.g.
+running a database ``EXPLAIN`` for a TAP query. Clients may poll the quote repeatedly, so `QuoteCache` memoises the
+result of a quote estimator per job, and only runs the estimator again once the job's parameters or phase change.
+"""
+import asyncio
+import inspect
+from collections import OrderedDict
+from datetime import datetime
+from functools import partial
+from typing import Any, Awaitable, Callable, Hashable, Optional, Union
+
+from vo_models.uws.models import JobSummary, PackedMultiValuedParameter, Parameter, Parameters
+
+QuoteEstimator = Callable[[JobSummary], Union[Optional[datetime], Awaitable[Optional[datetime]]]]
+"""A function estimating the quote of a job, or None if it can not be estimated. May be a coroutine function."""
+
+
+def _value_key(value: Any) -> Hashable:
+    # Tagged with the type, so that e.g. 1 and True differ. Spooled values are compared by identity.
+    try:
+        hash(value)
+    except TypeError:
+        return type(value), repr(value)
+    return type(value), value
+
+
+def _field_key(value: Any) -> Hashable:
+    if value is None:
+        return None
+    if isinstance(value, Parameter):
+        return value.id, _value_key(value.value), value.by_reference, value.is_post
+    if isinstance(value, PackedMultiValuedParameter):
+        return value.id, tuple(map(_value_key, value.values)), value.by_reference, value.is_post
+    if isinstance(value, list):
+        return tuple(map(_field_key, value))
+    return _value_key(value)
+
+
+def _job_key(job: JobSummary) -> Hashable:
+    # Built from the current values on every lookup, so that changes made in place are noticed too
+    parameters = job.parameters
+    if parameters is None:
+        return job.phase, None
+    if not isinstance(parameters, Parameters):
+        # Not made of plain parameters, e.g. the original POST content of the job
+        return job.phase, parameters.to_xml()
+    return job.phase, tuple(_field_key(getattr(parameters, name)) for name in type(parameters).model_fields)
+
+
+class QuoteCache:
+    """Memoised quotes from a `QuoteEstimator`, by job.
+
+    A cached quote is reused while the job's ``phase`` and parameters are unchanged, which is checked on every lookup;
+    call `invalidate` when anything else the estimator depends on changes.
+
+    Parameters:
+        estimator:
+            The function estimating the quote of a job.
+        maxsize:
+            The number of jobs to keep quotes for, the least recently used being dropped first, or None for no limit.
+    """
+
+    def __init__(self, estimator: QuoteEstimator, maxsize: Optional[int] = 10_000):
+        self.estimator = estimator
+        self.maxsize = maxsize
+        self._quotes: OrderedDict[str, tuple[Hashable, Optional[datetime]]] = OrderedDict()
+        self._pending: dict[str, tuple[Hashable, "asyncio.Future[Optional[datetime]]"]] = {}
+
+    def __len__(self) -> int:
+        """The number of cached quotes."""
+        return len(self._quotes)
+
+    def _cached(self, job: JobSummary, key: Hashable) -> tuple[bool, Optional[datetime]]:
+        entry = self._quotes.get(job.job_id)
+        if entry is None or entry[0] != key:
+            return False, None
+        self._quotes.move_to_end(job.job_id)
+        return True, entry[1]
+
+    def _store(self, job: JobSummary, key: Hashable, quote: Optional[datetime]) -> None:
+        self._quotes[job.job_id] = (key, quote)
+        self._quotes.move_to_end(job.job_id)
+        if self.maxsize is not None and len(self._quotes) > self.maxsize:
+            self._quotes.popitem(last=False)
+
+    def quote(self, job: JobSummary) -> Optional[datetime]:
+        """The quote of a job, estimating it if it is not cached.
+
+        Args:
+            job: The job.
+
+        Returns:
+            Optional[datetime]: The quote, or None if it can not be estimated.
+
+        Raises:
+            TypeError: If the estimator is a coroutine function; use `aquote` instead.
+        """
+        key = _job_key(job)
+        found, quote = self._cached(job, key)
+        if found:
+            return quote
+        quote = self.estimator(job)
+        if inspect.isawaitable(quote):
+            if inspect.iscoroutine(quote):
+                quote.close()
+            raise TypeError("The quote estimator is asynchronous; use aquote")
+        self._store(job, key, quote)
+        return quote
+
+    async def aquote(self, job: JobSummary) -> Optional[datetime]:
+        """The quote of a job, estimating it if it is not cached, with an estimator that may be asynchronous.
+
+        Concurrent calls for an unchanged job share a single estimation, which runs in its own task: cancelling one of
+        the calls does not cancel it for the others.
+
+        Args:
+            job: The job.
+
+        Returns:
+            Optional[datetime]: The quote, or None if it can not be estimated.
+        """
+        key = _job_key(job)
+        found, quote = self._cached(job, key)
+        if found:
+            return quote
+        pending = self._pending.get(job.job_id)
+        if pending is None or pending[0] != key:
+            task = asyncio.ensure_future(self._estimate(job))
+            pending = self._pending[job.job_id] = (key, task)
+            task.add_done_callback(partial(self._estimated, job, key))
+        # Cancelling a caller does not cancel the estimation shared with the others
+        return await asyncio.shield(pending[1])
+
+    async def _estimate(self, job: JobSummary) -> Optional[datetime]:
+        quote = self.estimator(job)
+        if inspect.isawaitable(quote):
+            quote = await quote
+        return quote
+
+    def _estimated(self, job: JobSummary, key: Hashable, task: "asyncio.Future[Optional[datetime]]") -> None:
+        # Retrieves the exception, in case every caller was cancelled
+        failed = task.cancelled() or task.exception() is not None
+        # Not cached if the job was invalidated or estimated again meanwhile
+        if self._pending.get(job.job_id, (None, None))[1] is not task:
+            return
+        del self._pending[job.job_id]
+        if not failed:
+            self._store(job, key, task.result())
+
+    def invalidate(self, job_id: Optional[str] = None) -> None:
+        """Forget the cached quote of a job, or of all jobs if ``job_id`` is None."""
+        if job_id is None:
+            self._quotes.clear()
+            self._pending.clear()
+        else:
+            self._quotes.pop(job_id, None)
+            self._pending.pop(job_id, None)
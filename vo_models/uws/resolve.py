@@ -0,0 +1,297 @@
+"""Resolution of by-reference UWS job parameters using asyncio.
+
+A `Parameter` with ``by_reference=True`` holds a URL to retrieve its actual value from. `ParameterResolver` fetches
+the values of all of a job's by-reference parameters concurrently, with a bound on the number of fetches in flight,
+and keeps recently fetched content in a size-bounded cache so that jobs referring to the same URLs don't fetch them
+again.
+
+Fetchers are chosen by URL scheme. By default only ``http``/``https`` URLs are fetched, with `urllib` in worker threads;
+other schemes, or other HTTP clients, can be plugged in by passing ``fetchers``. Local ``file`` URLs are only read
+through a fetcher from `file_fetcher`, restricted to one directory. Content larger than the resolver's ``max_size`` is
+rejected; the default fetchers stop reading as soon as it is exceeded.
+"""
+import asyncio
+import urllib.request
+from collections import OrderedDict
+from functools import partial
+from os import PathLike
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Mapping, Optional, TypeVar
+from urllib.parse import urlsplit
+
+from vo_models.uws.models import PackedMultiValuedParameter, Parameter, Parameters
+
+ParametersT = TypeVar("ParametersT", bound=Parameters)
+
+Fetcher = Callable[[str], Awaitable[bytes]]
+"""An async function returning the content at a URL."""
+
+_CHUNK_SIZE = 64 * 1024
+
+
+class ParameterResolutionError(Exception):
+    """Raised when the value of a by-reference parameter can not be fetched.
+
+    Parameters:
+        url:
+            The URL that could not be fetched.
+    """
+
+    def __init__(self, message: str, url: str):
+        super().__init__(message)
+        self.url = url
+
+
+def _too_large(url: str, max_size: int) -> ParameterResolutionError:
+    return ParameterResolutionError(f"Content of {url} exceeds the limit of {max_size} bytes", url)
+
+
+def file_fetcher(root: str | PathLike[str], max_size: Optional[int] = None) -> Fetcher:
+    """Create a fetcher reading local ``file`` URLs from within a directory.
+
+    ``file`` URLs are not fetched by default, as they would let job submitters read any file the service can. Pass
+    the returned fetcher for the ``file`` scheme to opt in, e.g. for files staged by the service itself.
+
+    Args:
+        root: The directory files may be read from. URLs of files outside it, including through symbolic links, are
+            rejected.
+        max_size: The largest file to read, in bytes. Unlimited by default.
+
+    Returns:
+        Fetcher: The fetcher.
+    """
+    root_path = Path(root).resolve()
+
+    async def fetch_file(url: str) -> bytes:
+        parts = urlsplit(url)
+        if parts.netloc not in ("", "localhost"):
+            raise ParameterResolutionError(f"Can not read file on remote host {parts.netloc}", url)
+        path = Path(urllib.request.url2pathname(parts.path)).resolve()
+        if not path.is_relative_to(root_path):
+            raise ParameterResolutionError(f"File is outside {root_path}", url)
+        if max_size is not None and path.stat().st_size > max_size:
+            raise _too_large(url, max_size)
+        return await asyncio.to_thread(path.read_bytes)
+
+    return fetch_file
+
+
+async def fetch_http(url: str, timeout: float = 60, max_size: Optional[int] = None) -> bytes:
+    """Fetch the content of an ``http`` or ``https`` URL with `urllib`.
+
+    Args:
+        url: The URL.
+        timeout: The timeout for connecting and each read, in seconds.
+        max_size: The largest response body to read, in bytes. The body is read in chunks, and the fetch stops as soon
+            as it is exceeded. Unlimited by default.
+
+    Raises:
+        ParameterResolutionError: If the body is larger than ``max_size``.
+
+    Returns:
+        bytes: The response body.
+    """
+
+    def fetch() -> bytes:
+        with urllib.request.urlopen(url, timeout=timeout) as response:
+            if max_size is None:
+                return response.read()
+            length = response.headers.get("Content-Length", "")
+            if length.isdigit() and int(length) > max_size:
+                raise _too_large(url, max_size)
+            chunks = []
+            size = 0
+            while chunk := response.read(_CHUNK_SIZE):
+                size += len(chunk)
+                if size > max_size:
+                    raise _too_large(url, max_size)
+                chunks.append(chunk)
+            return b"".join(chunks)
+
+    return await asyncio.to_thread(fetch)
+
+
+DEFAULT_FETCHERS: Mapping[str, Fetcher] = {"http": fetch_http, "https": fetch_http}
+
+
+class ContentCache:
+    """A least recently used cache of fetched content by URL, bounded by the total size of the content.
+
+    Parameters:
+        max_size:
+            The maximum total size of the cached content in bytes. Content larger than this is never cached.
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self.size = 0
+        self._entries: OrderedDict[str, bytes] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, url: str) -> bool:
+        return url in self._entries
+
+    def get(self, url: str) -> Optional[bytes]:
+        """The cached content for a URL, or None if it is not cached."""
+        content = self._entries.get(url)
+        if content is not None:
+            self._entries.move_to_end(url)
+        return content
+
+    def put(self, url: str, content: bytes) -> None:
+        """Cache the content for a URL, evicting the least recently used content to make room for it."""
+        if url in self._entries:
+            self.size -= len(self._entries.pop(url))
+        if len(content) > self.max_size:
+            return
+        while self.size + len(content) > self.max_size:
+            _, evicted = self._entries.popitem(last=False)
+            self.size -= len(evicted)
+        self._entries[url] = content
+        self.size += len(content)
+
+    def clear(self) -> None:
+        """Remove all cached content."""
+        self._entries.clear()
+        self.size = 0
+
+
+class ParameterResolver:
+    """Fetches the values of by-reference parameters concurrently, caching them by URL.
+
+    A resolver is meant to be shared by all jobs of a service, so that its concurrency limit and cache apply across
+    jobs. Concurrent requests for the same URL share a single fetch.
+
+    Parameters:
+        fetchers:
+            The fetcher to use for each URL scheme. Defaults to `fetch_http` for ``http`` and ``https`` URLs, as in
+            `DEFAULT_FETCHERS`, stopping once ``max_size`` is exceeded.
+        max_concurrency:
+            The maximum number of fetches in progress at once.
+        cache_size:
+            The maximum total size in bytes of the content kept in `cache`. Zero disables caching.
+        max_size:
+            The largest content to accept for one URL, in bytes, or None for no limit. Content from other fetchers is
+            checked once fetched; pass them a limit of their own (e.g. ``file_fetcher(root, max_size)``) to stop
+            reading earlier.
+    """
+
+    def __init__(
+        self,
+        fetchers: Optional[Mapping[str, Fetcher]] = None,
+        max_concurrency: int = 10,
+        cache_size: int = 64 * 1024 * 1024,
+        max_size: Optional[int] = 64 * 1024 * 1024,
+    ):
+        if fetchers is None:
+            fetch = partial(fetch_http, max_size=max_size)
+            fetchers = {"http": fetch, "https": fetch}
+        self.fetchers = dict(fetchers)
+        self.max_size = max_size
+        self.cache = ContentCache(cache_size)
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._pending: dict[str, asyncio.Future[bytes]] = {}
+
+    async def fetch(self, url: str) -> bytes:
+        """Get the content at a URL, from the cache if possible.
+
+        Args:
+            url: The URL.
+
+        Raises:
+            ParameterResolutionError: If the URL's scheme has no fetcher, the fetch failed, or the content is larger
+                than ``max_size``.
+
+        Returns:
+            bytes: The content.
+        """
+        content = self.cache.get(url)
+        if content is not None:
+            return content
+        pending = self._pending.get(url)
+        if pending is None:
+            pending = self._pending[url] = asyncio.ensure_future(self._fetch(url))
+            pending.add_done_callback(lambda _: self._pending.pop(url, None))
+        # A caller being cancelled must not cancel the fetch for the other callers waiting on it.
+        return await asyncio.shield(pending)
+
+    async def _fetch(self, url: str) -> bytes:
+        scheme = urlsplit(url).scheme.lower()
+        fetcher = self.fetchers.get(scheme)
+        if fetcher is None:
+            raise ParameterResolutionError(f"No fetcher for URL scheme {scheme!r}", url)
+        async with self._semaphore:
+            try:
+                content = await fetcher(url)
+            except ParameterResolutionError:
+                raise
+            except Exception as exc:
+                raise ParameterResolutionError(f"Failed to fetch {url}: {exc}", url) from exc
+        if self.max_size is not None and len(content) > self.max_size:
+            raise _too_large(url, self.max_size)
+        self.cache.put(url, content)
+        return content
+
+    async def resolve(self, parameters: ParametersT) -> ParametersT:
+        """Fetch the values of all by-reference parameters.
+
+        Args:
+            parameters: The job's parameters. They are not modified.
+
+        Raises:
+            ParameterResolutionError: If any value could not be fetched.
+
+        Returns:
+            A copy of the parameters, with each by-reference value replaced by the fetched content (as bytes) and
+            ``by_reference`` set to False.
+        """
+        fields = {}
+        urls: dict[str, None] = {}
+        for name in type(parameters).model_fields:
+            value = getattr(parameters, name)
+            field_urls = _reference_urls(value)
+            if field_urls:
+                fields[name] = value
+                urls.update(dict.fromkeys(field_urls))
+        if not urls:
+            return parameters
+
+        tasks = [asyncio.ensure_future(self.fetch(url)) for url in urls]
+        try:
+            contents = dict(zip(urls, await asyncio.gather(*tasks)))
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+
+        update: dict[str, Any] = {}
+        for name, value in fields.items():
+            if isinstance(value, PackedMultiValuedParameter):
+                update[name] = PackedMultiValuedParameter(
+                    value.id, [contents[_url(url)] for url in value.values], False, value.is_post
+                )
+            elif isinstance(value, list):
+                update[name] = [_resolved(param, contents) for param in value]
+            else:
+                update[name] = _resolved(value, contents)
+        return parameters.model_copy(update=update)
+
+
+def _url(value: Any) -> str:
+    return value.decode("utf-8") if isinstance(value, bytes) else str(value)
+
+
+def _reference_urls(value: Any) -> list[str]:
+    """The URLs of the by-reference parameters held by a `Parameters` field value."""
+    if isinstance(value, PackedMultiValuedParameter):
+        return [_url(url) for url in value.values] if value.by_reference else []
+    params = value if isinstance(value, list) else [value]
+    return [_url(param.value) for param in params if isinstance(param, Parameter) and param.by_reference]
+
+
+def _resolved(param: Any, contents: Mapping[str, bytes]) -> Any:
+    if not isinstance(param, Parameter) or not param.by_reference:
+        return param
+    return param.model_copy(update={"value": contents[_url(param.value)], "by_reference": False})
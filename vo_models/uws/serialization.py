@@ -0,0 +1,658 @@
+"""Compiled XML serializers for fixed-shape UWS documents.
+
+The UWS job documents always have the same element order and namespaces, so instead of building an lxml tree through
+pydantic-xml for every model, the serializers in this module precompute the tags and namespace declarations for each
+model class once, and then write the field values straight into the output. The output is byte-identical to the
+model's own ``to_xml()`` method.
+
+`JobSummaryDocument` builds on the same per-section rendering to keep a serialized job up to date as it changes.
+"""
+import math
+import re
+from enum import Enum
+from functools import lru_cache, partial
+from itertools import chain
+from typing import Any, Callable, Iterable, Iterator, Optional, Type
+
+from pydantic_xml import BaseXmlModel
+
+from vo_models.uws.models import (
+    ErrorSummary,
+    Jobs,
+    JobSummary,
+    PackedMultiValuedParameter,
+    Parameter,
+    Parameters,
+    ResultReference,
+    Results,
+    ShortJobDescription,
+    TemplatedResults,
+    TypedParameter,
+)
+from vo_models.uws.spool import SpooledValue
+from vo_models.uws.types import ExecutionPhase, UWSVersion, validate_transition
+from vo_models.voresource.types import UTCTimestamp
+from vo_models.xlink import XlinkType
+
+# Characters which lxml refuses to serialize. Models containing them are handed to pydantic-xml so that the usual
+# error is raised.
+_INVALID_XML_CHARS = re.compile("[\x00-\x08\x0b\x0c\x0e-\x1f\ud800-\udfff\ufffe\uffff]")
+_TEXT_SPECIAL_CHARS = re.compile("[&<>\r]")
+_ATTR_SPECIAL_CHARS = re.compile("[&<>\"\n\r\t]")
+
+
+class _Unsupported(Exception):
+    """Raised while rendering when a value can not be written by the compiled serializer."""
+
+
+def _format(value: Any) -> str:
+    """Convert a field value to the string pydantic-xml would write for it."""
+    if value is None:
+        return ""
+    if isinstance(value, Enum):
+        value = value.value
+    if isinstance(value, str):
+        if _INVALID_XML_CHARS.search(value):
+            raise _Unsupported
+        return str.__str__(value)
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, int):
+        return str(value)
+    if isinstance(value, UTCTimestamp):
+        return str(value)
+    if isinstance(value, float) and math.isfinite(value):
+        return repr(value)
+    if isinstance(value, bytes):
+        try:
+            return _format(value.decode("utf-8"))
+        except UnicodeDecodeError as exc:
+            raise _Unsupported from exc
+    if isinstance(value, SpooledValue):
+        return _format(value.text())
+    raise _Unsupported
+
+
+def _text(value: Any) -> str:
+    """Format and escape a value for use as element content."""
+    value = _format(value)
+    if _TEXT_SPECIAL_CHARS.search(value):
+        value = value.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;").replace("\r", "&#13;")
+    return value
+
+
+def _attr(value: Any) -> str:
+    """Format and escape a value for use as an attribute value."""
+    value = _format(value)
+    if _ATTR_SPECIAL_CHARS.search(value):
+        value = (
+            value.replace("&", "&amp;")
+            .replace("<", "&lt;")
+            .replace(">", "&gt;")
+            .replace('"', "&quot;")
+            .replace("\n", "&#10;")
+            .replace("\r", "&#13;")
+            .replace("\t", "&#9;")
+        )
+    return value
+
+
+def _nil(tag: str) -> str:
+    return f'<uws:{tag} xsi:nil="true"></uws:{tag}>'
+
+
+_OWNER_ID_NIL = _nil("ownerId")
+_QUOTE_NIL = _nil("quote")
+_START_TIME_NIL = _nil("startTime")
+_END_TIME_NIL = _nil("endTime")
+_DESTRUCTION_NIL = _nil("destruction")
+
+
+def _render_error_summary(out: list[str], model: ErrorSummary, nsdecl: str) -> None:
+    out.append(
+        f'<uws:errorSummary{nsdecl} type="{_attr(model.type)}" hasDetail="{_attr(model.has_detail)}">'
+        f"<uws:message>{_text(model.message)}</uws:message></uws:errorSummary>"
+    )
+
+
+def _render_result_reference(out: list[str], model: ResultReference, nsdecl: str) -> None:
+    if type(model) is not ResultReference or model.any_attrs is not None:  # pylint: disable=unidiomatic-typecheck
+        raise _Unsupported
+    # ResultReference is declared with skip_empty, so unset attributes are left out entirely.
+    parts = [f'<uws:result{nsdecl} id="{_attr(model.id)}"']
+    if model.type is not None:
+        parts.append(f' xlink:type="{_attr(model.type)}"')
+    if model.href is not None:
+        parts.append(f' xlink:href="{_attr(model.href)}"')
+    if model.size is not None:
+        parts.append(f' size="{_attr(model.size)}"')
+    if model.mime_type is not None:
+        parts.append(f' mime-type="{_attr(model.mime_type)}"')
+    parts.append("/>")
+    out.append("".join(parts))
+
+
+def _render_result_entries(out: list[str], model: TemplatedResults, entries: list[tuple[Any, Any, Any]]) -> None:
+    href_template, fields = model.href_template, model.template_fields
+    for result_id, size, mime_type in entries:
+        href = _attr(href_template.format(id=result_id, **fields))
+        parts = [f'<uws:result id="{_attr(result_id)}" xlink:type="simple" xlink:href="{href}"']
+        if size is not None:
+            parts.append(f' size="{_attr(size)}"')
+        if mime_type is not None:
+            parts.append(f' mime-type="{_attr(mime_type)}"')
+        parts.append("/>")
+        out.append("".join(parts))
+
+
+def _render_result_list(out: list[str], model: Results) -> None:
+    # Templated results that haven't been built as models yet are written straight from their entries.
+    if isinstance(model, TemplatedResults) and model.entries is not None:
+        _render_result_entries(out, model, model.entries)
+        return
+    for result in model.results or ():
+        _render_result_reference(out, result, "")
+
+
+def _is_templated_result(model: Results, result: ResultReference) -> bool:
+    """Whether a result can be added to templated results as an entry, without changing how it is written."""
+    return (
+        isinstance(model, TemplatedResults)
+        and model.entries is not None
+        and type(result) is ResultReference  # pylint: disable=unidiomatic-typecheck
+        and result.type is XlinkType.SIMPLE
+        and result.any_attrs is None
+        and result.href == model.href(result.id)
+    )
+
+
+def _render_results(out: list[str], model: Results, nsdecl: str) -> None:
+    start = len(out)
+    out.append(f"<uws:results{nsdecl}>")
+    _render_result_list(out, model)
+    if len(out) == start + 1:
+        out[start] = f"<uws:results{nsdecl}/>"
+    else:
+        out.append("</uws:results>")
+
+
+def _render_short_job_description(out: list[str], model: ShortJobDescription, nsdecl: str) -> None:
+    out.append(
+        f'<uws:jobref{nsdecl} id="{_attr(model.job_id)}" xlink:type="{_attr(model.type)}"'
+        f' xlink:href="{_attr(model.href)}"><uws:phase>{_text(model.phase)}</uws:phase>'
+        f"<uws:runId>{_text(model.run_id)}</uws:runId>"
+    )
+    if model.owner_id is None:
+        out.append(_OWNER_ID_NIL)
+    else:
+        out.append(f"<uws:ownerId>{_text(model.owner_id)}</uws:ownerId>")
+    out.append(f"<uws:creationTime>{_text(model.creation_time)}</uws:creationTime></uws:jobref>")
+
+
+def _render_jobs(out: list[str], model: Jobs, nsdecl: str) -> None:
+    if not model.jobref:
+        out.append(f'<uws:jobs{nsdecl} version="{_attr(model.version)}"/>')
+        return
+    out.append(f'<uws:jobs{nsdecl} version="{_attr(model.version)}">')
+    for jobref in model.jobref:
+        if type(jobref) is not ShortJobDescription:  # pylint: disable=unidiomatic-typecheck
+            raise _Unsupported
+        _render_short_job_description(out, jobref, "")
+    out.append("</uws:jobs>")
+
+
+def _render_parameter(out: list[str], param: Any) -> None:
+    # Parameters with a declared value type are written the same way
+    param_cls = type(param)
+    if param_cls is not Parameter and param_cls.__base__ is not TypedParameter:
+        raise _Unsupported
+    out.append(
+        f'<uws:parameter byReference="{_attr(param.by_reference)}" id="{_attr(param.id)}"'
+        f' isPost="{_attr(param.is_post)}">{_text(param.value)}</uws:parameter>'
+    )
+
+
+def _render_packed_parameter(out: list[str], packed: PackedMultiValuedParameter) -> None:
+    start = (
+        f'<uws:parameter byReference="{_attr(packed.by_reference)}" id="{_attr(packed.id)}"'
+        f' isPost="{_attr(packed.is_post)}">'
+    )
+    for value in packed.values:
+        out.append(f"{start}{_text(value)}</uws:parameter>")
+
+
+def _render_parameters(out: list[str], model: Any) -> None:
+    if not isinstance(model, Parameters):
+        raise _Unsupported
+    start = len(out)
+    out.append("<uws:parameters>")
+    for name in type(model).model_fields:
+        value = getattr(model, name)
+        if value is None:
+            continue
+        if isinstance(value, list):
+            for param in value:
+                _render_parameter(out, param)
+        elif isinstance(value, PackedMultiValuedParameter):
+            _render_packed_parameter(out, value)
+        else:
+            _render_parameter(out, value)
+    if len(out) == start + 1:
+        out[start] = "<uws:parameters/>"
+    else:
+        out.append("</uws:parameters>")
+
+
+def _render_timestamp(out: list[str], tag: str, value: Any, nil: Optional[str] = None) -> None:
+    if value is None and nil is not None:
+        out.append(nil)
+    else:
+        out.append(f"<uws:{tag}>{_text(value)}</uws:{tag}>")
+
+
+def _render_job_head(out: list[str], model: JobSummary, nsdecl: str) -> None:
+    out.append(
+        f'<uws:job{nsdecl} version="{_attr(model.version)}"><uws:jobId>{_text(model.job_id)}</uws:jobId>'
+        f"<uws:runId>{_text(model.run_id)}</uws:runId>"
+    )
+    if model.owner_id is None:
+        out.append(_OWNER_ID_NIL)
+    else:
+        out.append(f"<uws:ownerId>{_text(model.owner_id)}</uws:ownerId>")
+
+
+def _render_job_parameters(out: list[str], model: JobSummary, _nsdecl: str) -> None:
+    if model.parameters is not None:
+        _render_parameters(out, model.parameters)
+
+
+def _render_job_results(out: list[str], model: JobSummary, _nsdecl: str) -> None:
+    if model.results is not None:
+        if type(model.results) not in (Results, TemplatedResults):  # pylint: disable=unidiomatic-typecheck
+            raise _Unsupported
+        _render_results(out, model.results, "")
+
+
+def _render_job_error_summary(out: list[str], model: JobSummary, _nsdecl: str) -> None:
+    if model.error_summary is not None:
+        if type(model.error_summary) is not ErrorSummary:  # pylint: disable=unidiomatic-typecheck
+            raise _Unsupported
+        _render_error_summary(out, model.error_summary, "")
+
+
+def _render_job_info(out: list[str], model: JobSummary, _nsdecl: str) -> None:
+    for info in model.job_info or ():
+        out.append(f"<uws:jobInfo>{_text(info)}</uws:jobInfo>")
+
+
+# The sections of a job document in output order, with the model fields each section is rendered from. Sections are
+# rendered independently so that a cached document can re-render only the sections whose fields changed.
+_JOB_SUMMARY_SECTIONS: tuple[tuple[tuple[str, ...], Callable[[list[str], Any, str], None]], ...] = (
+    (("version", "job_id", "run_id", "owner_id"), _render_job_head),
+    (("phase",), lambda out, model, _: out.append(f"<uws:phase>{_text(model.phase)}</uws:phase>")),
+    (("quote",), lambda out, model, _: _render_timestamp(out, "quote", model.quote, _QUOTE_NIL)),
+    (("creation_time",), lambda out, model, _: _render_timestamp(out, "creationTime", model.creation_time)),
+    (("start_time",), lambda out, model, _: _render_timestamp(out, "startTime", model.start_time, _START_TIME_NIL)),
+    (("end_time",), lambda out, model, _: _render_timestamp(out, "endTime", model.end_time, _END_TIME_NIL)),
+    (
+        ("execution_duration",),
+        lambda out, model, _: out.append(
+            f"<uws:executionDuration>{_text(model.execution_duration)}</uws:executionDuration>"
+        ),
+    ),
+    (
+        ("destruction",),
+        lambda out, model, _: _render_timestamp(out, "destruction", model.destruction, _DESTRUCTION_NIL),
+    ),
+    (("parameters",), _render_job_parameters),
+    (("results",), _render_job_results),
+    (("error_summary",), _render_job_error_summary),
+    (("job_info",), _render_job_info),
+)
+
+
+def _render_job_summary(out: list[str], model: JobSummary, nsdecl: str) -> None:
+    for _, render in _JOB_SUMMARY_SECTIONS:
+        render(out, model, nsdecl)
+    out.append("</uws:job>")
+
+
+_RENDERERS: dict[type, Callable[[list[str], Any, str], None]] = {
+    ErrorSummary: _render_error_summary,
+    ResultReference: _render_result_reference,
+    Results: _render_results,
+    ShortJobDescription: _render_short_job_description,
+    Jobs: _render_jobs,
+    JobSummary: _render_job_summary,
+}
+
+
+class CompiledSerializer:
+    """A precompiled XML serializer for one UWS model class.
+
+    Use `compile_serializer` to obtain an instance, rather than creating one directly.
+
+    Parameters:
+        model_cls:
+            The model class this serializer writes.
+    """
+
+    def __init__(self, model_cls: Type[BaseXmlModel]):
+        base = next((base for base in _RENDERERS if issubclass(model_cls, base)), None)
+        if base is None or set(model_cls.model_fields) != set(base.model_fields):
+            raise TypeError(f"No compiled serializer is available for {model_cls.__name__}")
+        if model_cls.__xml_tag__ != base.__xml_tag__ or model_cls.__xml_nsmap__ != base.__xml_nsmap__:
+            raise TypeError(f"No compiled serializer is available for {model_cls.__name__}")
+
+        self.model_cls = model_cls
+        self._render = _RENDERERS[base]
+        self._nsdecl = "".join(
+            f' xmlns:{prefix}="{uri}"' if prefix else f' xmlns="{uri}"'
+            for prefix, uri in model_cls.__xml_nsmap__.items()
+        )
+
+    def serialize(self, model: BaseXmlModel, encoding: Any = None) -> bytes | str:
+        """Serialize a model to XML.
+
+        Values that the compiled serializer can not write exactly as pydantic-xml would (for example custom
+        subclasses nested inside the model) are handed off to ``model.to_xml()``.
+
+        Args:
+            model: The model to serialize. Must be an instance of this serializer's model class.
+            encoding: As for ``to_xml()``. ``None`` (ASCII bytes), ``str`` and UTF-8 are written directly.
+
+        Returns:
+            bytes | str: The serialized document.
+        """
+        if type(model) is not self.model_cls:  # pylint: disable=unidiomatic-typecheck
+            raise TypeError(f"Expected {self.model_cls.__name__}, got {type(model).__name__}")
+        if encoding is not None and encoding is not str and str(encoding).lower() not in ("utf-8", "utf8"):
+            return model.to_xml(encoding=encoding)
+
+        out: list[str] = []
+        try:
+            self._render(out, model, self._nsdecl)
+        except _Unsupported:
+            return model.to_xml() if encoding is None else model.to_xml(encoding=encoding)
+
+        document = "".join(out)
+        if encoding is str:
+            return document
+        if encoding is None:
+            return document.encode("ascii", "xmlcharrefreplace")
+        return document.encode("utf-8")
+
+
+@lru_cache(maxsize=None)
+def compile_serializer(model_cls: Type[BaseXmlModel]) -> CompiledSerializer:
+    """Get the compiled serializer for a UWS model class, compiling it on first use.
+
+    Supported classes are `JobSummary` (including its parameterized forms and `Job`), `Jobs`, `ShortJobDescription`,
+    `Results`, `ResultReference` and `ErrorSummary`.
+
+    Args:
+        model_cls: The model class.
+
+    Raises:
+        TypeError: If the class (for example a subclass adding new fields) is not supported.
+
+    Returns:
+        CompiledSerializer: The serializer for the class.
+    """
+    return CompiledSerializer(model_cls)
+
+
+def to_xml(model: BaseXmlModel, *, encoding: Any = None) -> bytes | str:
+    """Serialize a UWS model with its compiled serializer.
+
+    The output is identical to ``model.to_xml(encoding=encoding)``.
+
+    Args:
+        model: The model to serialize.
+        encoding: As for ``to_xml()``.
+
+    Returns:
+        bytes | str: The serialized document.
+    """
+    return compile_serializer(type(model)).serialize(model, encoding=encoding)
+
+
+def iter_jobs_xml(
+    jobrefs: Iterable[ShortJobDescription],
+    version: Optional[UWSVersion] = UWSVersion.V1_1,
+    *,
+    encoding: Any = None,
+    chunk_size: int = 500,
+) -> Iterator[bytes | str]:
+    """Write a job list in chunks, without building a `Jobs` model.
+
+    The chunks join to the output of ``Jobs(jobref=list(jobrefs), version=version).to_xml(encoding=encoding)``, and
+    only ``chunk_size`` job references are held in a chunk at a time, so large job lists can be streamed to a client
+    as they are read, e.g. from a `vo_models.uws.jobindex.JobIndex` or a database cursor.
+
+    Args:
+        jobrefs: The job references.
+        version: The ``version`` attribute of the job list.
+        encoding: As for ``to_xml()``: None (ASCII bytes), ``str`` or UTF-8.
+        chunk_size: The number of job references written per chunk.
+
+    Raises:
+        TypeError: If a job reference is not a `ShortJobDescription`; subclasses are not supported.
+        ValueError: If the encoding is not supported, or a job reference has values that can not be written as XML.
+
+    Yields:
+        bytes | str: The chunks of the document.
+    """
+    if encoding is None:
+        encode = partial(str.encode, encoding="ascii", errors="xmlcharrefreplace")
+    elif encoding is str:
+        encode = str
+    elif str(encoding).lower() in ("utf-8", "utf8"):
+        encode = partial(str.encode, encoding="utf-8")
+    else:
+        raise ValueError(f"Unsupported encoding {encoding!r}")
+
+    nsdecl = compile_serializer(Jobs)._nsdecl  # pylint: disable=protected-access
+    jobrefs = iter(jobrefs)
+    first = next(jobrefs, None)
+    if first is None:
+        yield encode(f'<uws:jobs{nsdecl} version="{_attr(version)}"/>')
+        return
+
+    out = [f'<uws:jobs{nsdecl} version="{_attr(version)}">']
+    for count, jobref in enumerate(chain((first,), jobrefs), 1):
+        if type(jobref) is not ShortJobDescription:  # pylint: disable=unidiomatic-typecheck
+            raise TypeError(f"Expected ShortJobDescription, got {type(jobref).__name__}")
+        try:
+            _render_short_job_description(out, jobref, "")
+        except _Unsupported as exc:
+            raise ValueError(f"Job reference {jobref.job_id!r} can not be written as XML") from exc
+        if count % chunk_size == 0:
+            yield encode("".join(out))
+            out.clear()
+    out.append("</uws:jobs>")
+    yield encode("".join(out))
+
+
+_JOB_SUMMARY_SECTION_INDEX = {
+    field: index for index, (fields, _) in enumerate(_JOB_SUMMARY_SECTIONS) for field in fields
+}
+_RESULTS_SECTION = _JOB_SUMMARY_SECTION_INDEX["results"]
+
+
+class JobSummaryDocument:
+    """A serialized `JobSummary` that is kept up to date by patching only the parts of the document that change.
+
+    Each section of the document (the phase, each timestamp, the parameters, the results...) is cached separately, so
+    updating the phase or appending a result does not re-serialize large ``parameters`` or ``job_info`` content. Every
+    change increments `revision`, which is exposed as an HTTP entity tag through `etag` for UWS 1.1 blocking requests.
+
+    Changes must be made through this document's methods rather than on the job directly; call `refresh` after
+    modifying the job by other means.
+
+    Parameters:
+        job:
+            The job to serialize. The document updates this model in place.
+        revision:
+            The starting revision, for example when restoring a document whose revision was previously published.
+    """
+
+    def __init__(self, job: JobSummary, revision: int = 0):
+        self._serializer = compile_serializer(type(job))
+        self.job = job
+        self.revision = revision
+        self._sections: list[str] = []
+        self._result_parts: Optional[list[str]] = None
+        self._fallback = False
+        self._cache: dict[Any, bytes | str] = {}
+        self._render_all()
+
+    @property
+    def etag(self) -> str:
+        """The entity tag for the current revision of the document."""
+        return f'"{self.revision}"'
+
+    def _render_section(self, index: int) -> None:
+        out: list[str] = []
+        _JOB_SUMMARY_SECTIONS[index][1](out, self.job, self._serializer._nsdecl)  # pylint: disable=protected-access
+        self._sections[index] = "".join(out)
+
+    def _render_result_parts(self) -> None:
+        self._result_parts = None
+        if self.job.results is not None:
+            self._result_parts = []
+            _render_result_list(self._result_parts, self.job.results)
+
+    def _render_all(self) -> None:
+        self._sections = [""] * len(_JOB_SUMMARY_SECTIONS)
+        self._result_parts = None
+        self._cache.clear()
+        try:
+            for index in range(len(_JOB_SUMMARY_SECTIONS)):
+                self._render_section(index)
+            self._render_result_parts()
+            self._fallback = False
+        except _Unsupported:
+            self._fallback = True
+
+    def _changed(self) -> int:
+        self._cache.clear()
+        self.revision += 1
+        return self.revision
+
+    def refresh(self) -> int:
+        """Re-render the whole document after the job was modified directly.
+
+        Returns:
+            int: The new revision.
+        """
+        self._render_all()
+        return self._changed()
+
+    def update(self, **changes: Any) -> int:
+        """Validate and apply changes to the job's fields, re-rendering only the affected sections.
+
+        Args:
+            changes: New values for the job's fields, by field name, e.g. ``phase="EXECUTING"``.
+
+        Raises:
+            pydantic.ValidationError: If a value is invalid for its field.
+            ValueError: If the job enforces phase transitions and the phase change is not allowed.
+
+        Returns:
+            int: The new revision.
+        """
+        # Validate on a shallow copy, so that the job is left untouched unless every change is valid
+        validator = type(self.job).__pydantic_validator__
+        staged = self.job.model_copy()
+        for name, value in changes.items():
+            if name == "phase" and staged.enforce_phase_transitions:
+                value = validate_transition(staged.phase, value)
+            validator.validate_assignment(staged, name, value)
+        for name in changes:
+            self.job.__dict__[name] = staged.__dict__[name]
+        self.job.__pydantic_fields_set__.update(changes)
+
+        if not self._fallback:
+            try:
+                for index in sorted({_JOB_SUMMARY_SECTION_INDEX[name] for name in changes}):
+                    self._render_section(index)
+                if "results" in changes:
+                    self._render_result_parts()
+            except _Unsupported:
+                self._fallback = True
+        return self._changed()
+
+    def set_phase(self, phase: ExecutionPhase | str) -> int:
+        """Set the job's execution phase.
+
+        Returns:
+            int: The new revision.
+        """
+        return self.update(phase=phase)
+
+    def append_result(self, result: ResultReference) -> int:
+        """Append a result to the job, rendering only the new result.
+
+        Returns:
+            int: The new revision.
+        """
+        if not isinstance(result, ResultReference):
+            result = ResultReference.model_validate(result)
+        if self.job.results is None:
+            return self.update(results=Results(results=[result]))
+        if _is_templated_result(self.job.results, result):
+            # Keep the results as compact entries rather than building every reference.
+            entry = (result.id, result.size, result.mime_type)
+            self.job.results.append(*entry)
+            return self._append_result_part(lambda out: _render_result_entries(out, self.job.results, [entry]))
+        if self.job.results.results is None:
+            self.job.results.results = []
+        self.job.results.results.append(result)
+        return self._append_result_part(lambda out: _render_result_reference(out, result, ""))
+
+    def _append_result_part(self, render: Callable[[list[str]], None]) -> int:
+        if not self._fallback and self._result_parts is not None:
+            try:
+                render(self._result_parts)
+                self._sections[_RESULTS_SECTION] = f"<uws:results>{''.join(self._result_parts)}</uws:results>"
+            except _Unsupported:
+                self._fallback = True
+        return self._changed()
+
+    def set_error_summary(self, error_summary: Optional[ErrorSummary]) -> int:
+        """Set or clear the job's error summary.
+
+        Returns:
+            int: The new revision.
+        """
+        return self.update(error_summary=error_summary)
+
+    def to_xml(self, encoding: Any = None) -> bytes | str:
+        """Get the serialized document for the current revision.
+
+        The output is identical to ``job.to_xml(encoding=encoding)``, and is cached until the next change.
+
+        Args:
+            encoding: ``None`` (ASCII bytes), ``str`` or UTF-8.
+
+        Returns:
+            bytes | str: The serialized document.
+        """
+        if encoding in self._cache:
+            return self._cache[encoding]
+
+        if self._fallback:
+            document = self.job.to_xml() if encoding is None else self.job.to_xml(encoding=encoding)
+        else:
+            text = "".join(self._sections) + "</uws:job>"
+            if encoding is None:
+                document = text.encode("ascii", "xmlcharrefreplace")
+            elif encoding is str:
+                document = text
+            elif str(encoding).lower() in ("utf-8", "utf8"):
+                document = text.encode("utf-8")
+            else:
+                document = self.job.to_xml(encoding=encoding)
+        self._cache[encoding] = document
+        return document
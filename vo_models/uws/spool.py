@@ -0,0 +1,95 @@
+"""Parameter values spooled to temporary files.
+
+Large inline parameter values, such as uploaded tables or long ADQL queries, can be parsed by
+`vo_models.uws.streaming.parse_parameters` into a `SpooledValue` rather than a string. `Parameter.value` accepts
+`SpooledValue` alongside the primitive types; it is written out as its text content.
+"""
+import shutil
+import tempfile
+from typing import IO, Any, Iterator, Optional
+
+from pydantic import GetCoreSchemaHandler
+from pydantic_core import CoreSchema, core_schema
+
+
+class ParameterSizeError(ValueError):
+    """Raised when a job's parameter values exceed the allowed size."""
+
+
+class SpooledValue:
+    """A parameter value held, UTF-8 encoded, in a temporary file.
+
+    The file is deleted when the value is closed or garbage collected. Can be used as a context manager to close it.
+
+    Parameters:
+        size:
+            The size of the encoded value in bytes.
+    """
+
+    def __init__(self, file: Optional[IO[bytes]] = None, spool_dir: Optional[str] = None):
+        if file is None:
+            file = tempfile.TemporaryFile(dir=spool_dir)  # pylint: disable=consider-using-with
+        self._file = file
+        self._file.seek(0, 2)
+        self.size = self._file.tell()
+
+    @classmethod
+    def from_text(cls, text: str, spool_dir: Optional[str] = None) -> "SpooledValue":
+        """Spool a string to a temporary file."""
+        value = cls(spool_dir=spool_dir)
+        value.write(text)
+        return value
+
+    def write(self, text: str) -> None:
+        """Append text to the value."""
+        data = text.encode("utf-8")
+        self._file.seek(0, 2)
+        self._file.write(data)
+        self.size += len(data)
+
+    def chunks(self, chunk_size: int = 1024 * 1024) -> Iterator[bytes]:
+        """Read the encoded value in chunks, without loading it all into memory.
+
+        Args:
+            chunk_size: The maximum size of each chunk in bytes.
+        """
+        self._file.seek(0)
+        while chunk := self._file.read(chunk_size):
+            yield chunk
+
+    def copy_to(self, destination: IO[bytes]) -> None:
+        """Copy the encoded value to a binary file."""
+        self._file.seek(0)
+        shutil.copyfileobj(self._file, destination)
+
+    def read(self) -> bytes:
+        """Read the whole encoded value into memory."""
+        self._file.seek(0)
+        return self._file.read()
+
+    def text(self) -> str:
+        """Read the whole value into memory as a string."""
+        return self.read().decode("utf-8")
+
+    def close(self) -> None:
+        """Delete the temporary file."""
+        self._file.close()
+
+    def __enter__(self) -> "SpooledValue":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(size={self.size})"
+
+    @classmethod
+    def __get_pydantic_core_schema__(cls, source: Any, handler: GetCoreSchemaHandler) -> CoreSchema:
+        # Accepted only as an instance, so other values are validated as before; serialized as its text.
+        return core_schema.is_instance_schema(
+            cls,
+            serialization=core_schema.plain_serializer_function_ser_schema(
+                cls.text, return_schema=core_schema.str_schema()
+            ),
+        )
@@ -0,0 +1,168 @@
+"""Streaming parsing of job parameters with large inline values.
+
+Parsing a document with the models' own ``from_xml`` builds each parameter value as a complete string in the lxml
+tree, then copies it again through validation and the regrouping done by `Parameters`. `parse_parameters` instead
+feeds the document to lxml in chunks and collects each ``<uws:parameter>`` value as its text arrives. Values above a
+threshold are spooled to a temporary file as a `SpooledValue`, so a multi-megabyte upload or ADQL query is never held
+in memory as a whole. A size limit is checked as the text arrives, so oversized jobs are rejected before the rest of
+the document has been read. libxml2's limits on untrusted documents stay in place, and the nesting depth is limited
+explicitly, as libxml2 does not check it for parser targets.
+"""
+from typing import IO, Any, Callable, Optional, Type, TypeVar
+
+from lxml import etree
+
+from vo_models.uws.models import Parameter, Parameters
+from vo_models.uws.spool import ParameterSizeError, SpooledValue
+
+ParametersT = TypeVar("ParametersT", bound=Parameters)
+
+_PARAMETER_TAG = "{http://www.ivoa.net/xml/UWS/v1.0}parameter"
+
+SizeLimit = Callable[[str, int], None]
+"""A hook called with a parameter id and the total size so far of the job's parameter values, in characters.
+
+It rejects the job by raising an exception, which is propagated by `parse_parameters`.
+"""
+
+
+def max_size(limit: int) -> SizeLimit:
+    """A size limit hook rejecting jobs whose parameter values total more than ``limit`` characters.
+
+    Raises:
+        ParameterSizeError: From the hook, once the limit is exceeded.
+    """
+
+    def check(parameter_id: str, size: int) -> None:
+        if size > limit:
+            raise ParameterSizeError(f"Parameter {parameter_id} exceeds the limit of {limit} for job parameters")
+
+    return check
+
+
+class _ParameterTarget:
+    """lxml parser target collecting the parameters of a document."""
+
+    def __init__(
+        self, spool_threshold: int, size_limit: Optional[SizeLimit], spool_dir: Optional[str], max_depth: int
+    ):
+        self.spool_threshold = spool_threshold
+        self.size_limit = size_limit
+        self.spool_dir = spool_dir
+        self.max_depth = max_depth
+        self._depth = 0
+        self.parameters: dict[str, Any] = {}
+        self.total = 0
+        self._attrib: Optional[dict[str, str]] = None
+        self._chunks: list[str] = []
+        self._length = 0
+        self._spooled: Optional[SpooledValue] = None
+
+    def start(self, tag: str, attrib: Any) -> None:
+        self._depth += 1
+        if self._depth > self.max_depth:
+            raise ParameterSizeError(f"Document is nested deeper than {self.max_depth} elements")
+        if tag == _PARAMETER_TAG:
+            self._attrib = dict(attrib)
+            self._chunks = []
+            self._length = 0
+            self._spooled = None
+
+    def data(self, text: str) -> None:
+        if self._attrib is None:
+            return
+        self.total += len(text)
+        if self.size_limit is not None:
+            self.size_limit(self._attrib.get("id", ""), self.total)
+        if self._spooled is not None:
+            self._spooled.write(text)
+            return
+        self._chunks.append(text)
+        self._length += len(text)
+        if self._length > self.spool_threshold:
+            self._spooled = SpooledValue(spool_dir=self.spool_dir)
+            for chunk in self._chunks:
+                self._spooled.write(chunk)
+            self._chunks = []
+
+    def end(self, tag: str) -> None:
+        self._depth -= 1
+        if tag != _PARAMETER_TAG or self._attrib is None:
+            return
+        attrib, self._attrib = self._attrib, None
+        if self._spooled is not None:
+            value: Any = self._spooled
+        else:
+            value = "".join(self._chunks) if self._chunks else None
+        self._chunks = []
+        param = Parameter(
+            id=attrib.get("id"),
+            value=value,
+            by_reference=attrib.get("byReference", False),
+            is_post=attrib.get("isPost", False),
+        )
+        existing = self.parameters.get(param.id)
+        if existing is None:
+            self.parameters[param.id] = param
+        elif isinstance(existing, list):
+            existing.append(param)
+        else:
+            self.parameters[param.id] = [existing, param]
+
+    def close(self) -> None:
+        pass
+
+    def discard(self) -> None:
+        """Delete the files of the values spooled so far."""
+        if self._spooled is not None:
+            self._spooled.close()
+        for value in self.parameters.values():
+            for param in value if isinstance(value, list) else [value]:
+                if isinstance(param.value, SpooledValue):
+                    param.value.close()
+
+
+def parse_parameters(
+    parameters_cls: Type[ParametersT],
+    source: bytes | IO[bytes],
+    *,
+    spool_threshold: int = 1024 * 1024,
+    size_limit: Optional[SizeLimit] = None,
+    spool_dir: Optional[str] = None,
+    chunk_size: int = 64 * 1024,
+    max_depth: int = 64,
+) -> ParametersT:
+    """Parse the parameters of a job, spooling large values to temporary files.
+
+    Args:
+        parameters_cls: The `Parameters` subclass to parse.
+        source: A ``<uws:parameters>`` or job document, as bytes or a binary file. Files are read in chunks.
+        spool_threshold: Values longer than this many characters are spooled to a file as a `SpooledValue`; shorter
+            values are strings, as with ``from_xml``.
+        size_limit: A hook checking the total size of the values as they are read, e.g. ``max_size(10_000_000)``.
+        spool_dir: The directory for the temporary files, by default the system's temporary directory.
+        chunk_size: The size of the chunks in which files are read.
+        max_depth: The deepest nesting of elements accepted, the root element being at depth 1.
+
+    Raises:
+        ParameterSizeError: If ``size_limit`` rejects the job, or the document is nested deeper than ``max_depth``.
+        pydantic.ValidationError: If the values are not valid for ``parameters_cls``. Spooled values are discarded.
+
+    Returns:
+        The parsed parameters.
+    """
+    target = _ParameterTarget(spool_threshold, size_limit, spool_dir, max_depth)
+    parser = etree.XMLParser(target=target, resolve_entities=False)
+    try:
+        if isinstance(source, (bytes, bytearray, memoryview)):
+            view = memoryview(source)
+            for start in range(0, len(view), chunk_size):
+                parser.feed(bytes(view[start : start + chunk_size]))
+        else:
+            while chunk := source.read(chunk_size):
+                parser.feed(chunk)
+        parser.close()
+        return parameters_cls(**target.parameters)
+    except BaseException:
+        target.discard()
+        raise
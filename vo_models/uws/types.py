@@ -67,3 +67,111 @@ class ExecutionPhase(str, Enum):
     resources, but must have job metadata preserved. This is an alternative that the server may choose in contrast to
     completely destroying all record of the job.
     """
+
+    @property
+    def is_terminal(self) -> bool:
+        """Whether the phase is final, i.e. the job will not run (again) without being resubmitted."""
+        return self in _TERMINAL_PHASES
+
+    @property
+    def is_active(self) -> bool:
+        """Whether the phase is one in which a UWS 1.1 blocking request (WAIT) waits for a phase change."""
+        return self in _ACTIVE_PHASES
+
+    def can_transition_to(self, phase: "ExecutionPhase | str") -> bool:
+        """Whether a job in this phase may move to the given phase."""
+        return phase in _TRANSITIONS[self]
+
+
+_TERMINAL_PHASES = frozenset(
+    {ExecutionPhase.COMPLETED, ExecutionPhase.ERROR, ExecutionPhase.ABORTED, ExecutionPhase.ARCHIVED}
+)
+_ACTIVE_PHASES = frozenset({ExecutionPhase.PENDING, ExecutionPhase.QUEUED, ExecutionPhase.EXECUTING})
+
+# Legal phase changes, following the UWS 1.1 state diagram. A job may always stay in its current phase, may be moved to
+# (and recovered from) UNKNOWN unless it has been archived, and may be archived from any phase at destruction time.
+_TRANSITIONS: dict[ExecutionPhase, frozenset[ExecutionPhase]] = {
+    phase: frozenset(targets) | {phase}
+    for phase, targets in {
+        ExecutionPhase.PENDING: {
+            ExecutionPhase.QUEUED,
+            ExecutionPhase.HELD,
+            ExecutionPhase.EXECUTING,
+            ExecutionPhase.ABORTED,
+            ExecutionPhase.ERROR,
+            ExecutionPhase.ARCHIVED,
+            ExecutionPhase.UNKNOWN,
+        },
+        ExecutionPhase.HELD: {
+            ExecutionPhase.PENDING,
+            ExecutionPhase.QUEUED,
+            ExecutionPhase.EXECUTING,
+            ExecutionPhase.ABORTED,
+            ExecutionPhase.ERROR,
+            ExecutionPhase.ARCHIVED,
+            ExecutionPhase.UNKNOWN,
+        },
+        ExecutionPhase.QUEUED: {
+            ExecutionPhase.HELD,
+            ExecutionPhase.EXECUTING,
+            ExecutionPhase.ABORTED,
+            ExecutionPhase.ERROR,
+            ExecutionPhase.ARCHIVED,
+            ExecutionPhase.UNKNOWN,
+        },
+        ExecutionPhase.EXECUTING: {
+            ExecutionPhase.SUSPENDED,
+            ExecutionPhase.COMPLETED,
+            ExecutionPhase.ABORTED,
+            ExecutionPhase.ERROR,
+            ExecutionPhase.ARCHIVED,
+            ExecutionPhase.UNKNOWN,
+        },
+        ExecutionPhase.SUSPENDED: {
+            ExecutionPhase.QUEUED,
+            ExecutionPhase.EXECUTING,
+            ExecutionPhase.ABORTED,
+            ExecutionPhase.ERROR,
+            ExecutionPhase.ARCHIVED,
+            ExecutionPhase.UNKNOWN,
+        },
+        ExecutionPhase.COMPLETED: {ExecutionPhase.ARCHIVED, ExecutionPhase.UNKNOWN},
+        ExecutionPhase.ERROR: {ExecutionPhase.ARCHIVED, ExecutionPhase.UNKNOWN},
+        ExecutionPhase.ABORTED: {ExecutionPhase.ARCHIVED, ExecutionPhase.UNKNOWN},
+        ExecutionPhase.UNKNOWN: set(ExecutionPhase),
+        ExecutionPhase.ARCHIVED: set(),
+    }.items()
+}
+
+
+def can_transition(from_phase: ExecutionPhase | str, to_phase: ExecutionPhase | str) -> bool:
+    """Whether a job may move from one execution phase to another.
+
+    Args:
+        from_phase: The current phase.
+        to_phase: The new phase.
+
+    Returns:
+        bool: True if the transition is allowed. Unrecognized phases are never allowed.
+    """
+    targets = _TRANSITIONS.get(from_phase)
+    return targets is not None and to_phase in targets
+
+
+def validate_transition(from_phase: ExecutionPhase | str, to_phase: ExecutionPhase | str) -> ExecutionPhase:
+    """Check a phase change, returning the new phase.
+
+    Args:
+        from_phase: The current phase.
+        to_phase: The new phase.
+
+    Raises:
+        ValueError: If the new phase is not a valid phase, or the transition is not allowed.
+
+    Returns:
+        ExecutionPhase: The new phase.
+    """
+    to_phase = ExecutionPhase(to_phase)
+    if not can_transition(from_phase, to_phase):
+        raise ValueError(f"Invalid phase transition from {ExecutionPhase(from_phase).value} to {to_phase.value}")
+    return to_phase
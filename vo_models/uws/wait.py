@@ -0,0 +1,159 @@
+"""Support for UWS 1.1 blocking requests (``WAIT``) using asyncio.
+
+Job runners report phase changes to a `PhaseNotifier`, and request handlers await the notifier instead of polling
+the job store. `InMemoryPhaseNotifier` serves single-process deployments; other backends (for example a database
+notification channel) can be plugged in by implementing the `PhaseNotifier` interface.
+"""
+import asyncio
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from vo_models.uws.models import JobSummary
+from vo_models.uws.types import ExecutionPhase
+
+
+class PhaseNotifier(ABC):
+    """Interface for publishing and awaiting job phase changes."""
+
+    @abstractmethod
+    async def notify(self, job_id: str, phase: ExecutionPhase | str) -> None:
+        """Record the current phase of a job, waking any requests waiting on a change.
+
+        Args:
+            job_id: The identifier of the job.
+            phase: The job's new phase.
+        """
+
+    @abstractmethod
+    async def wait(
+        self, job_id: str, phase: ExecutionPhase | str, timeout: Optional[float] = None
+    ) -> Optional[ExecutionPhase]:
+        """Wait until a job leaves the given phase.
+
+        Returns immediately if the notifier already knows the job to be in a different phase.
+
+        Args:
+            job_id: The identifier of the job.
+            phase: The phase the caller last saw the job in.
+            timeout: The maximum time to wait in seconds, or None to wait indefinitely.
+
+        Returns:
+            Optional[ExecutionPhase]: The job's phase once it changed or the timeout expired, or None if the job was
+            discarded.
+        """
+
+    async def discard(self, job_id: str) -> None:
+        """Forget a job, e.g. once it has been destroyed. Waiting requests are woken.
+
+        Args:
+            job_id: The identifier of the job.
+        """
+
+    async def notify_job(self, job: JobSummary) -> None:
+        """Record the current phase of a job model.
+
+        Args:
+            job: The job whose phase changed.
+        """
+        await self.notify(job.job_id, job.phase)
+
+
+class _Waiters:
+    """The event requests waiting on a job's phase share, and how many of them there are."""
+
+    __slots__ = ("event", "count")
+
+    def __init__(self):
+        self.event = asyncio.Event()
+        self.count = 0
+
+
+class InMemoryPhaseNotifier(PhaseNotifier):
+    """A phase notifier for job runners and request handlers sharing a single event loop.
+
+    Waiting requests cost nothing while blocked: each waits on an `asyncio.Event` that is set when the job's phase
+    changes, and which is dropped once its last request stops waiting. Waiting on a job that has not been reported on
+    does not add it to the notifier. From other threads, use ``asyncio.run_coroutine_threadsafe`` to call `notify`.
+    """
+
+    def __init__(self):
+        self._phases: dict[str, ExecutionPhase] = {}
+        self._events: dict[str, _Waiters] = {}
+
+    def phase(self, job_id: str) -> Optional[ExecutionPhase]:
+        """The last phase reported for a job, or None if the job is unknown."""
+        return self._phases.get(job_id)
+
+    def _wake(self, job_id: str) -> None:
+        waiters = self._events.pop(job_id, None)
+        if waiters is not None:
+            waiters.event.set()
+
+    async def notify(self, job_id: str, phase: ExecutionPhase | str) -> None:
+        phase = ExecutionPhase(phase)
+        if self._phases.get(job_id) is phase:
+            return
+        self._phases[job_id] = phase
+        self._wake(job_id)
+
+    async def discard(self, job_id: str) -> None:
+        self._phases.pop(job_id, None)
+        self._wake(job_id)
+
+    async def wait(
+        self, job_id: str, phase: ExecutionPhase | str, timeout: Optional[float] = None
+    ) -> Optional[ExecutionPhase]:
+        phase = ExecutionPhase(phase)
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        while True:
+            # Checked again after each wakeup, as the first report on a job may be the phase the caller saw
+            current = self._phases.get(job_id)
+            if current is not None and current != phase:
+                return current
+
+            waiters = self._events.get(job_id)
+            if waiters is None:
+                waiters = self._events[job_id] = _Waiters()
+            waiters.count += 1
+            try:
+                await asyncio.wait_for(waiters.event.wait(), None if deadline is None else deadline - loop.time())
+            except asyncio.TimeoutError:
+                # A job that no runner has reported on yet is assumed to be in the phase the caller saw.
+                return self._phases.get(job_id, phase)
+            finally:
+                waiters.count -= 1
+                if not waiters.count and self._events.get(job_id) is waiters:
+                    del self._events[job_id]
+            if job_id not in self._phases:
+                # Woken by the job being discarded
+                return None
+
+
+async def wait_for_phase_change(
+    notifier: PhaseNotifier,
+    job: JobSummary,
+    timeout: Optional[float],
+    phase: Optional[ExecutionPhase | str] = None,
+) -> Optional[ExecutionPhase]:
+    """Apply the UWS 1.1 blocking rules for a ``GET /{jobs}/{job-id}?WAIT=...&PHASE=...`` request.
+
+    The request blocks only while the job is in an active phase (see `ExecutionPhase.is_active`) and, when a ``PHASE``
+    is given, only while the job is still in that phase. The caller should re-read the job once this returns.
+
+    Args:
+        notifier: The notifier job runners report phase changes to.
+        job: The job as read by the request handler.
+        timeout: The ``WAIT`` time in seconds. ``None`` or a negative value waits indefinitely; servers should cap
+            this to their own maximum before calling.
+        phase: The value of the ``PHASE`` parameter, if any.
+
+    Returns:
+        Optional[ExecutionPhase]: The phase the job is now in, as known to the notifier, or None if the job was
+        discarded.
+    """
+    if not job.phase.is_active or (phase is not None and job.phase != phase):
+        return job.phase
+    if timeout is not None and timeout < 0:
+        timeout = None
+    return await notifier.wait(job.job_id, job.phase, timeout)
@@ -0,0 +1,134 @@
+"""Enforcement of UWS execution durations using asyncio.
+
+A job's ``executionDuration`` (0 meaning unlimited) and ``startTime`` define when it must stop executing.
+`ExecutionWatchdog` tracks the deadlines of all of a service's executing jobs in a single `ExpiryIndex`, with one
+`ExpirySweeper` task, rather than a timer per job. Jobs that overrun are aborted: their phase is set to ``ABORTED``,
+their ``endTime`` set and their ``errorSummary`` filled in, and a callback is called for the service to stop the work
+and store the job. Errors raised by the callback are logged, and do not stop the watchdog.
+"""
+import asyncio
+import inspect
+import logging
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Optional
+
+from vo_models.uws._construct import timestamp_from_value
+from vo_models.uws.expiry import Clock, Expiry, ExpiryIndex, ExpiryKind, ExpirySweeper, job_deadlines, utc_now
+from vo_models.uws.models import ErrorSummary, JobSummary
+from vo_models.uws.types import ErrorType, ExecutionPhase
+
+_logger = logging.getLogger(__name__)
+
+
+class ExecutionWatchdog:
+    """Aborts executing jobs that run past their execution duration.
+
+    Pass jobs to `watch` when they start executing, and to `unwatch` (or `watch` again) when they finish or their
+    duration changes. The watchdog keeps a reference to each watched job model and modifies it when aborting it.
+
+    Parameters:
+        on_abort:
+            Called with each job after it was aborted, e.g. to cancel its work and store it. May be a coroutine
+            function. Exceptions it raises are logged.
+        clock:
+            The function giving the current time.
+        max_interval:
+            The longest time in seconds to sleep before checking the clock again.
+        error_type:
+            The type of the error summary of aborted jobs.
+    """
+
+    def __init__(
+        self,
+        on_abort: Optional[Callable[[JobSummary], Optional[Awaitable[Any]]]] = None,
+        clock: Clock = utc_now,
+        max_interval: float = 60,
+        error_type: ErrorType = ErrorType.FATAL,
+    ):
+        self.on_abort = on_abort
+        self.clock = clock
+        self.error_type = error_type
+        self._jobs: dict[str, JobSummary] = {}
+        self._sweeper = ExpirySweeper(
+            ExpiryIndex(), self._expired, clock=clock, max_interval=max_interval, on_error=self._failed
+        )
+
+    def __len__(self) -> int:
+        """The number of watched jobs."""
+        return len(self._jobs)
+
+    def __contains__(self, job_id: str) -> bool:
+        return job_id in self._jobs
+
+    def deadline(self, job_id: str) -> Optional[datetime]:
+        """The time at which a watched job will be aborted, or None if it is not watched."""
+        return self._sweeper.index.deadlines(job_id).get(ExpiryKind.EXECUTION)
+
+    def watch(self, job: JobSummary) -> None:
+        """Watch a job, or update its deadline after it changed.
+
+        Jobs that are not ``EXECUTING``, or have no start time or an unlimited duration, are not watched.
+
+        Args:
+            job: The job.
+        """
+        deadline = job_deadlines(job).get(ExpiryKind.EXECUTION)
+        if deadline is None:
+            self.unwatch(job.job_id)
+            return
+        self._jobs[job.job_id] = job
+        self._sweeper.index.set_deadlines(job.job_id, {ExpiryKind.EXECUTION: deadline})
+        self._sweeper.wake()
+
+    def unwatch(self, job_id: str) -> None:
+        """Stop watching a job. Unknown jobs are ignored."""
+        if self._jobs.pop(job_id, None) is not None:
+            self._sweeper.index.remove(job_id)
+
+    def abort(self, job: JobSummary) -> None:
+        """Abort a job for exceeding its execution duration, without calling ``on_abort``.
+
+        Args:
+            job: The job.
+        """
+        job.phase = ExecutionPhase.ABORTED
+        # Assignments are not validated, so convert to the UTCTimestamp written with a Z
+        job.end_time = timestamp_from_value(self.clock())
+        job.error_summary = ErrorSummary(
+            message=f"Job exceeded its execution duration of {job.execution_duration} seconds",
+            type=self.error_type,
+        )
+
+    async def _expired(self, expiry: Expiry) -> None:
+        job = self._jobs.pop(expiry.job_id)
+        # The job may have changed since it was watched without being watched again
+        deadline = job_deadlines(job).get(ExpiryKind.EXECUTION)
+        if deadline is None:
+            return
+        if deadline > expiry.deadline:
+            self.watch(job)
+            return
+        self.abort(job)
+        if self.on_abort is not None:
+            result = self.on_abort(job)
+            if inspect.isawaitable(result):
+                await result
+
+    def _failed(self, expiry: Expiry, exc: Exception) -> None:
+        _logger.error("Handling the aborted job %s failed", expiry.job_id, exc_info=exc)
+
+    async def check(self) -> int:
+        """Abort the jobs that are past their deadline now.
+
+        Returns:
+            int: The number of deadlines reached.
+        """
+        return await self._sweeper.sweep()
+
+    def start(self) -> "asyncio.Task[None]":
+        """Start watching deadlines in a task on the running event loop."""
+        return self._sweeper.start()
+
+    async def stop(self) -> None:
+        """Stop the task started by `start`."""
+        await self._sweeper.stop()
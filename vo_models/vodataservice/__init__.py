@@ -1,26 +1,36 @@
 """Module containing models and resources for IVOA VODataService objects."""
-from vo_models.vodataservice.models import (
-    BaseParam,
-    DataType,
-    FKColumn,
-    ForeignKey,
-    InputParam,
-    ParamHTTP,
-    Table,
-    TableParam,
-    TableSchema,
-    TableSet,
-)
+from typing import TYPE_CHECKING
+
+from vo_models._lazy import lazy_exports
 
-__all__ = [
-    "BaseParam",
-    "DataType",
-    "FKColumn",
-    "ForeignKey",
-    "InputParam",
-    "ParamHTTP",
-    "Table",
-    "TableParam",
-    "TableSchema",
-    "TableSet",
-]
+if TYPE_CHECKING:
+    from vo_models.vodataservice.models import (
+        BaseParam,
+        DataType,
+        FKColumn,
+        ForeignKey,
+        InputParam,
+        ParamHTTP,
+        Table,
+        TableParam,
+        TableSchema,
+        TableSet,
+    )
+
+__getattr__, __dir__, __all__ = lazy_exports(
+    __name__,
+    {
+        ".models": [
+            "BaseParam",
+            "DataType",
+            "FKColumn",
+            "ForeignKey",
+            "InputParam",
+            "ParamHTTP",
+            "Table",
+            "TableParam",
+            "TableSchema",
+            "TableSet",
+        ],
+    },
+)
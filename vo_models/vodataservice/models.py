@@ -11,6 +11,7 @@ from pydantic import field_validator
 from pydantic_xml import BaseXmlModel, attr, element
 
 from vo_models.adql.misc import ADQL_SQL_KEYWORDS
+from vo_models.utils.deferred import DeferredXmlModel
 from vo_models.voresource.models import Interface
 
 # pylint: disable=no-self-argument
@@ -362,7 +363,7 @@ class InputParam(BaseParam):
 HTTPQueryType = Literal["GET", "POST"]
 
 
-class ParamHTTP(Interface):
+class ParamHTTP(Interface, DeferredXmlModel):
     """A service invoked via an HTTP Query (either Get or Post) with a set of arguments consisting of keyword
     name-value pairs.
 
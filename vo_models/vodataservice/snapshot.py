@@ -0,0 +1,268 @@
+"""Memory-mapped, read-only tableset snapshots shared between worker processes.
+
+A tableset snapshot stores each table, and each column within it, as a separately addressable record. Opening a
+snapshot maps the file into memory and parses only a small index; tables and columns are decoded on first access.
+Processes serving the same snapshot file share one copy of it through the operating system's page cache, instead of
+each holding a fully parsed `TableSet`.
+
+File layout::
+
+    magic | u32 index length | index (JSON) | table records...
+
+The index lists the schemas and, for each table, its name and the position of its record. A table record is::
+
+    u32 metadata length | table metadata (JSON, without columns) | u32 column count
+    | column count x (u64 offset, u32 length) | column records (JSON)...
+"""
+import json
+import mmap
+import struct
+from functools import cached_property
+from os import PathLike
+from typing import Iterator, Optional, Sequence, Type, overload
+
+from vo_models.utils.json_codec import from_json, to_json
+from vo_models.utils.snapshot import StaleSnapshotError, model_fingerprint
+from vo_models.vodataservice.models import Table, TableParam, TableSchema, TableSet
+
+TABLESET_SNAPSHOT_MAGIC = b"VOMTSET\x00"
+TABLESET_SNAPSHOT_FORMAT_VERSION = 1
+
+_U32 = struct.Struct("<I")
+_COLUMN_ENTRY = struct.Struct("<QI")
+
+
+def _table_record(table: Table) -> bytes:
+    columns = [to_json(column) for column in table.column or ()]
+    metadata = to_json(table.model_copy(update={"column": []}))
+    head_length = _U32.size + len(metadata) + _U32.size + _COLUMN_ENTRY.size * len(columns)
+
+    parts = [_U32.pack(len(metadata)), metadata, _U32.pack(len(columns))]
+    offset = head_length
+    for column in columns:
+        parts.append(_COLUMN_ENTRY.pack(offset, len(column)))
+        offset += len(column)
+    parts.extend(columns)
+    return b"".join(parts)
+
+
+def write_tableset_snapshot(tableset: TableSet, path: str | PathLike) -> None:
+    """Write a tableset to a snapshot file that can be opened with `TableSetSnapshot`.
+
+    Args:
+        tableset: The tableset to write, e.g. a `VOSITableSet`.
+        path: The file to write.
+    """
+    model_cls = type(tableset)
+    records = []
+    schemas = []
+    offset = 0
+    for schema in tableset.tableset_schema:
+        tables = []
+        for table in schema.table or ():
+            record = _table_record(table)
+            tables.append([table.table_name, offset, len(record)])
+            records.append(record)
+            offset += len(record)
+        schemas.append(
+            {"metadata": json.loads(to_json(schema.model_copy(update={"table": []}))), "tables": tables}
+        )
+
+    index = json.dumps(
+        {
+            "format": TABLESET_SNAPSHOT_FORMAT_VERSION,
+            "model": f"{model_cls.__module__}.{model_cls.__qualname__}",
+            "fingerprint": model_fingerprint(model_cls),
+            "schemas": schemas,
+        }
+    ).encode("utf-8")
+
+    with open(path, "wb") as f:
+        f.write(TABLESET_SNAPSHOT_MAGIC)
+        f.write(_U32.pack(len(index)))
+        f.write(index)
+        for record in records:
+            f.write(record)
+
+
+class ColumnsView(Sequence[TableParam]):
+    """The columns of a table in a snapshot, decoded individually on access."""
+
+    def __init__(self, buffer: mmap.mmap, record_start: int, entries_start: int, count: int):
+        self._buffer = buffer
+        self._record_start = record_start
+        self._entries_start = entries_start
+        self._count = count
+
+    def __len__(self) -> int:
+        return self._count
+
+    @overload
+    def __getitem__(self, index: int) -> TableParam: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[TableParam]: ...
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._count))]
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("column index out of range")
+        offset, length = _COLUMN_ENTRY.unpack_from(self._buffer, self._entries_start + index * _COLUMN_ENTRY.size)
+        start = self._record_start + offset
+        return from_json(TableParam, self._buffer[start : start + length])
+
+
+class TableView:
+    """A table in a snapshot. The table's metadata and columns are decoded on first access.
+
+    Parameters:
+        name:
+            The fully qualified name of the table.
+    """
+
+    def __init__(self, buffer: mmap.mmap, name: str, offset: int):
+        self.name = name
+        self._buffer = buffer
+        self._offset = offset
+
+    @cached_property
+    def _metadata_end(self) -> int:
+        (length,) = _U32.unpack_from(self._buffer, self._offset)
+        return self._offset + _U32.size + length
+
+    @cached_property
+    def metadata(self) -> Table:
+        """The table's metadata (name, title, description, foreign keys...), without its columns."""
+        return from_json(Table, self._buffer[self._offset + _U32.size : self._metadata_end])
+
+    @cached_property
+    def columns(self) -> ColumnsView:
+        """The table's columns."""
+        (count,) = _U32.unpack_from(self._buffer, self._metadata_end)
+        return ColumnsView(self._buffer, self._offset, self._metadata_end + _U32.size, count)
+
+    def column(self, name: str) -> Optional[TableParam]:
+        """Find a column by name, decoding columns until it is found.
+
+        Args:
+            name: The column name.
+
+        Returns:
+            Optional[TableParam]: The column, or None if the table has no such column.
+        """
+        return next((column for column in self.columns if column.column_name == name), None)
+
+    def to_model(self) -> Table:
+        """Decode the complete table, including all of its columns."""
+        return self.metadata.model_copy(update={"column": list(self.columns)})
+
+
+class SchemaView:
+    """A schema in a snapshot.
+
+    Parameters:
+        metadata:
+            The schema's metadata (name, title, description, utype), without its tables.
+        tables:
+            Views of the schema's tables.
+    """
+
+    def __init__(self, metadata: TableSchema, tables: list[TableView]):
+        self.metadata = metadata
+        self.tables = tables
+
+    @property
+    def name(self) -> str:
+        """The name of the schema."""
+        return self.metadata.schema_name
+
+    def to_model(self) -> TableSchema:
+        """Decode the complete schema, including all of its tables."""
+        return self.metadata.model_copy(update={"table": [table.to_model() for table in self.tables]})
+
+
+class TableSetSnapshot:
+    """A read-only, memory-mapped tableset snapshot written by `write_tableset_snapshot`.
+
+    Can be used as a context manager to close the underlying file mapping.
+
+    Parameters:
+        path:
+            The snapshot file.
+        model_cls:
+            The tableset class the snapshot is expected to hold, e.g. `VOSITableSet`.
+
+    Raises:
+        StaleSnapshotError: If the snapshot holds a different class, or was written by a different version of it.
+        ValueError: If the file is not a tableset snapshot.
+    """
+
+    def __init__(self, path: str | PathLike, model_cls: Type[TableSet] = TableSet):
+        self.model_cls = model_cls
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            self._read_index()
+        except Exception:
+            self.close()
+            raise
+
+    def _read_index(self) -> None:
+        magic_end = len(TABLESET_SNAPSHOT_MAGIC)
+        if len(self._mmap) < magic_end + _U32.size or self._mmap[:magic_end] != TABLESET_SNAPSHOT_MAGIC:
+            raise ValueError("Not a vo-models tableset snapshot")
+        (index_length,) = _U32.unpack_from(self._mmap, magic_end)
+        data_start = magic_end + _U32.size + index_length
+        index = json.loads(self._mmap[magic_end + _U32.size : data_start])
+
+        model_name = f"{self.model_cls.__module__}.{self.model_cls.__qualname__}"
+        if index.get("format") != TABLESET_SNAPSHOT_FORMAT_VERSION:
+            raise StaleSnapshotError(f"Unsupported tableset snapshot format {index.get('format')}")
+        if index.get("model") != model_name:
+            raise StaleSnapshotError(f"Snapshot is for {index.get('model')}, not {self.model_cls.__qualname__}")
+        if index.get("fingerprint") != model_fingerprint(self.model_cls):
+            raise StaleSnapshotError(f"Snapshot was written for a different version of {self.model_cls.__qualname__}")
+
+        self.schemas = [
+            SchemaView(
+                from_json(TableSchema, json.dumps(schema["metadata"])),
+                [TableView(self._mmap, name, data_start + offset) for name, offset, _ in schema["tables"]],
+            )
+            for schema in index["schemas"]
+        ]
+        self._tables = {table.name: table for schema in self.schemas for table in schema.tables}
+
+    def __enter__(self) -> "TableSetSnapshot":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Release the file mapping. Models already decoded from the snapshot remain usable."""
+        self._mmap.close()
+
+    def __iter__(self) -> Iterator[TableView]:
+        for schema in self.schemas:
+            yield from schema.tables
+
+    def __len__(self) -> int:
+        return len(self._tables)
+
+    def table(self, name: str) -> Optional[TableView]:
+        """Find a table by its fully qualified name.
+
+        Args:
+            name: The table name.
+
+        Returns:
+            Optional[TableView]: The table, or None if there is no such table.
+        """
+        return self._tables.get(name)
+
+    def to_model(self) -> TableSet:
+        """Decode the complete tableset."""
+        return self.model_cls(tableset_schema=[schema.to_model() for schema in self.schemas])
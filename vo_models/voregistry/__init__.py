@@ -1,14 +1,16 @@
 """IVOA VORegistry-v1.1 pydantic-xml models"""
+from typing import TYPE_CHECKING
 
-from vo_models.voregistry.models import OAIHTTP, OAISOAP, Harvest, Registry, Search
-from vo_models.voregistry.types import ExtensionSearchSupport, OptionalProtocol
+from vo_models._lazy import lazy_exports
 
-__all__ = [
-    "ExtensionSearchSupport",
-    "OptionalProtocol",
-    "Registry",
-    "Harvest",
-    "Search",
-    "OAIHTTP",
-    "OAISOAP",
-]
+if TYPE_CHECKING:
+    from vo_models.voregistry.models import OAIHTTP, OAISOAP, Harvest, Registry, Search
+    from vo_models.voregistry.types import ExtensionSearchSupport, OptionalProtocol
+
+__getattr__, __dir__, __all__ = lazy_exports(
+    __name__,
+    {
+        ".models": ["Registry", "Harvest", "Search", "OAIHTTP", "OAISOAP"],
+        ".types": ["ExtensionSearchSupport", "OptionalProtocol"],
+    },
+)
@@ -6,6 +6,7 @@ from pydantic_xml import attr, element
 
 import vo_models.vodataservice as vs
 import vo_models.voresource as vr
+from vo_models.utils.deferred import DeferredXmlModel
 from vo_models.voregistry.types import ExtensionSearchSupport, OptionalProtocol
 
 NSMAP = {
@@ -17,19 +18,19 @@ NSMAP = {
 }
 
 
-class OAIHTTP(vr.Interface, nsmap=NSMAP):
+class OAIHTTP(vr.Interface, DeferredXmlModel, nsmap=NSMAP):
     """A description of the standard OAI PMH interface using HTTP (GET or POST) queries."""
 
     type: Literal["vg:OAIHTTP"] = attr(ns="xsi", default="vg:OAIHTTP")
 
 
-class OAISOAP(vr.WebService, nsmap=NSMAP):
+class OAISOAP(vr.WebService, DeferredXmlModel, nsmap=NSMAP):
     """A description of the standard OAI PMH interface using a SOAP Web Service interface."""
 
     type: Literal["vg:OAISOAP"] = attr(ns="xsi", default="vg:OAISOAP")
 
 
-class Registry(vr.Service, tag="Resource", nsmap=NSMAP, ns="ri"):
+class Registry(vr.Service, DeferredXmlModel, tag="Resource", nsmap=NSMAP, ns="ri"):
     """A service that provides access to descriptions of resources.
 
     Parameters:
@@ -49,7 +50,7 @@ class Registry(vr.Service, tag="Resource", nsmap=NSMAP, ns="ri"):
     tableset: Optional[vs.TableSet] = element(tag="tableset", default=None, ns="", nsmap={"": ""})
 
 
-class Harvest(vr.Capability, nsmap=NSMAP):
+class Harvest(vr.Capability, DeferredXmlModel, nsmap=NSMAP):
     """The capabilities of the Registry Harvest implementation.
 
     Parameters:
@@ -66,7 +67,7 @@ class Harvest(vr.Capability, nsmap=NSMAP):
     standard_id: Literal["ivo://ivoa.net/std/Registry"] = attr(name="standardID", default="ivo://ivoa.net/std/Registry")
 
 
-class Search(vr.Capability, nsmap=NSMAP):
+class Search(vr.Capability, DeferredXmlModel, nsmap=NSMAP):
     """The capabilities of the Registry Search implementation.
 
     Parameters:
@@ -90,7 +91,7 @@ class Search(vr.Capability, nsmap=NSMAP):
     optional_protocol: Optional[list[OptionalProtocol]] = element(tag="optionalProtocol", default=[])
 
 
-class Authority(vr.Resource, tag="Resource", nsmap=NSMAP, ns="ri"):
+class Authority(vr.Resource, DeferredXmlModel, tag="Resource", nsmap=NSMAP, ns="ri"):
     """A naming authority; an assertion of control over a namespace represented by an authority identifier.
 
     type:
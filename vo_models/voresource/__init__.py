@@ -1,61 +1,65 @@
 """IVOA VOResource v1.1 pydantic-xml models"""
+from typing import TYPE_CHECKING
 
-from vo_models.voresource.models import (
-    AccessURL,
-    Capability,
-    Contact,
-    Content,
-    Creator,
-    Curation,
-    Date,
-    Interface,
-    MirrorURL,
-    Organisation,
-    Relationship,
-    Resource,
-    ResourceName,
-    Rights,
-    SecurityMethod,
-    Service,
-    Source,
-    Validation,
-    WebBrowser,
-    WebService,
-)
-from vo_models.voresource.types import (
-    AuthorityID,
-    IdentifierURI,
-    ResourceKey,
-    UTCDateTime,
-    UTCTimestamp,
-    ValidationLevel,
-)
+from vo_models._lazy import lazy_exports
 
-__all__ = [
-    "AccessURL",
-    "AuthorityID",
-    "Capability",
-    "Contact",
-    "Content",
-    "Creator",
-    "Curation",
-    "Date",
-    "IdentifierURI",
-    "Interface",
-    "MirrorURL",
-    "Organisation",
-    "Relationship",
-    "Resource",
-    "ResourceKey",
-    "ResourceName",
-    "Rights",
-    "SecurityMethod",
-    "Service",
-    "Source",
-    "UTCDateTime",
-    "UTCTimestamp",
-    "Validation",
-    "ValidationLevel",
-    "WebBrowser",
-    "WebService",
-]
+if TYPE_CHECKING:
+    from vo_models.voresource.models import (
+        AccessURL,
+        Capability,
+        Contact,
+        Content,
+        Creator,
+        Curation,
+        Date,
+        Interface,
+        MirrorURL,
+        Organisation,
+        Relationship,
+        Resource,
+        ResourceName,
+        Rights,
+        SecurityMethod,
+        Service,
+        Source,
+        Validation,
+        WebBrowser,
+        WebService,
+    )
+    from vo_models.voresource.types import (
+        AuthorityID,
+        IdentifierURI,
+        ResourceKey,
+        UTCDateTime,
+        UTCTimestamp,
+        ValidationLevel,
+    )
+
+__getattr__, __dir__, __all__ = lazy_exports(
+    __name__,
+    {
+        ".models": [
+            "AccessURL",
+            "Capability",
+            "Contact",
+            "Content",
+            "Creator",
+            "Curation",
+            "Date",
+            "Interface",
+            "MirrorURL",
+            "Organisation",
+            "Relationship",
+            "Resource",
+            "ResourceName",
+            "Rights",
+            "SecurityMethod",
+            "Service",
+            "Source",
+            "Validation",
+            "WebBrowser",
+            "WebService",
+        ],
+        ".types": ["AuthorityID", "IdentifierURI", "ResourceKey", "UTCDateTime", "UTCTimestamp", "ValidationLevel"],
+    },
+)
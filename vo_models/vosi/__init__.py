@@ -1 +1,4 @@
 """Module containing VOSI (VO Service Interface) classes."""
+from vo_models._lazy import lazy_exports
+
+__getattr__, __dir__, _ = lazy_exports(__name__, submodules=["availability", "capabilities", "tables"])
@@ -1,4 +1,14 @@
 """Module containing VOSI Availability resources"""
-from vo_models.vosi.availability.models import Availability
+from typing import TYPE_CHECKING
 
-__all__ = ["Availability"]
+from vo_models._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from vo_models.vosi.availability.models import Availability
+
+__getattr__, __dir__, __all__ = lazy_exports(
+    __name__,
+    {
+        ".models": ["Availability"],
+    },
+)
@@ -1,7 +1,16 @@
 """Module containing VOSI Capabilities classes."""
+from typing import TYPE_CHECKING
 
-from vo_models.vosi.capabilities.models import (
-    VOSICapabilities,
-)
+from vo_models._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from vo_models.vosi.capabilities.models import (
+        VOSICapabilities,
+    )
 
-__all__ = ["VOSICapabilities"]
+__getattr__, __dir__, __all__ = lazy_exports(
+    __name__,
+    {
+        ".models": ["VOSICapabilities"],
+    },
+)
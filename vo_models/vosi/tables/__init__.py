@@ -1,5 +1,15 @@
 """Module containing models for VOSI Tables objects.
 """
-from vo_models.vosi.tables.models import VOSITable, VOSITableSet
+from typing import TYPE_CHECKING
 
-__all__ = ["VOSITable", "VOSITableSet"]
+from vo_models._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from vo_models.vosi.tables.models import VOSITable, VOSITableSet
+
+__getattr__, __dir__, __all__ = lazy_exports(
+    __name__,
+    {
+        ".models": ["VOSITable", "VOSITableSet"],
+    },
+)
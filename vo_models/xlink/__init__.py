@@ -2,6 +2,16 @@
 See: https://www.w3.org/TR/xlink11/
 
 Note: Only implements the simple type TypeValue, used in UWS Job models."""
-from vo_models.xlink.xlink import XlinkType
+from typing import TYPE_CHECKING
 
-__all__ = ["XlinkType"]
+from vo_models._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from vo_models.xlink.xlink import XlinkType
+
+__getattr__, __dir__, __all__ = lazy_exports(
+    __name__,
+    {
+        ".xlink": ["XlinkType"],
+    },
+)